@@ -5,6 +5,36 @@
 extern "C" {
 #endif
 
+/*
+ * SIMD kernel availability.
+ *
+ * With GCC/Clang on x86 every kernel carries a per-function target attribute,
+ * so a portable build (no -mavx2/-march) still contains the SSE4.2, AVX2 and
+ * AVX-512 code paths and callers select one at runtime via cpu_has_feature().
+ * Other compilers only get the kernels the translation unit is built for.
+ */
+#if (defined(__GNUC__) || defined(__clang__)) && (defined(__x86_64__) || defined(__i386__))
+#  define GV_SIMD_TARGET_SSE42  __attribute__((target("sse4.2")))
+#  define GV_SIMD_TARGET_AVX2   __attribute__((target("avx2,fma")))
+#  define GV_SIMD_TARGET_AVX512 __attribute__((target("avx512f,avx2,fma")))
+#  define GV_HAVE_SSE42_KERNELS  1
+#  define GV_HAVE_AVX2_KERNELS   1
+#  define GV_HAVE_AVX512_KERNELS 1
+#else
+#  define GV_SIMD_TARGET_SSE42
+#  define GV_SIMD_TARGET_AVX2
+#  define GV_SIMD_TARGET_AVX512
+#  ifdef __SSE4_2__
+#    define GV_HAVE_SSE42_KERNELS 1
+#  endif
+#  ifdef __AVX2__
+#    define GV_HAVE_AVX2_KERNELS 1
+#  endif
+#  ifdef __AVX512F__
+#    define GV_HAVE_AVX512_KERNELS 1
+#  endif
+#endif
+
 /**
  * @brief CPU feature flags for SIMD support.
  */
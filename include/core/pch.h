@@ -0,0 +1,17 @@
+#ifndef GIGAVECTOR_GV_PCH_H
+#define GIGAVECTOR_GV_PCH_H
+
+/*
+ * Precompiled header for `make USE_PCH=1`. Internal build aid, not part of the
+ * public API: it only bundles the system headers most translation units
+ * include, so they are parsed once per build instead of once per file.
+ */
+#include <math.h>
+#include <pthread.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#endif
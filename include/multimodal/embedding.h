@@ -142,6 +142,22 @@ int embedding_cache_put(GV_EmbeddingCache *cache,
                            size_t embedding_dim,
                            const float *embedding);
 
+/**
+ * @brief Store a batch of embeddings in cache.
+ *
+ * @param cache Cache instance.
+ * @param texts Array of @p count text keys.
+ * @param count Number of entries.
+ * @param embedding_dim Dimension shared by all embeddings.
+ * @param embeddings Contiguous embeddings, count * embedding_dim floats (copied).
+ * @return 0 on success, negative on error (entries before the failing one stay stored).
+ */
+int embedding_cache_put_batch(GV_EmbeddingCache *cache,
+                                 const char *const *texts,
+                                 size_t count,
+                                 size_t embedding_dim,
+                                 const float *embeddings);
+
 /**
  * @brief Clear embedding cache.
  * 
@@ -68,6 +68,7 @@ typedef struct {
     int cache_write_5m_tokens;        /**< Anthropic 5-minute TTL cache writes. */
     int cache_write_1h_tokens;        /**< Anthropic 1-hour TTL cache writes. */
     int token_count;                  /**< Total tokens used. */
+    size_t content_length;            /**< Length of content in bytes, excluding the NUL. */
 } GV_LLMResponse;
 
 typedef struct GV_LLM GV_LLM;
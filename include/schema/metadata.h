@@ -54,6 +54,24 @@ void vector_clear_metadata(GV_Vector *vector);
  */
 GV_Metadata *metadata_from_keys_values(const char **keys, const char **values, size_t count);
 
+/**
+ * @brief Serialize a metadata list into a flat buffer.
+ *
+ * Each entry is written as "key\0value\0" in list order; NULL keys or
+ * values are written as empty strings. @p written always receives the
+ * number of bytes the full list needs, so a caller whose buffer was too
+ * small can retry with that size.
+ *
+ * @param meta Metadata list to serialize; NULL yields zero entries.
+ * @param out Destination buffer; may be NULL when @p out_cap is 0.
+ * @param out_cap Capacity of @p out in bytes.
+ * @param written Output: bytes required for the whole list; must be non-NULL.
+ * @param count Output: number of entries; may be NULL.
+ * @return 0 on success, 1 if @p out_cap was too small, -1 on invalid arguments.
+ */
+int metadata_flatten(const GV_Metadata *meta, char *out, size_t out_cap,
+                     size_t *written, size_t *count);
+
 /**
  * @brief Free a metadata linked list.
  *
@@ -601,6 +601,25 @@ int db_search_filtered(const GV_Database *db, const float *query_data, size_t k,
  */
 void gv_search_results_free(GV_SearchResult *results, size_t count);
 
+/**
+ * @brief Pack dense search hits into caller-provided contiguous arrays.
+ *
+ * Walks @p results in order and copies each dense hit whose vector has
+ * @p dimension elements: its id, its distance, and its vector data as one
+ * row of @p out_vectors. Sparse hits, NULL vectors and vectors of another
+ * dimension are skipped, so the packed rows may be fewer than @p count.
+ *
+ * @param results Array of search results; may be NULL when @p count is 0.
+ * @param count Number of entries in @p results.
+ * @param dimension Expected vector dimension.
+ * @param out_ids Output: at least @p count ids.
+ * @param out_distances Output: at least @p count distances.
+ * @param out_vectors Output: at least @p count * @p dimension floats.
+ * @return Number of hits packed.
+ */
+size_t db_search_results_pack(const GV_SearchResult *results, size_t count, size_t dimension,
+                              uint64_t *out_ids, float *out_distances, float *out_vectors);
+
 /**
  * @brief Range search: find all vectors within a distance threshold.
  *
@@ -667,12 +686,31 @@ int db_search_ivfpq_opts(const GV_Database *db, const float *query_data, size_t
  */
 int db_add_vectors(GV_Database *db, const float *data, size_t count, size_t dimension);
 
+/**
+ * @brief Batch-insert vectors supplied as 8-bit scalar-quantized codes.
+ *
+ * The codes are decoded with scalar_quant_sq8_decode() in bounded chunks
+ * and inserted through db_add_vectors(), so callers can stream a quarter
+ * of the float32 bytes into the library.
+ *
+ * @param db Target database; must be non-NULL.
+ * @param codes Contiguous codes of size count * dimension.
+ * @param count Number of vectors.
+ * @param dimension Vector dimensionality (must match db->dimension).
+ * @param vmin Per-dimension minimums (dimension floats).
+ * @param vdelta Per-dimension steps (dimension floats).
+ * @return 0 on success, -1 on error (no partial rollback).
+ */
+int db_add_vectors_sq8(GV_Database *db, const uint8_t *codes, size_t count, size_t dimension,
+                       const float *vmin, const float *vdelta);
+
 /**
  * @brief Batch-insert vectors with optional metadata (one key/value per vector).
  *
  * @param db Target database; must be non-NULL.
  * @param data Contiguous floats of size count * dimension.
- * @param keys Optional array of metadata keys (can be NULL).
+ * @param keys Optional array of metadata keys (can be NULL). A NULL entry
+ *             inserts that vector without metadata.
  * @param values Optional array of metadata values (can be NULL if keys is NULL).
  * @param count Number of vectors.
  * @param dimension Vector dimensionality (must match db->dimension).
@@ -741,6 +779,37 @@ void db_set_exact_search_threshold(GV_Database *db, size_t threshold);
  */
 void db_set_force_exact_search(GV_Database *db, int enabled);
 
+/**
+ * @brief Add a sparse vector whose values are 8-bit quantized.
+ *
+ * Each value is decoded as codes[i] * scale and the vector is inserted
+ * through db_add_sparse_vector(); the index itself stores float values.
+ *
+ * @param db Target database; must be GV_INDEX_TYPE_SPARSE.
+ * @param indices Dimension indices array of length nnz.
+ * @param codes Quantized values array of length nnz.
+ * @param scale Dequantization step.
+ * @param nnz Number of non-zero entries.
+ * @param dimension Vector dimension; must match db->dimension.
+ * @param metadata_key Optional metadata key; NULL to skip.
+ * @param metadata_value Optional metadata value; NULL if key is NULL.
+ * @return 0 on success, -1 on error.
+ */
+int db_add_sparse_vector_i8(GV_Database *db, const uint32_t *indices, const int8_t *codes,
+                            float scale, size_t nnz, size_t dimension,
+                            const char *metadata_key, const char *metadata_value);
+
+/**
+ * @brief Search the sparse index with an 8-bit quantized query.
+ *
+ * Decodes codes[i] * scale and runs db_search_sparse().
+ *
+ * @return Number of results (0..k) or -1 on error.
+ */
+int db_search_sparse_i8(const GV_Database *db, const uint32_t *indices, const int8_t *codes,
+                        float scale, size_t nnz, size_t k, GV_SearchResult *results,
+                        GV_DistanceType distance_type);
+
 /**
  * @brief Search sparse index with a sparse query.
  *
@@ -828,6 +897,37 @@ void db_stop_background_compaction(GV_Database *db);
  */
 int db_compact(GV_Database *db);
 
+/** Bits of GV_DBTuning::fields selecting which tunables db_configure() applies. */
+#define GV_DB_TUNE_EXACT_SEARCH_THRESHOLD   (1u << 0)
+#define GV_DB_TUNE_FORCE_EXACT_SEARCH       (1u << 1)
+#define GV_DB_TUNE_COSINE_NORMALIZED        (1u << 2)
+#define GV_DB_TUNE_COMPACTION_INTERVAL      (1u << 3)
+#define GV_DB_TUNE_WAL_COMPACTION_THRESHOLD (1u << 4)
+#define GV_DB_TUNE_DELETED_RATIO_THRESHOLD  (1u << 5)
+
+typedef struct {
+    uint32_t fields;                 /**< GV_DB_TUNE_* bits of the fields to apply. */
+    size_t exact_search_threshold;   /**< See db_set_exact_search_threshold(). */
+    int force_exact_search;          /**< See db_set_force_exact_search(). */
+    int cosine_normalized;           /**< See db_set_cosine_normalized(). */
+    size_t compaction_interval_sec;  /**< See db_set_compaction_interval(). */
+    size_t wal_compaction_threshold; /**< See db_set_wal_compaction_threshold(). */
+    double deleted_ratio_threshold;  /**< See db_set_deleted_ratio_threshold(); clamped to [0, 1]. */
+} GV_DBTuning;
+
+/**
+ * @brief Apply several database tunables in one call.
+ *
+ * Only the fields flagged in @p tuning->fields are written. All of them are
+ * applied under the compaction mutex, and the compaction thread is woken
+ * once if its interval changed.
+ *
+ * @param db Database instance; must be non-NULL.
+ * @param tuning Tunables to apply; must be non-NULL.
+ * @return 0 on success, -1 on invalid arguments.
+ */
+int db_configure(GV_Database *db, const GV_DBTuning *tuning);
+
 /**
  * @brief Set compaction interval in seconds.
  *
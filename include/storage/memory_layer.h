@@ -176,6 +176,26 @@ char *memory_add_opts(GV_MemoryLayer *layer, const char *content,
                           const float *embedding, GV_MemoryMetadata *metadata,
                           size_t *out_vector_index, int ingest_context);
 
+/**
+ * @brief Add several memories in one call.
+ *
+ * Memories are added in order with memory_add_opts(); the first failure
+ * stops the batch.
+ *
+ * @param layer Memory layer; must be non-NULL.
+ * @param contents Array of @p count content strings; must be non-NULL.
+ * @param count Number of memories; must be non-zero.
+ * @param embeddings Row-major embeddings, @p count times the database dimension.
+ * @param metadatas Optional array of @p count metadata pointers (entries may be NULL); can be NULL.
+ * @param ingest_context As for memory_add_opts().
+ * @param added_count Output: number of memories added before any failure.
+ * @return Array of the added memory IDs (free with memory_free_ids()), or NULL
+ *         on invalid arguments or allocation failure.
+ */
+char **memory_add_many(GV_MemoryLayer *layer, const char *const *contents, size_t count,
+                       const float *embeddings, GV_MemoryMetadata *const *metadatas,
+                       int ingest_context, size_t *added_count);
+
 /**
  * @brief Extract memories from conversation text.
  *
@@ -208,6 +228,44 @@ char **memory_extract_from_text(GV_MemoryLayer *layer,
                                     float **embeddings,
                                     size_t *memory_count);
 
+/**
+ * @brief Free a memory ID array returned by memory_extract_from_conversation()
+ *        or memory_extract_from_text().
+ *
+ * @param memory_ids Memory ID array; safe to call with NULL.
+ * @param count Number of IDs.
+ */
+void memory_free_ids(char **memory_ids, size_t count);
+
+/**
+ * @brief Join a memory ID array into one NUL-separated buffer and free the array.
+ *
+ * Takes ownership of @p memory_ids, which is freed as by memory_free_ids()
+ * whether or not packing succeeds. NULL entries are skipped.
+ *
+ * @param memory_ids Memory ID array; can be NULL when @p count is 0.
+ * @param count Number of IDs.
+ * @param out_size Output: buffer length in bytes, excluding the final NUL.
+ * @return Allocated buffer (caller frees; empty when there are no IDs), or
+ *         NULL on invalid arguments or allocation failure.
+ */
+char *memory_ids_pack(char **memory_ids, size_t count, size_t *out_size);
+
+/**
+ * @brief Join the IDs and contents of a result array into one buffer.
+ *
+ * Writes "id\0content\0" for each result, with NULL strings written as
+ * empty, so the buffer always holds 2 * @p count fields. The results are
+ * left untouched.
+ *
+ * @param results Result array; can be NULL when @p count is 0.
+ * @param count Number of results.
+ * @param out_size Output: buffer length in bytes, excluding the final NUL.
+ * @return Allocated buffer (caller frees), or NULL on invalid arguments or
+ *         allocation failure.
+ */
+char *memory_results_pack_text(const GV_MemoryResult *results, size_t count, size_t *out_size);
+
 /**
  * @brief Consolidate similar memories.
  *
@@ -233,6 +291,25 @@ int memory_search(GV_MemoryLayer *layer, const float *query_embedding,
                       size_t k, GV_MemoryResult *results,
                       GV_DistanceType distance_type);
 
+/**
+ * @brief Search memories, returning only their IDs and distances.
+ *
+ * Ranks exactly like memory_search() but skips parsing metadata into the
+ * results; content is still read for importance reranking.
+ *
+ * @param layer Memory layer; must be non-NULL.
+ * @param query_embedding Query embedding vector; must be non-NULL.
+ * @param k Number of results to return.
+ * @param out_distances Output array of at least @p k distances.
+ * @param distance_type Distance metric to use.
+ * @param out_count Output: number of results found.
+ * @return Array of @p out_count memory IDs, parallel to @p out_distances
+ *         (free with memory_free_ids()), or NULL on error.
+ */
+char **memory_search_ids(GV_MemoryLayer *layer, const float *query_embedding,
+                         size_t k, float *out_distances,
+                         GV_DistanceType distance_type, size_t *out_count);
+
 /**
  * @brief Search for memories with advanced options.
  *
@@ -351,6 +428,32 @@ void memory_metadata_free(GV_MemoryMetadata *metadata);
  */
 GV_MemoryLayerConfig memory_layer_config_default(void);
 
+/**
+ * @brief Fill a memory layer configuration from scalar settings.
+ *
+ * Sets every field; llm_config and context_graph_config are cleared and
+ * enable_context_graph is set to 0, for the caller to fill in if needed.
+ *
+ * @param config Configuration to fill; must be non-NULL.
+ * @param extraction_threshold Minimum importance for extraction.
+ * @param consolidation_threshold Similarity threshold for consolidation.
+ * @param default_strategy Default consolidation strategy.
+ * @param enable_temporal_weighting Enable temporal relevance weighting.
+ * @param enable_relationship_retrieval Include related memories in results.
+ * @param max_related_memories Maximum related memories to return.
+ * @param use_llm_extraction Use LLM for extraction.
+ * @param use_llm_consolidation Use LLM for consolidation.
+ */
+void memory_layer_config_pack(GV_MemoryLayerConfig *config,
+                              double extraction_threshold,
+                              double consolidation_threshold,
+                              GV_ConsolidationStrategy default_strategy,
+                              int enable_temporal_weighting,
+                              int enable_relationship_retrieval,
+                              size_t max_related_memories,
+                              int use_llm_extraction,
+                              int use_llm_consolidation);
+
 /**
  * @brief Create a link between two memories.
  *
@@ -88,6 +88,38 @@ void scalar_quant_vector_destroy(GV_ScalarQuantVector *sqv);
  */
 size_t scalar_quant_bytes_needed(size_t dimension, uint8_t bits);
 
+/**
+ * @brief Encode a batch of vectors as 8-bit codes with per-dimension ranges.
+ *
+ * Each dimension j is mapped onto 0..255 using the batch minimum
+ * @p vmin[j] and step @p vdelta[j] = (max - min) / 255, so that
+ * value ~= vmin[j] + code * vdelta[j]. Constant dimensions get a zero step.
+ *
+ * @param data Input vectors (count * dimension floats).
+ * @param count Number of vectors.
+ * @param dimension Vector dimensionality.
+ * @param codes Output: count * dimension codes.
+ * @param vmin Output: dimension minimums.
+ * @param vdelta Output: dimension steps.
+ * @return 0 on success, -1 on invalid arguments.
+ */
+int scalar_quant_sq8_encode(const float *data, size_t count, size_t dimension,
+                            uint8_t *codes, float *vmin, float *vdelta);
+
+/**
+ * @brief Decode 8-bit codes produced by scalar_quant_sq8_encode().
+ *
+ * @param codes Input codes (count * dimension bytes).
+ * @param count Number of vectors.
+ * @param dimension Vector dimensionality.
+ * @param vmin Per-dimension minimums.
+ * @param vdelta Per-dimension steps.
+ * @param out Output: count * dimension floats.
+ * @return 0 on success, -1 on invalid arguments.
+ */
+int scalar_quant_sq8_decode(const uint8_t *codes, size_t count, size_t dimension,
+                            const float *vmin, const float *vdelta, float *out);
+
 #ifdef __cplusplus
 }
 #endif
@@ -1,3 +1,4 @@
+import hashlib
 import shutil
 import subprocess
 from pathlib import Path
@@ -5,7 +6,7 @@ import os
 import sys
 import glob
 
-from setuptools import setup
+from setuptools import Command, setup
 from setuptools.command.build_py import build_py
 from setuptools.command.bdist_wheel import bdist_wheel as _bdist_wheel
 from setuptools.command.sdist import sdist as _sdist
@@ -55,108 +56,398 @@ def _cmake_generator(env: dict) -> str:
     return ""  # let CMake figure it out
 
 
-class BuildPyWithMake(build_py):
-    """Run `make lib` in the repository root and copy the .so into the package."""
+def _run(cmd: list, env=None) -> None:
+    """Run a build tool and raise CalledProcessError on failure.
+
+    CPython only launches children via posix_spawn (rather than fork+exec of
+    the whole setuptools process) for an absolute executable with
+    close_fds=False and no cwd/preexec_fn, so resolve the tool up front.
+    """
+    path = (env if env is not None else os.environ).get("PATH")
+    exe = shutil.which(cmd[0], path=path) or cmd[0]
+    subprocess.run([exe, *cmd[1:]], env=env, check=True, close_fds=False)
+
+
+def _make_jobs_args(env: dict, jobs=None) -> list:
+    """Return the ``-jN`` argument for make, or [] when MAKEFLAGS already sets one.
+
+    An explicit ``jobs`` count (from ``build_native --parallel``) always wins.
+    Otherwise packagers can cap parallelism by exporting e.g. ``MAKEFLAGS=-j2``;
+    a parent make's jobserver is honoured the same way.
+    """
+    if jobs:
+        return [f"-j{jobs}"]
+    for flag in env.get("MAKEFLAGS", "").split():
+        if flag.startswith(("-j", "--jobs", "--jobserver")):
+            return []
+    return [f"-j{os.cpu_count() or 1}"]
+
+
+def _ccache(env: dict):
+    """Return the ccache executable to launch the C compiler with, or None.
+
+    Disabled by ``GIGAVECTOR_DISABLE_CCACHE=1`` or when ccache is not on PATH.
+    Hashes compiler contents rather than mtimes so cache hits survive across
+    fresh CI images and per-Python wheel builds.
+    """
+    if env.get("GIGAVECTOR_DISABLE_CCACHE", "") not in ("", "0"):
+        return None
+    ccache = shutil.which("ccache")
+    if ccache:
+        env.setdefault("CCACHE_COMPILERCHECK", "content")
+    return ccache
+
+
+def _lto_enabled(env: dict) -> bool:
+    """LTO is on by default for Linux builds; ``GIGAVECTOR_DISABLE_LTO=1`` opts out."""
+    if env.get("GIGAVECTOR_DISABLE_LTO", "") not in ("", "0"):
+        return False
+    return sys.platform.startswith("linux")
+
+
+def _march_flags(env: dict) -> str:
+    """Return opt-in CPU tuning flags.
+
+    Wheels stay portable by default. ``GIGAVECTOR_NATIVE=1`` tunes for the build
+    machine; ``GIGAVECTOR_MARCH=<arch>`` (e.g. ``x86-64-v3``) targets a baseline.
+    """
+    if env.get("GIGAVECTOR_NATIVE", "") not in ("", "0"):
+        return "-march=native -mtune=native"
+    march = env.get("GIGAVECTOR_MARCH", "").strip()
+    return f"-march={march}" if march else ""
+
+
+def _codegen_make_args(env: dict) -> list:
+    """Return make variable overrides for LTO and CPU tuning.
+
+    SIMD_FLAGS / LTO_FLAGS already set in the environment take precedence.
+    """
+    args = []
+    march = _march_flags(env)
+    if march and "SIMD_FLAGS" not in env:
+        args.append(f"SIMD_FLAGS={march}")
+    if _lto_enabled(env) and "LTO_FLAGS" not in env:
+        # Fat objects keep libGigaVector.a usable by plain ar and non-LTO links.
+        args.append("LTO_FLAGS=-flto=auto -ffat-lto-objects")
+    return args
+
+
+def _wants_ninja(env: dict) -> bool:
+    """True when ``GIGAVECTOR_BUILD_SYSTEM=ninja`` asks for the CMake+Ninja build."""
+    return env.get("GIGAVECTOR_BUILD_SYSTEM", "").strip().lower() == "ninja"
+
+
+_NATIVE_SOURCE_SUFFIXES = (".c", ".cpp", ".h")
+
+
+def _newest_source_mtime(repo_root: Path) -> float:
+    """Return the newest mtime among the C sources and headers under repo_root."""
+    newest = 0.0
+    for sub in ("src", "include"):
+        for dirpath, _dirnames, filenames in os.walk(repo_root / sub):
+            for name in filenames:
+                if name.endswith(_NATIVE_SOURCE_SUFFIXES):
+                    newest = max(newest, os.stat(os.path.join(dirpath, name)).st_mtime)
+    return newest
+
+
+def _source_digest(repo_root: Path) -> str:
+    """Return a SHA-256 over the paths and contents of the native sources."""
+    digest = hashlib.sha256()
+    for sub in ("src", "include"):
+        for dirpath, dirnames, filenames in os.walk(repo_root / sub):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(_NATIVE_SOURCE_SUFFIXES):
+                    path = Path(dirpath) / name
+                    digest.update(path.relative_to(repo_root).as_posix().encode())
+                    digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _digest_stamp(lib_path: Path) -> Path:
+    return lib_path.with_name(f".{lib_path.name}.sources")
 
-    def run(self):
-        pkg_dir = Path(__file__).resolve().parent / "src" / "gigavector"
-        if os.name == "nt":
-            lib_filename = "GigaVector.dll"
-        elif sys.platform == "darwin":
-            lib_filename = "libGigaVector.dylib"
-        else:
-            lib_filename = "libGigaVector.so"
 
-        package_lib_path = pkg_dir / lib_filename
+def _write_digest_stamp(lib_path: Path, repo_root: Path) -> None:
+    """Record which sources lib_path was built from (see _lib_is_fresh)."""
+    _digest_stamp(lib_path).write_text(_source_digest(repo_root) + "\n")
+
+
+def _lib_is_fresh(lib_path: Path, repo_root: Path) -> bool:
+    """True when lib_path exists and was built from the current native sources.
+
+    The mtime comparison is the cheap common case. When it fails (a fresh git
+    checkout or an unpacked sdist resets mtimes, and pip may drive separate
+    metadata and wheel builds), fall back to the content digest recorded by the
+    last build so unchanged sources are never compiled twice.
+    """
+    if not lib_path.exists():
+        return False
+    if lib_path.stat().st_mtime >= _newest_source_mtime(repo_root):
+        return True
+    stamp = _digest_stamp(lib_path)
+    if not stamp.exists():
+        return False
+    return stamp.read_text().strip() == _source_digest(repo_root)
+
+
+def _same_lib(src: Path, dst: Path) -> bool:
+    """True when dst is src (same inode) or was installed from it (matching mtime).
+
+    _install_lib preserves the source mtime on every path, including stripped
+    copies whose size legitimately differs.
+    """
+    if not dst.exists():
+        return False
+    if os.path.samefile(src, dst):
+        return True
+    return int(src.stat().st_mtime) == int(dst.stat().st_mtime)
+
+
+def _strip_tool(env: dict):
+    """Return the strip executable to shrink the packaged library with, or None.
+
+    Only used for ELF (Linux) builds; set ``GIGAVECTOR_KEEP_SYMBOLS=1`` to ship
+    the library with its debug info.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    if env.get("GIGAVECTOR_KEEP_SYMBOLS", "") not in ("", "0"):
+        return None
+    return shutil.which("strip")
+
+
+def _install_lib(src: Path, dst: Path, strip=None) -> None:
+    """Place src at dst without disturbing src.
+
+    With ``strip`` the destination is a stripped copy written by
+    ``strip -o``. Otherwise it is a hardlink, then a bytes-only copy
+    (shutil.copyfile uses the kernel's zero-copy path where available), and
+    finally a full shutil.copy2.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # Unlink first: dst may be a hardlink to src, which must not be modified.
+    if dst.exists():
+        dst.unlink()
+    if strip:
+        try:
+            _run([strip, "--strip-unneeded", "-o", str(dst), str(src)])
+            shutil.copystat(src, dst)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            if dst.exists():
+                dst.unlink()
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    try:
+        shutil.copyfile(src, dst)
+        st = src.stat()
+        # Keep the mtime so _same_lib can recognise the copy next time.
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _lib_filename() -> str:
+    """Return the platform-specific file name of the GigaVector shared library."""
+    if os.name == "nt":
+        return "GigaVector.dll"
+    if sys.platform == "darwin":
+        return "libGigaVector.dylib"
+    return "libGigaVector.so"
+
+
+class BuildNative(Command):
+    """Build the GigaVector shared library and install it into the package.
+
+    Make drives the build on POSIX and CMake on Windows. The command is run
+    by build_py, and can also be invoked on its own via
+    ``python setup.py build_native``.
+    """
+
+    description = "build the GigaVector shared library"
+    user_options = [
+        ("parallel=", "j", "number of parallel build jobs (default: build_ext --parallel)"),
+    ]
+
+    def initialize_options(self):
+        self.package_dir = None
+        self.parallel = None
+
+    def finalize_options(self):
+        if self.package_dir is None:
+            self.package_dir = Path(__file__).resolve().parent / "src" / "gigavector"
+        if self.parallel is None:
+            # Share build_ext's --parallel so one flag governs every compile step.
+            self.set_undefined_options("build_ext", ("parallel", "parallel"))
+        if self.parallel is True:
+            self.parallel = os.cpu_count() or 1
+        if self.parallel is not None:
+            try:
+                self.parallel = int(self.parallel)
+            except ValueError:
+                raise ValueError("--parallel must be an integer") from None
+
+    def run(self):
+        lib_filename = _lib_filename()
+        package_lib_path = Path(self.package_dir) / lib_filename
 
         # Prefer an already-packaged library to avoid rebuilding inside sdist.
         if package_lib_path.exists():
             self.announce(f"Found packaged lib at {package_lib_path}", level=3)
             lib_path = package_lib_path
+        elif os.name == "nt":
+            lib_path = self._build_with_cmake(_find_repo_root(), lib_filename)
+        elif _wants_ninja(os.environ) and shutil.which("ninja") and shutil.which("cmake"):
+            lib_path = self._build_with_cmake(_find_repo_root(), lib_filename, generator="Ninja")
         else:
-            lib_path = None
-
-            if os.name == "nt":
-                self.announce("Building GigaVector shared library via CMake (Windows)", level=3)
-                repo_root = _find_repo_root()
-                build_dir = Path(__file__).resolve().parent / "build-cmake-py"
-                build_dir.mkdir(parents=True, exist_ok=True)
-
-                env = os.environ.copy()
-                hardening = env.get("HARDENING_FLAGS", "")
-                extra_cflags = hardening.strip()
-                cmake_c_flags = env.get("CMAKE_C_FLAGS", "").strip()
-                combined_c_flags = " ".join([x for x in [cmake_c_flags, extra_cflags] if x])
-
-                cmake_gen = _cmake_generator(env)
-                # Multi-config generators (Visual Studio, Ninja Multi-Config) pass
-                # --config at build time; single-config generators (MinGW Makefiles,
-                # Ninja, NMake) require CMAKE_BUILD_TYPE at configure time.
-                _MULTI_CONFIG = {"Visual Studio", "Ninja Multi-Config", "Xcode"}
-                is_multi_config = not cmake_gen or any(
-                    cmake_gen.startswith(mc) for mc in _MULTI_CONFIG if mc
-                ) or cmake_gen == ""
-
-                cmake_args = [
-                    "cmake", "-S", str(repo_root), "-B", str(build_dir),
-                    "-DBUILD_TESTS=OFF", "-DBUILD_BENCHMARKS=OFF",
-                ]
-                if cmake_gen:
-                    cmake_args += ["-G", cmake_gen]
-                if not is_multi_config:
-                    # Single-config generators need CMAKE_BUILD_TYPE at configure time.
-                    cmake_args += ["-DCMAKE_BUILD_TYPE=Release"]
-                if combined_c_flags:
-                    cmake_args.append(f"-DCMAKE_C_FLAGS={combined_c_flags}")
-
-                subprocess.check_call(cmake_args, env=env)
-
-                build_cmd = ["cmake", "--build", str(build_dir)]
-                if is_multi_config:
-                    # Multi-config generators select the config at build time.
-                    build_cmd += ["--config", "Release"]
-                subprocess.check_call(build_cmd, env=env)
-
-                # MSVC puts the DLL in <build>/Release/; MinGW puts it at <build>/ with a lib prefix.
-                candidates = [
-                    build_dir / "Release" / "GigaVector.dll",
-                    build_dir / "GigaVector.dll",
-                    build_dir / "libGigaVector.dll",
-                ]
-                lib_path = next((p for p in candidates if p.exists()), None)
-                if lib_path is None:
-                    hits = glob.glob(str(build_dir / "**" / "*.dll"), recursive=True)
-                    dll_hits = [h for h in hits if "GigaVector" in Path(h).name]
-                    if dll_hits:
-                        lib_path = Path(dll_hits[0])
-                if lib_path is None:
-                    raise FileNotFoundError(f"{lib_filename} not found after CMake build in {build_dir}")
-
-            else:
-                repo_root = _find_repo_root()
-                # POSIX: build via Makefile
-                candidate = repo_root / "build" / "lib" / lib_filename
-                if candidate.exists():
-                    lib_path = candidate
-                    self.announce("Using prebuilt GigaVector shared library", level=3)
-                elif (repo_root / "Makefile").exists():
-                    self.announce("Building GigaVector shared library via make", level=3)
-                    env = os.environ.copy()
-                    subprocess.check_call(["make", "-C", str(repo_root), "lib"], env=env)
-                    candidate = repo_root / "build" / "lib" / lib_filename
-                    if candidate.exists():
-                        lib_path = candidate
-                if lib_path is None:
-                    raise FileNotFoundError(f"{lib_filename} not found and build failed at {repo_root}")
-
-        # Avoid copying onto itself inside sdist build trees.
-        if lib_path.resolve() != package_lib_path.resolve():
-            package_lib_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(lib_path, package_lib_path)
-            self.announce(f"Copied {lib_path} -> {package_lib_path}", level=3)
+            if _wants_ninja(os.environ):
+                self.warn("GIGAVECTOR_BUILD_SYSTEM=ninja needs ninja and cmake on PATH; using make")
+            lib_path = self._build_with_make(_find_repo_root(), lib_filename)
+
+        # Avoid copying onto itself inside sdist build trees, and skip the copy
+        # when the packaged library is already identical to the build output.
+        if not _same_lib(lib_path, package_lib_path):
+            _install_lib(lib_path, package_lib_path, strip=_strip_tool(os.environ))
+            self.announce(f"Installed {lib_path} -> {package_lib_path}", level=3)
         else:
             self.announce(f"Library already present at {package_lib_path}", level=3)
 
+    def _announce_ccache_stats(self, ccache: str, env: dict) -> None:
+        """Surface ccache's hit ratio in the build log (honours CCACHE_DIR)."""
+        result = subprocess.run(
+            [ccache, "--show-stats"], env=env, capture_output=True, text=True,
+            check=False, close_fds=False,
+        )
+        if result.returncode == 0:
+            self.announce(result.stdout.rstrip(), level=3)
+
+    def _build_with_cmake(self, repo_root: Path, lib_filename: str, generator: str = "") -> Path:
+        self.announce(f"Building GigaVector shared library via CMake {generator}".rstrip(), level=3)
+        # Each generator gets its own tree; CMake refuses to switch generators in place.
+        build_dir_name = "build-ninja-py" if generator == "Ninja" else "build-cmake-py"
+        build_dir = Path(__file__).resolve().parent / build_dir_name
+        build_dir.mkdir(parents=True, exist_ok=True)
+
+        env = os.environ.copy()
+        hardening = env.get("HARDENING_FLAGS", "")
+        extra_cflags = hardening.strip()
+        cmake_c_flags = env.get("CMAKE_C_FLAGS", "").strip()
+        combined_c_flags = " ".join(
+            [x for x in [cmake_c_flags, extra_cflags, _march_flags(env)] if x]
+        )
+
+        if generator:
+            cmake_gen = generator
+        elif os.name == "nt":
+            cmake_gen = _cmake_generator(env)
+        else:
+            cmake_gen = env.get("CMAKE_GENERATOR", "")
+        # Multi-config generators (Visual Studio, Ninja Multi-Config) pass
+        # --config at build time; single-config generators (MinGW Makefiles,
+        # Ninja, NMake, Unix Makefiles) require CMAKE_BUILD_TYPE at configure time.
+        # An empty generator means Visual Studio on Windows, Unix Makefiles elsewhere.
+        _MULTI_CONFIG = {"Visual Studio", "Ninja Multi-Config", "Xcode"}
+        is_multi_config = any(
+            cmake_gen.startswith(mc) for mc in _MULTI_CONFIG if mc
+        ) or (cmake_gen == "" and os.name == "nt")
+
+        cmake_args = [
+            "cmake", "-S", str(repo_root), "-B", str(build_dir),
+            "-DBUILD_TESTS=OFF", "-DBUILD_BENCHMARKS=OFF",
+        ]
+        if cmake_gen:
+            cmake_args += ["-G", cmake_gen]
+        if not is_multi_config:
+            # Single-config generators need CMAKE_BUILD_TYPE at configure time.
+            cmake_args += ["-DCMAKE_BUILD_TYPE=Release"]
+        if combined_c_flags:
+            cmake_args.append(f"-DCMAKE_C_FLAGS={combined_c_flags}")
+        if _lto_enabled(env):
+            cmake_args.append("-DENABLE_LTO=ON")
+        ccache = _ccache(env)
+        if ccache:
+            cmake_args.append(f"-DCMAKE_C_COMPILER_LAUNCHER={ccache}")
+
+        _run(cmake_args, env)
+
+        # Only the library is packaged; skip the CLI tools and tests.
+        build_cmd = ["cmake", "--build", str(build_dir), "--target", "GigaVector"]
+        if self.parallel:
+            build_cmd += ["--parallel", str(self.parallel)]
+        if is_multi_config:
+            # Multi-config generators select the config at build time.
+            build_cmd += ["--config", "Release"]
+        _run(build_cmd, env)
+        if ccache:
+            self._announce_ccache_stats(ccache, env)
+
+        # MSVC puts the DLL in <build>/Release/; MinGW puts it at <build>/ with a
+        # lib prefix; Unix Makefiles put libGigaVector.so/.dylib at <build>/.
+        candidates = [
+            build_dir / "Release" / lib_filename,
+            build_dir / lib_filename,
+            build_dir / f"lib{lib_filename}",
+        ]
+        lib_path = next((p for p in candidates if p.exists()), None)
+        if lib_path is None:
+            suffix = Path(lib_filename).suffix
+            hits = glob.glob(str(build_dir / "**" / f"*{suffix}"), recursive=True)
+            lib_hits = [h for h in hits if "GigaVector" in Path(h).name]
+            if lib_hits:
+                lib_path = Path(lib_hits[0])
+        if lib_path is None:
+            raise FileNotFoundError(f"{lib_filename} not found after CMake build in {build_dir}")
+        # Versioned .so/.dylib names are symlinks; install the real file.
+        return lib_path.resolve()
+
+    def _build_with_make(self, repo_root: Path, lib_filename: str) -> Path:
+        lib_path = None
+        candidate = repo_root / "build" / "lib" / lib_filename
+        if _lib_is_fresh(candidate, repo_root):
+            lib_path = candidate
+            self.announce("Using prebuilt GigaVector shared library", level=3)
+        elif (repo_root / "Makefile").exists() and shutil.which("make"):
+            self.announce("Building GigaVector shared library via make", level=3)
+            env = os.environ.copy()
+            make_args = [
+                "make", "-C", str(repo_root),
+                *_make_jobs_args(env, self.parallel),
+                *_codegen_make_args(env),
+            ]
+            if env.get("GIGAVECTOR_USE_PCH", "") not in ("", "0"):
+                make_args.append("USE_PCH=1")
+            ccache = _ccache(env)
+            cc = env.get("CC", "gcc")
+            if ccache and "ccache" not in cc:
+                # The Makefile pins CC with :=, so override it on the command line.
+                make_args.append(f"CC={ccache} {cc}")
+            _run([*make_args, "lib"], env)
+            if ccache:
+                self._announce_ccache_stats(ccache, env)
+            if candidate.exists():
+                lib_path = candidate
+                _write_digest_stamp(candidate, repo_root)
+        elif shutil.which("cmake"):
+            # No make on PATH (or an sdist without the Makefile): drive the same
+            # CMake build used on Windows rather than failing outright.
+            lib_path = self._build_with_cmake(repo_root, lib_filename)
+        elif candidate.exists():
+            lib_path = candidate
+        if lib_path is None:
+            raise FileNotFoundError(f"{lib_filename} not found and build failed at {repo_root}")
+        return lib_path
+
+
+class BuildPyWithMake(build_py):
+    """Build the native library (see build_native) before collecting Python sources."""
+
+    def run(self):
+        self.run_command("build_native")
         super().run()
 
 
@@ -190,9 +481,22 @@ class bdist_wheel(_bdist_wheel):
         # so it must not be tagged as "py3-none-any".
         self.root_is_pure = False
 
-
-setup(cmdclass={
-    "build_py": BuildPyWithMake,
-    "bdist_wheel": bdist_wheel,
-    "sdist": sdist,
-})
+    def get_tag(self):
+        # The library is loaded through cffi's ABI mode (ffi.dlopen) and no
+        # CPython extension module is built, so one wheel per platform serves
+        # every supported Python 3 version.
+        _python, _abi, plat = super().get_tag()
+        return "py3", "none", plat
+
+
+setup(
+    cmdclass={
+        "build_native": BuildNative,
+        "build_py": BuildPyWithMake,
+        "bdist_wheel": bdist_wheel,
+        "sdist": sdist,
+    },
+    # Ship bytecode in wheels so the first import after install does not pay
+    # the compile cost: plain .pyc plus .opt-2.pyc for ``python -OO``.
+    options={"build_py": {"compile": 1, "optimize": 2}},
+)
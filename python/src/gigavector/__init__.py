@@ -18,325 +18,9 @@ Example:
     >>> results = db.search([0.1] * 128, k=10, distance=DistanceType.COSINE)
     >>> db.close()
 """
-from ._core import (
-    Database,
-    DBStats,
-    DistanceType,
-    IndexType,
-    suggest_index,
-    SearchHit,
-    Vector,
-    HNSWConfig,
-    IVFPQConfig,
-    IVFFlatConfig,
-    IVFDiskConfig,
-    IVFSQ8Config,
-    IVFTurboQuantConfig,
-    TurboQuantConfig,
-    TurboQuantRotation,
-    PQConfig,
-    LSHConfig,
-    ScalarQuantConfig,
-    SearchParams,
-    ScrollEntry,
-    LLM,
-    LLMConfig,
-    LLMError,
-    LLMMessage,
-    LLMProvider,
-    LLMResponse,
-    EmbeddingCache,
-    EmbeddingConfig,
-    EmbeddingProvider,
-    EmbeddingService,
-    ConsolidationStrategy,
-    MemoryLink,
-    MemoryLinkType,
-    MemoryLayer,
-    MemoryLayerConfig,
-    MemoryMetadata,
-    MemoryResult,
-    MemoryType,
-    ContextGraph,
-    ContextGraphConfig,
-    EntityType,
-    GraphEntity,
-    GraphQueryResult,
-    GraphRelationship,
-    GPUConfig,
-    GPUContext,
-    GPUDeviceInfo,
-    GPUDistanceMetric,
-    GPUIndex,
-    GPUSearchParams,
-    GPUStats,
-    gpu_available,
-    gpu_device_count,
-    gpu_get_device_info,
-    Server,
-    ServerConfig,
-    ServerError,
-    ServerStats,
-    serve_with_dashboard,
-    BackupCompression,
-    BackupHeader,
-    BackupOptions,
-    BackupResult,
-    RestoreOptions,
-    backup_create,
-    backup_read_header,
-    backup_restore,
-    backup_restore_to_db,
-    backup_verify,
-    ShardConfig,
-    ShardInfo,
-    ShardManager,
-    ShardState,
-    ShardStrategy,
-    ReplicaInfo,
-    ReplicationConfig,
-    ReplicationManager,
-    ReplicationRole,
-    ReplicationState,
-    ReplicationStats,
-    Cluster,
-    ClusterConfig,
-    ClusterStats,
-    NodeInfo,
-    NodeRole,
-    NodeState,
-    Namespace,
-    NamespaceConfig,
-    NamespaceInfo,
-    NamespaceManager,
-    NSIndexType,
-    TTLConfig,
-    TTLManager,
-    TTLStats,
-    BM25Config,
-    BM25Index,
-    BM25Result,
-    BM25Stats,
-    FusionType,
-    HybridConfig,
-    HybridResult,
-    HybridSearcher,
-    HybridStats,
-    APIKey,
-    AuthConfig,
-    AuthManager,
-    AuthResult,
-    AuthType,
-    Identity,
-    JWTConfig,
-    DocAggregation,
-    DocSearchResult,
-    MultiVecConfig,
-    MultiVecIndex,
-    SnapshotInfo,
-    SnapshotManager,
-    MVCCManager,
-    Transaction,
-    TxnStatus,
-    CollectionStats,
-    PlanStrategy,
-    QueryOptimizer,
-    QueryPlan,
-    FieldType,
-    PayloadIndex,
-    PayloadOp,
-    DedupConfig,
-    DedupIndex,
-    DedupResult,
-    Migration,
-    MigrationInfo,
-    MigrationStatus,
-    VersionInfo,
-    VersionManager,
-    ReadPolicy,
-    BloomFilter,
-    QueryTrace,
-    TraceSpan,
-    Cache,
-    CacheConfig,
-    CachePolicy,
-    CacheStats,
-    Schema,
-    SchemaDiff,
-    SchemaField,
-    SchemaFieldType,
-    Codebook,
-    PointIDMap,
-    TLSConfig,
-    TLSContext,
-    TLSVersion,
-    ThresholdResult,
-    search_with_threshold,
-    NamedVectorStore,
-    VectorFieldConfig,
-    delete_by_filter,
-    update_metadata_by_filter,
-    count_by_filter,
-    GrpcConfig,
-    GrpcServer,
-    GrpcStats,
-    RemoteShardClient,
-    AutoEmbedConfig,
-    AutoEmbedder,
-    AutoEmbedProvider,
-    AutoEmbedStats,
-    DiskANNConfig,
-    DiskANNIndex,
-    DiskANNStats,
-    GroupedSearch,
-    GroupHit,
-    GroupSearchConfig,
-    SearchGroup,
-    GeoIndex,
-    GeoPoint,
-    GeoResult,
-    LateInteractionConfig,
-    LateInteractionIndex,
-    LateInteractionResult,
-    RecommendConfig,
-    RecommendResult,
-    Recommender,
-    AliasInfo,
-    AliasManager,
-    VacuumConfig,
-    VacuumManager,
-    VacuumState,
-    VacuumStats,
-    ConsistencyLevel,
-    ConsistencyManager,
-    QuotaConfig,
-    QuotaManager,
-    QuotaResult,
-    QuotaUsage,
-    CompressionConfig,
-    CompressionStats,
-    CompressionType,
-    Compressor,
-    EventType,
-    WebhookConfig,
-    WebhookManager,
-    WebhookStats,
-    Permission,
-    RBACManager,
-    MMRConfig,
-    MMRResult,
-    mmr_rerank,
-    RankExpr,
-    RankSignal,
-    RankedResult,
-    QuantCodebook,
-    QuantConfig,
-    QuantMode,
-    QuantType,
-    FTConfig,
-    FTIndex,
-    FTLanguage,
-    FTResult,
-    ft_stem,
-    HNSWInlineConfig,
-    HNSWInlineIndex,
-    HNSWRebuildConfig,
-    HNSWRebuildStats,
-    ONNXConfig,
-    ONNXModel,
-    Agent,
-    AgentConfig,
-    AgentResult,
-    AgentType,
-    MuveraConfig,
-    MuveraEncoder,
-    SSOConfig,
-    SSOManager,
-    SSOProvider,
-    SSOToken,
-    TenantInfo,
-    TenantTier,
-    TierThresholds,
-    TieredManager,
-    TieredTenantConfig,
-    InferenceConfig,
-    InferenceEngine,
-    InferenceResult,
-    JSONPathConfig,
-    JSONPathIndex,
-    JSONPathType,
-    CDCConfig,
-    CDCCursor,
-    CDCEvent,
-    CDCEventType,
-    CDCStream,
-    EmbeddedConfig,
-    EmbeddedDB,
-    EmbeddedIndexType,
-    EmbeddedResult,
-    ConditionType,
-    ConditionalResult,
-    Condition,
-    CondManager,
-    TimeTravelConfig,
-    TimeTravelManager,
-    TTVersionEntry,
-    MediaConfig,
-    MediaEntry,
-    MediaStore,
-    MediaType,
-    SQLEngine,
-    SQLResult,
-    PhaseType,
-    PhasedResult,
-    Pipeline,
-    PipelineStats,
-    LearnedSparseConfig,
-    LearnedSparseEntry,
-    LearnedSparseIndex,
-    LearnedSparseResult,
-    LearnedSparseStats,
-    GraphDBConfig,
-    GraphPath,
-    GraphDB,
-    KGConfig,
-    KGSearchResult,
-    KGTriple,
-    KGLinkPrediction,
-    KGSubgraph,
-    KGStats,
-    KnowledgeGraph,
-    FilterExpr,
-    Field,
-    ScrollIterator,
-    DiscoveryAPI,
-    DiscoveryConfig,
-    DiscoveryResult,
-    CollectionConfig,
-    CollectionInfo,
-    CollectionManager,
-    TemporalEdge,
-    TemporalKnowledgeGraph,
-    GraphAugmentedHit,
-    GraphSearchConfig,
-    search_with_graph_expansion,
-    RetentionConfig,
-    RetentionRecord,
-    RetentionScorer,
-    MemoryStoreConfig,
-    MemoryRecord,
-    MemorySearchHit,
-    MemoryStore,
-    MultiQueryHit,
-    search_multi_query,
-    LinkedChunk,
-    ExpandedSearchHit,
-    PostingCatalog,
-    PostingCacheStats,
-    PostingPayloadType,
-    PostingVector,
-    EntityLinker,
-)
+import importlib
+
+from ._exports import CORE_EXPORTS, SUBMODULE_EXPORTS, UNLISTED_EXPORTS
 from .retry import (
     GRAPH_RETRY,
     NETWORK_RETRY,
@@ -346,342 +30,35 @@ from .retry import (
     is_retryable,
 )
 
-from .dashboard.backend.server import DashboardServer
-from .async_api import AsyncDatabase
-from .pool import DatabasePool
-from .benchmark import Benchmark, BenchmarkResult
-
+# Everything listed in _exports is imported on first access by __getattr__,
+# so ``import gigavector`` does not load the native library up front.
+_LAZY_EXPORTS = dict.fromkeys(CORE_EXPORTS, "._core")
+_LAZY_EXPORTS.update(SUBMODULE_EXPORTS)
 
 __all__ = [
-    "AsyncDatabase",
-    "DatabasePool",
-    "Benchmark",
-    "BenchmarkResult",
-    "Database",
-    "DBStats",
-    "DistanceType",
-    "IndexType",
-    "suggest_index",
-    "SearchHit",
-    "Vector",
-    "HNSWConfig",
-    "IVFPQConfig",
-    "IVFFlatConfig",
-    "IVFDiskConfig",
-    "IVFSQ8Config",
-    "IVFSQ8Config",
-    "IVFTurboQuantConfig",
-    "TurboQuantConfig",
-    "TurboQuantRotation",
-    "PQConfig",
-    "LSHConfig",
-    "ScalarQuantConfig",
-    "SearchParams",
-    "ScrollEntry",
-    "LLM",
-    "LLMConfig",
-    "LLMError",
-    "LLMMessage",
-    "LLMProvider",
-    "LLMResponse",
-    "EmbeddingCache",
-    "EmbeddingConfig",
-    "EmbeddingProvider",
-    "EmbeddingService",
-    "ConsolidationStrategy",
-    "MemoryLink",
-    "MemoryLinkType",
-    "MemoryLayer",
-    "MemoryLayerConfig",
-    "MemoryMetadata",
-    "MemoryResult",
-    "MemoryType",
-    "ContextGraph",
-    "ContextGraphConfig",
-    "EntityType",
-    "GraphEntity",
-    "GraphQueryResult",
-    "GraphRelationship",
-    "GPUConfig",
-    "GPUContext",
-    "GPUDeviceInfo",
-    "GPUDistanceMetric",
-    "GPUIndex",
-    "GPUSearchParams",
-    "GPUStats",
-    "gpu_available",
-    "gpu_device_count",
-    "gpu_get_device_info",
-    "Server",
-    "ServerConfig",
-    "ServerError",
-    "ServerStats",
-    "serve_with_dashboard",
-    "DashboardServer",
-    "BackupCompression",
-    "BackupHeader",
-    "BackupOptions",
-    "BackupResult",
-    "RestoreOptions",
-    "backup_create",
-    "backup_read_header",
-    "backup_restore",
-    "backup_restore_to_db",
-    "backup_verify",
-    "ShardConfig",
-    "ShardInfo",
-    "ShardManager",
-    "ShardState",
-    "ShardStrategy",
-    "ReplicaInfo",
-    "ReplicationConfig",
-    "ReplicationManager",
-    "ReplicationRole",
-    "ReplicationState",
-    "ReplicationStats",
-    "Cluster",
-    "ClusterConfig",
-    "ClusterStats",
-    "NodeInfo",
-    "NodeRole",
-    "NodeState",
-    "Namespace",
-    "NamespaceConfig",
-    "NamespaceInfo",
-    "NamespaceManager",
-    "NSIndexType",
-    "TTLConfig",
-    "TTLManager",
-    "TTLStats",
-    "BM25Config",
-    "BM25Index",
-    "BM25Result",
-    "BM25Stats",
-    "FusionType",
-    "HybridConfig",
-    "HybridResult",
-    "HybridSearcher",
-    "HybridStats",
-    "APIKey",
-    "AuthConfig",
-    "AuthManager",
-    "AuthResult",
-    "AuthType",
-    "Identity",
-    "JWTConfig",
-    "DocAggregation",
-    "DocSearchResult",
-    "MultiVecConfig",
-    "MultiVecIndex",
-    "SnapshotInfo",
-    "SnapshotManager",
-    "MVCCManager",
-    "Transaction",
-    "TxnStatus",
-    "CollectionStats",
-    "PlanStrategy",
-    "QueryOptimizer",
-    "QueryPlan",
-    "FieldType",
-    "PayloadIndex",
-    "PayloadOp",
-    "DedupConfig",
-    "DedupIndex",
-    "DedupResult",
-    "Migration",
-    "MigrationInfo",
-    "MigrationStatus",
-    "VersionInfo",
-    "VersionManager",
-    "ReadPolicy",
-    "BloomFilter",
-    "QueryTrace",
-    "TraceSpan",
-    "Cache",
-    "CacheConfig",
-    "CachePolicy",
-    "CacheStats",
-    "Schema",
-    "SchemaDiff",
-    "SchemaField",
-    "SchemaFieldType",
-    "Codebook",
-    "PointIDMap",
-    "TLSConfig",
-    "TLSContext",
-    "TLSVersion",
-    "ThresholdResult",
-    "search_with_threshold",
-    "NamedVectorStore",
-    "VectorFieldConfig",
-    "delete_by_filter",
-    "update_metadata_by_filter",
-    "count_by_filter",
-    "GrpcConfig",
-    "GrpcServer",
-    "GrpcStats",
-    "RemoteShardClient",
-    "AutoEmbedConfig",
-    "AutoEmbedder",
-    "AutoEmbedProvider",
-    "AutoEmbedStats",
-    "DiskANNConfig",
-    "DiskANNIndex",
-    "DiskANNStats",
-    "GroupedSearch",
-    "GroupHit",
-    "GroupSearchConfig",
-    "SearchGroup",
-    "GeoIndex",
-    "GeoPoint",
-    "GeoResult",
-    "LateInteractionConfig",
-    "LateInteractionIndex",
-    "LateInteractionResult",
-    "RecommendConfig",
-    "RecommendResult",
-    "Recommender",
-    "AliasInfo",
-    "AliasManager",
-    "VacuumConfig",
-    "VacuumManager",
-    "VacuumState",
-    "VacuumStats",
-    "ConsistencyLevel",
-    "ConsistencyManager",
-    "QuotaConfig",
-    "QuotaManager",
-    "QuotaResult",
-    "QuotaUsage",
-    "CompressionConfig",
-    "CompressionStats",
-    "CompressionType",
-    "Compressor",
-    "EventType",
-    "WebhookConfig",
-    "WebhookManager",
-    "WebhookStats",
-    "Permission",
-    "RBACManager",
-    "MMRConfig",
-    "MMRResult",
-    "mmr_rerank",
-    "RankExpr",
-    "RankSignal",
-    "RankedResult",
-    "QuantCodebook",
-    "QuantConfig",
-    "QuantMode",
-    "QuantType",
-    "FTConfig",
-    "FTIndex",
-    "FTLanguage",
-    "FTResult",
-    "ft_stem",
-    "HNSWInlineConfig",
-    "HNSWInlineIndex",
-    "HNSWRebuildConfig",
-    "HNSWRebuildStats",
-    "ONNXConfig",
-    "ONNXModel",
-    "Agent",
-    "AgentConfig",
-    "AgentResult",
-    "AgentType",
-    "MuveraConfig",
-    "MuveraEncoder",
-    "SSOConfig",
-    "SSOManager",
-    "SSOProvider",
-    "SSOToken",
-    "TenantInfo",
-    "TenantTier",
-    "TierThresholds",
-    "TieredManager",
-    "TieredTenantConfig",
-    "InferenceConfig",
-    "InferenceEngine",
-    "InferenceResult",
-    "JSONPathConfig",
-    "JSONPathIndex",
-    "JSONPathType",
-    "CDCConfig",
-    "CDCCursor",
-    "CDCEvent",
-    "CDCEventType",
-    "CDCStream",
-    "EmbeddedConfig",
-    "EmbeddedDB",
-    "EmbeddedIndexType",
-    "EmbeddedResult",
-    "ConditionType",
-    "ConditionalResult",
-    "Condition",
-    "CondManager",
-    "TimeTravelConfig",
-    "TimeTravelManager",
-    "TTVersionEntry",
-    "MediaConfig",
-    "MediaEntry",
-    "MediaStore",
-    "MediaType",
-    "SQLEngine",
-    "SQLResult",
-    "PhaseType",
-    "PhasedResult",
-    "Pipeline",
-    "PipelineStats",
-    "LearnedSparseConfig",
-    "LearnedSparseEntry",
-    "LearnedSparseIndex",
-    "LearnedSparseResult",
-    "LearnedSparseStats",
-    "GraphDBConfig",
-    "GraphPath",
-    "GraphDB",
-    "KGConfig",
-    "KGSearchResult",
-    "KGTriple",
-    "KGLinkPrediction",
-    "KGSubgraph",
-    "KGStats",
-    "KnowledgeGraph",
-    "FilterExpr",
-    "Field",
-    "ScrollIterator",
-    "DiscoveryAPI",
-    "DiscoveryConfig",
-    "DiscoveryResult",
-    "CollectionConfig",
-    "CollectionInfo",
-    "CollectionManager",
-    "TemporalEdge",
-    "TemporalKnowledgeGraph",
-    "GraphAugmentedHit",
-    "GraphSearchConfig",
-    "search_with_graph_expansion",
-    "RetentionConfig",
-    "RetentionRecord",
-    "RetentionScorer",
-    "MemoryStoreConfig",
-    "MemoryRecord",
-    "MemorySearchHit",
-    "MemoryStore",
-    "MultiQueryHit",
-    "search_multi_query",
-    "LinkedChunk",
-    "ExpandedSearchHit",
-    "PostingCatalog",
-    "PostingCacheStats",
-    "PostingPayloadType",
-    "PostingVector",
-    "EntityLinker",
-    "RetryPolicy",
-    "VECTOR_RETRY",
     "GRAPH_RETRY",
     "NETWORK_RETRY",
+    "RetryPolicy",
+    "VECTOR_RETRY",
     "call_with_retry",
     "is_retryable",
+    *_LAZY_EXPORTS,
 ]
 
+_LAZY_EXPORTS.update(UNLISTED_EXPORTS)
+
 __version__ = "0.8.25"
+
+
+def __getattr__(name: str):
+    """Resolve a public name from its defining submodule on first access (PEP 562)."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
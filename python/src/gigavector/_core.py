@@ -1,15 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from enum import IntEnum
 from types import TracebackType
-from typing import Any, Callable, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
 
 from ._ffi import ffi, lib
 from .retry import GRAPH_RETRY, NETWORK_RETRY, RetryPolicy, VECTOR_RETRY, call_with_retry
 
 CData = Any  # CFFI pointer type alias
 
+# Result and config records are created per hit / per open; drop their
+# per-instance __dict__ where dataclasses support it (Python 3.10+).
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Hot-path C entry points, bound once so each call skips the attribute lookup
+# on the CFFI library object.
+_gv_db_add_vector = lib.gv_db_add_vector
+_gv_db_add_vectors = lib.gv_db_add_vectors
+_gv_db_add_vector_with_rich_metadata = lib.gv_db_add_vector_with_rich_metadata
+_gv_db_search = lib.gv_db_search
+_gv_db_search_filtered = lib.gv_db_search_filtered
+_gv_db_search_with_filter_expr = lib.gv_db_search_with_filter_expr
+_gv_db_search_batch = lib.gv_db_search_batch
+_gv_search_results_pack = lib.gv_search_results_pack
+_gv_metadata_flatten = lib.gv_metadata_flatten
+_gv_memory_add_opts = lib.gv_memory_add_opts
+_gv_memory_search = lib.gv_memory_search
+_gv_memory_search_advanced = lib.gv_memory_search_advanced
+_gv_memory_result_free = lib.gv_memory_result_free
+_gv_free = lib.gv_free
+
+# For structs whose every field is assigned right after allocation: skips the
+# zero fill ffi.new performs. Anything C may leave partly unwritten (result
+# structs in particular) must keep using ffi.new.
+_new_uncleared = ffi.new_allocator(should_clear_after_alloc=False)
+
 
 def _cstr(s: str | bytes | None, keepalive: list) -> CData:
     """Convert a Python string to a CFFI ``char[]`` and prevent GC.
@@ -25,6 +57,82 @@ def _cstr(s: str | bytes | None, keepalive: list) -> CData:
     return p
 
 
+
+def _cstr_block(strings: Sequence[str | bytes | None], keepalive: list) -> list[CData]:
+    """Wrap several strings as C strings backed by a single buffer.
+
+    The strings are encoded (``bytes`` pass through) and joined once, and
+    the joined ``bytes`` is exposed to C through ``ffi.from_buffer`` instead
+    of being copied again into CFFI-owned memory. None entries map to
+    ``NULL``. The buffer is appended to *keepalive*; it is read-only, so
+    only pass the pointers to parameters C does not write through.
+    """
+    encoded = [s.encode() if isinstance(s, str) else s for s in strings if s is not None]
+    block = ffi.from_buffer("char[]", b"\0".join(encoded) + b"\0")
+    keepalive.append(block)
+    out: list[CData] = []
+    offset = 0
+    pending = iter(encoded)
+    for s in strings:
+        if s is None:
+            out.append(ffi.NULL)
+            continue
+        out.append(block + offset)
+        offset += len(next(pending)) + 1
+    return out
+
+
+def _memoized_c_config(config, build) -> tuple[CData, list]:
+    """Return ``build()``'s ``(c_config, refs)``, cached on *config*.
+
+    The cache is keyed on the dataclass's compared field values, so the
+    struct is rebuilt only after a field has been reassigned. The cached
+    struct and its string block live as long as *config*; C callers copy
+    what they keep, so handing the same struct out repeatedly is safe.
+    """
+    key = tuple(getattr(config, f.name) for f in fields(config) if f.compare)
+    cached = config.__dict__.get("_c_cache")
+    if cached is None or cached[0] != key:
+        cached = (key, build())
+        config._c_cache = cached
+    return cached[1]
+
+
+class _CConfigCache:
+    """Mixin for configs whose struct is cached by :func:`_memoized_c_config`.
+
+    The cache is a plain instance attribute rather than a dataclass field, so
+    it stays out of ``fields()``/``asdict()``; copies and pickles drop it and
+    rebuild the struct on first use.
+    """
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_c_cache", None)
+        return state
+
+
+@functools.lru_cache(maxsize=4096)
+def _interned_cstr(s: str) -> CData:
+    """Return a cached read-only C string for *s*.
+
+    Meant for values that repeat across calls, such as memory sources and
+    context-graph scope ids.
+    Callers still add the result to their keepalive list, since the entry
+    may be evicted while C is using it.
+    """
+    return ffi.from_buffer("char[]", s.encode() + b"\0")
+
+
+def _decode_cstr(ptr: CData, default: Optional[str] = None) -> Optional[str]:
+    """Decode a nullable ``char *`` as UTF-8, returning *default* for NULL.
+
+    Reads *ptr* once, where the inline ``ffi.string(x.f) if x.f else ...``
+    form fetches the struct field twice.
+    """
+    return ffi.string(ptr).decode("utf-8") if ptr != ffi.NULL else default
+
+
 class IndexType(IntEnum):
     KDTREE = 0
     HNSW = 1
@@ -48,6 +156,26 @@ class DistanceType(IntEnum):
     HAMMING = 4
 
 
+# C returns index types as plain ints; a dict lookup avoids EnumMeta.__call__
+# on every conversion back to the enum.
+_INDEX_TYPE_BY_VALUE: dict[int, IndexType] = {m.value: m for m in IndexType}
+
+
+def _enum_from_value(table: dict, enum_cls: type, value: int):
+    """Look *value* up in *table*, falling back to ``enum_cls(value)``.
+
+    The fallback only runs for unknown values, so they still raise the
+    enum's usual ``ValueError``.
+    """
+    member = table.get(value)
+    return member if member is not None else enum_cls(value)
+
+# Index types whose search only reads shared index state, so several threads
+# can search one database at once under its read lock. HNSW, for one, keeps a
+# per-index visited table that concurrent searches would race on.
+_CONCURRENT_SEARCH_INDEXES = frozenset({IndexType.KDTREE, IndexType.FLAT, IndexType.IVFFLAT})
+
+
 def suggest_index(
     dimension: int,
     expected_count: int,
@@ -62,23 +190,29 @@ def suggest_index(
         )
     else:
         idx = lib.gv_index_suggest(dimension, expected_count)
-    return IndexType(int(idx))
+    return _enum_from_value(_INDEX_TYPE_BY_VALUE, IndexType, idx)
 
 
-@dataclass(frozen=True)
+def _choose_index_type(dimension: int, expected_count: int | None) -> IndexType:
+    """Pick the index type used by :meth:`Database.open_auto`."""
+    return _enum_from_value(
+        _INDEX_TYPE_BY_VALUE, IndexType, lib.gv_index_suggest(dimension, expected_count or 0))
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Vector:
     data: list[float]
     metadata: dict[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SearchHit:
     distance: float
     vector: Vector
     id: int = -1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class DBStats:
     total_inserts: int
     total_queries: int
@@ -86,7 +220,7 @@ class DBStats:
     total_wal_records: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HNSWConfig:
     M: int = 16
     ef_construction: int = 200
@@ -99,13 +233,13 @@ class HNSWConfig:
     distance_type: DistanceType = DistanceType.EUCLIDEAN
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScalarQuantConfig:
     bits: int = 8
     per_dimension: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IVFPQConfig:
     nlist: int = 64
     m: int = 8
@@ -215,41 +349,188 @@ class ScrollEntry:
     metadata: dict[str, str]
 
 
+def _metadata_cstrs(metadata: dict[str, str]) -> tuple[CData, CData]:
+    """Encode *metadata* into one NUL-separated ``char[]`` arena.
+
+    Returns ``(arena, ptrs)`` where ``ptrs[:n]`` are the keys and
+    ``ptrs[n:]`` the values (``n = len(metadata)``), all pointing into
+    *arena*. Keep *arena* referenced while the pointers are in use.
+    """
+    encoded = [k.encode() for k in metadata]
+    encoded.extend(v.encode() for v in metadata.values())
+    arena = ffi.new("char[]", b"\0".join(encoded))
+    ptrs = ffi.new("const char *[]", len(encoded))
+    offset = 0
+    for i, b in enumerate(encoded):
+        ptrs[i] = arena + offset
+        offset += len(b) + 1
+    return arena, ptrs
+
+
+def _float32_view(obj: Any, row_dim: int | None = None) -> CData | None:
+    """Return a zero-copy ``float[]`` over a C-contiguous float32 buffer.
+
+    Buffers such as ``array.array('f')`` or a float32 ``numpy.ndarray`` are
+    handed to C as-is; the caller must not mutate them while the call that
+    receives the pointer is running. Returns None for any other object.
+
+    When *row_dim* is given, a multi-dimensional buffer must have rows of
+    that length; this is checked once from its shape.
+    """
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return None
+    if view.format != "f" or not view.c_contiguous:
+        return None
+    if row_dim is not None and view.ndim > 1 and view.shape[-1] != row_dim:
+        raise ValueError(f"expected vector of dim {row_dim}, got {view.shape[-1]}")
+    return ffi.from_buffer("float[]", obj)
+
+
+def _as_float_cdata(values: Sequence[float]) -> CData:
+    """Marshal one vector into a C ``float[]``.
+
+    float32 buffers are passed through via :func:`_float32_view`. Lists and
+    tuples are converted by ``ffi.new`` in a single pass; any other iterable
+    is packed straight into an ``array('f')`` rather than an intermediate
+    list.
+    """
+    buf = _float32_view(values)
+    if buf is not None:
+        return buf
+    if isinstance(values, (list, tuple)):
+        return ffi.new("float[]", values)
+    return ffi.from_buffer("float[]", array("f", values))
+
+
+def _as_uint_cdata(values: Sequence[int], ctype: str = "uint32_t") -> CData:
+    """Marshal unsigned integers into a C array of *ctype*.
+
+    Contiguous unsigned buffers with a matching item size (``array('I')``
+    for ``uint32_t``, ``array('Q')`` for ``uint64_t``/``size_t``, or a numpy
+    array of that dtype) are wrapped without copying; anything else is
+    converted by ``ffi.new`` in one pass.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if (view is not None and view.format in ("I", "L", "Q") and view.c_contiguous
+            and view.itemsize == ffi.sizeof(ctype)):
+        return ffi.from_buffer(f"{ctype}[]", values)
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    return ffi.new(f"{ctype}[]", values)
+
+
+def _as_int8_cdata(values: Sequence[int]) -> CData:
+    """Marshal int8 codes into a C ``int8_t[]``; ``array('b')`` is wrapped without copying."""
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.format == "b" and view.c_contiguous:
+        return ffi.from_buffer("int8_t[]", values)
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    return ffi.new("int8_t[]", values)
+
+
+def _flatten_float32(rows: Iterable[Sequence[float]], dimension: int | None = None) -> array:
+    """Pack rows of floats into one contiguous ``array('f')``.
+
+    When *dimension* is given, each row's length is checked in the same pass,
+    so a ragged batch whose total happens to divide evenly is still rejected.
+    """
+    out = array("f")
+    if dimension is None:
+        for row in rows:
+            if isinstance(row, list):
+                out.fromlist(row)
+            else:
+                out.extend(row)
+        return out
+    expected = 0
+    for row in rows:
+        if isinstance(row, list):
+            out.fromlist(row)
+        else:
+            out.extend(row)
+        expected += dimension
+        if len(out) != expected:
+            raise ValueError(f"expected vector of dim {dimension}, got {len(out) - expected + dimension}")
+    return out
+
+
+_scratch_cells = threading.local()
+
+
+def _scratch_cell(cdecl: str, slot: int = 0) -> CData:
+    """Return this thread's reusable output cell of type *cdecl*.
+
+    Cells are keyed by ``(cdecl, slot)`` and shared by every wrapper on the
+    thread, so a caller must read its outputs before making another call
+    that uses the same cell. Use distinct *slot* values for two outputs of
+    the same type in one call.
+    """
+    cells = getattr(_scratch_cells, "cells", None)
+    if cells is None:
+        cells = _scratch_cells.cells = {}
+    cell = cells.get((cdecl, slot))
+    if cell is None:
+        cell = cells[(cdecl, slot)] = ffi.new(cdecl)
+    return cell
+
+
+_METADATA_ARENA_BYTES = 4096
+_metadata_arena = threading.local()
+
+
 def _metadata_to_dict(meta_ptr: CData) -> dict[str, str]:
-    """Convert a C GV_Metadata linked list to a Python dict."""
+    """Convert a C GV_Metadata linked list to a Python dict.
+
+    The list is flattened in C into a per-thread arena of NUL-terminated
+    keys and values, so Python reads it back with one copy and a split
+    instead of dereferencing each node.
+    """
     if meta_ptr == ffi.NULL:
         return {}
+    try:
+        arena, written = _metadata_arena.bufs
+    except AttributeError:
+        arena = ffi.new("char[]", _METADATA_ARENA_BYTES)
+        written = ffi.new("size_t *")
+        _metadata_arena.bufs = (arena, written)
+    rc = _gv_metadata_flatten(meta_ptr, arena, len(arena), written, ffi.NULL)
+    if rc == 1:
+        arena = ffi.new("char[]", 2 * written[0])
+        _metadata_arena.bufs = (arena, written)
+        rc = _gv_metadata_flatten(meta_ptr, arena, len(arena), written, ffi.NULL)
+    if rc != 0:
+        return {}
+    parts = ffi.unpack(arena, written[0]).split(b"\0")
     out: dict[str, str] = {}
-    cur = meta_ptr
-    while cur != ffi.NULL:
+    for i in range(0, len(parts) - 1, 2):
         try:
-            key = ffi.string(cur.key).decode("utf-8") if cur.key != ffi.NULL else ""
-            value = ffi.string(cur.value).decode("utf-8") if cur.value != ffi.NULL else ""
+            key = parts[i].decode("utf-8")
             if key:
-                out[key] = value
-        except (UnicodeDecodeError, AttributeError):
+                out[key] = parts[i + 1].decode("utf-8")
+        except UnicodeDecodeError:
             pass
-        cur = cur.next
     return out
 
 
 def _copy_vector(vec_ptr: CData) -> Vector:
     """Copy a C GV_Vector into a Python Vector."""
-    try:
-        if vec_ptr == ffi.NULL:
-            return Vector(data=[], metadata={})
-        dim = int(vec_ptr.dimension)
-        if dim == 0:
-            return Vector(data=[], metadata={})
-        if dim < 0 or dim > 100000:
-            raise ValueError(f"Invalid vector dimension: {dim}")
-        if vec_ptr.data == ffi.NULL:
-            return Vector(data=[], metadata={})
-        data = [vec_ptr.data[i] for i in range(dim)]
-        metadata = _metadata_to_dict(vec_ptr.metadata)
-        return Vector(data=data, metadata=metadata)
-    except (AttributeError, TypeError, ValueError, RuntimeError, OSError):
+    if vec_ptr == ffi.NULL or vec_ptr.data == ffi.NULL:
         return Vector(data=[], metadata={})
+    dim = vec_ptr.dimension
+    if __debug__ and dim > 100000:
+        raise ValueError(f"Invalid vector dimension: {dim}")
+    # ffi.unpack copies the contiguous float array in C rather than boxing
+    # one element per Python-level index operation.
+    return Vector(data=ffi.unpack(vec_ptr.data, dim), metadata=_metadata_to_dict(vec_ptr.metadata))
 
 
 def _copy_sparse_vector(sv_ptr: CData, dim: int) -> Vector:
@@ -258,11 +539,14 @@ def _copy_sparse_vector(sv_ptr: CData, dim: int) -> Vector:
         return Vector(data=[], metadata={})
     nnz = int(sv_ptr.nnz)
     data = [0.0] * dim
-    for i in range(nnz):
-        ent = sv_ptr.entries[i]
-        idx = int(ent.index)
-        if 0 <= idx < dim:
-            data[idx] = float(ent.value)
+    if nnz > 0 and sv_ptr.entries != ffi.NULL:
+        # GV_SparseEntry is {uint32 index; float value}: view the entry array
+        # once as interleaved 32-bit words instead of dereferencing each
+        # struct through cffi.
+        raw = memoryview(ffi.buffer(sv_ptr.entries, nnz * ffi.sizeof("GV_SparseEntry")))
+        for idx, value in zip(raw.cast("I")[0::2], raw.cast("f")[1::2]):
+            if idx < dim:
+                data[idx] = value
     metadata = _metadata_to_dict(sv_ptr.metadata)
     return Vector(data=data, metadata=metadata)
 
@@ -275,6 +559,9 @@ class Database:
     _closed: bool
     _owned: bool
     _retry_policy: RetryPolicy
+    _search_bufs: threading.local
+    _ivfpq_nprobe: int
+    _ivfpq_rerank: int
 
     def __init__(
         self,
@@ -289,6 +576,10 @@ class Database:
         self._closed = False
         self._owned = owned
         self._retry_policy = retry_policy if retry_policy is not None else VECTOR_RETRY
+        self._search_bufs = threading.local()
+        # 0 defers to the IVF-PQ index's own nprobe / default_rerank.
+        self._ivfpq_nprobe = 0
+        self._ivfpq_rerank = 0
 
     @classmethod
     def borrow(cls, handle: CData, dimension: int) -> Database:
@@ -324,36 +615,33 @@ class Database:
         c_path = path.encode("utf-8") if path is not None else ffi.NULL
 
         if hnsw_config is not None and index == IndexType.HNSW:
-            config = ffi.new("GV_HNSWConfig *", {
-                "M": hnsw_config.M,
-                "efConstruction": hnsw_config.ef_construction,
-                "efSearch": hnsw_config.ef_search,
-                "maxLevel": hnsw_config.max_level,
-                "use_binary_quant": 1 if hnsw_config.use_binary_quant else 0,
-                "quant_rerank": hnsw_config.quant_rerank,
-                "use_acorn": 1 if hnsw_config.use_acorn else 0,
-                "acorn_hops": hnsw_config.acorn_hops,
-                "distance_type": int(hnsw_config.distance_type),
-            })
+            # Field-by-field assignment uses CFFI's direct setters instead of
+            # its name-driven dict initializer.
+            config = ffi.new("GV_HNSWConfig *")
+            config.M = hnsw_config.M
+            config.efConstruction = hnsw_config.ef_construction
+            config.efSearch = hnsw_config.ef_search
+            config.maxLevel = hnsw_config.max_level
+            config.use_binary_quant = 1 if hnsw_config.use_binary_quant else 0
+            config.quant_rerank = hnsw_config.quant_rerank
+            config.use_acorn = 1 if hnsw_config.use_acorn else 0
+            config.acorn_hops = hnsw_config.acorn_hops
+            config.distance_type = int(hnsw_config.distance_type)
             db = lib.gv_db_open_with_hnsw_config(c_path, dimension, int(index), config)
         elif ivfpq_config is not None and index == IndexType.IVFPQ:
             sq_cfg = ivfpq_config.scalar_quant_config or ScalarQuantConfig()
-            sq_config = ffi.new("GV_ScalarQuantConfig *", {
-                "bits": sq_cfg.bits,
-                "per_dimension": 1 if sq_cfg.per_dimension else 0
-            })
-            config = ffi.new("GV_IVFPQConfig *", {
-                "nlist": ivfpq_config.nlist,
-                "m": ivfpq_config.m,
-                "nbits": ivfpq_config.nbits,
-                "nprobe": ivfpq_config.nprobe,
-                "train_iters": ivfpq_config.train_iters,
-                "default_rerank": ivfpq_config.default_rerank,
-                "use_cosine": 1 if ivfpq_config.use_cosine else 0,
-                "use_scalar_quant": 1 if ivfpq_config.use_scalar_quant else 0,
-                "scalar_quant_config": sq_config[0],
-                "oversampling_factor": ivfpq_config.oversampling_factor
-            })
+            config = ffi.new("GV_IVFPQConfig *")
+            config.nlist = ivfpq_config.nlist
+            config.m = ivfpq_config.m
+            config.nbits = ivfpq_config.nbits
+            config.nprobe = ivfpq_config.nprobe
+            config.train_iters = ivfpq_config.train_iters
+            config.default_rerank = ivfpq_config.default_rerank
+            config.use_cosine = 1 if ivfpq_config.use_cosine else 0
+            config.use_scalar_quant = 1 if ivfpq_config.use_scalar_quant else 0
+            config.scalar_quant_config.bits = sq_cfg.bits
+            config.scalar_quant_config.per_dimension = 1 if sq_cfg.per_dimension else 0
+            config.oversampling_factor = ivfpq_config.oversampling_factor
             db = lib.gv_db_open_with_ivfpq_config(c_path, dimension, int(index), config)
         elif ivfflat_config is not None and index == IndexType.IVFFLAT:
             config = ffi.new("GV_IVFFlatConfig *", {
@@ -511,9 +799,7 @@ class Database:
         rc = lib.gv_db_save(self._db, c_path)
         if rc != 0:
             raise RuntimeError("gv_db_save failed")
-        # Truncate WAL to avoid replaying already-saved inserts
-        if self._db.wal != ffi.NULL:
-            lib.gv_wal_truncate(self._db.wal)
+        # gv_db_save truncates the WAL itself once the snapshot is written.
 
     def set_exact_search_threshold(self, threshold: int) -> None:
         """
@@ -544,15 +830,18 @@ class Database:
         lib.gv_db_set_cosine_normalized(self._db, 1 if enabled else 0)
 
     def _train_index(self, data: Sequence[Sequence[float]], c_func: Any) -> None:
-        flat = [item for vec in data for item in vec]
-        count = len(data)
-        if count == 0:
-            raise ValueError("training data empty")
-        if len(flat) % count != 0:
-            raise ValueError("inconsistent training data")
-        if (len(flat) // count) != self.dimension:
+        buf = _float32_view(data, self.dimension)
+        if buf is None:
+            count = len(data)
+            if count == 0:
+                raise ValueError("training data empty")
+            buf = ffi.from_buffer("float[]", _flatten_float32(data, self.dimension))
+        else:
+            count = len(buf) // self.dimension if self.dimension else 0
+            if count == 0:
+                raise ValueError("training data empty")
+        if len(buf) != count * self.dimension:
             raise ValueError("training vectors must match db dimension")
-        buf = ffi.new("float[]", flat)
         rc = c_func(self._db, buf, count, self.dimension)
         if rc != 0:
             raise RuntimeError(f"{c_func.__name__} failed")
@@ -562,6 +851,9 @@ class Database:
 
         Args:
             data: Training vectors, each must have the same dimension as the database.
+                A C-contiguous float32 buffer (``numpy.ndarray`` of shape
+                ``(n, dimension)`` or a flat ``array.array('f')``) is passed
+                to C without copying.
 
         Raises:
             ValueError: If training data is empty or has inconsistent dimensions.
@@ -654,6 +946,65 @@ class Database:
             raise ValueError("ratio must be between 0.0 and 1.0")
         lib.gv_db_set_deleted_ratio_threshold(self._db, float(ratio))
 
+    def configure(
+        self,
+        *,
+        exact_search_threshold: int | None = None,
+        force_exact_search: bool | None = None,
+        cosine_normalized: bool | None = None,
+        compaction_interval: int | None = None,
+        wal_compaction_threshold: int | None = None,
+        deleted_ratio_threshold: float | None = None,
+    ) -> None:
+        """
+        Apply several tunables in a single call into the C library.
+
+        Each argument matches the corresponding ``set_*`` method; arguments
+        left as None are not changed.
+
+        Args:
+            exact_search_threshold: See :meth:`set_exact_search_threshold`.
+            force_exact_search: See :meth:`set_force_exact_search`.
+            cosine_normalized: See :meth:`set_cosine_normalized`.
+            compaction_interval: See :meth:`set_compaction_interval` (seconds).
+            wal_compaction_threshold: See :meth:`set_wal_compaction_threshold` (bytes).
+            deleted_ratio_threshold: See :meth:`set_deleted_ratio_threshold`.
+        """
+        tuning = ffi.new("GV_DBTuning *")
+        fields = 0
+        if exact_search_threshold is not None:
+            if exact_search_threshold < 0:
+                raise ValueError("threshold must be non-negative")
+            tuning.exact_search_threshold = exact_search_threshold
+            fields |= lib.GV_DB_TUNE_EXACT_SEARCH_THRESHOLD
+        if force_exact_search is not None:
+            tuning.force_exact_search = 1 if force_exact_search else 0
+            fields |= lib.GV_DB_TUNE_FORCE_EXACT_SEARCH
+        if cosine_normalized is not None:
+            tuning.cosine_normalized = 1 if cosine_normalized else 0
+            fields |= lib.GV_DB_TUNE_COSINE_NORMALIZED
+        if compaction_interval is not None:
+            if compaction_interval < 0:
+                raise ValueError("interval_sec must be non-negative")
+            tuning.compaction_interval_sec = compaction_interval
+            fields |= lib.GV_DB_TUNE_COMPACTION_INTERVAL
+        if wal_compaction_threshold is not None:
+            if wal_compaction_threshold < 0:
+                raise ValueError("threshold_bytes must be non-negative")
+            tuning.wal_compaction_threshold = wal_compaction_threshold
+            fields |= lib.GV_DB_TUNE_WAL_COMPACTION_THRESHOLD
+        if deleted_ratio_threshold is not None:
+            if deleted_ratio_threshold < 0.0 or deleted_ratio_threshold > 1.0:
+                raise ValueError("ratio must be between 0.0 and 1.0")
+            tuning.deleted_ratio_threshold = deleted_ratio_threshold
+            fields |= lib.GV_DB_TUNE_DELETED_RATIO_THRESHOLD
+        if not fields:
+            return
+        tuning.fields = fields
+        rc = lib.gv_db_configure(self._db, tuning)
+        if rc != 0:
+            raise RuntimeError("gv_db_configure failed")
+
     def set_resource_limits(
         self,
         max_memory_bytes: int | None = None,
@@ -827,7 +1178,9 @@ class Database:
         """Add a vector to the database with optional metadata.
 
         Args:
-            vector: Vector data as a sequence of floats.
+            vector: Vector data as a sequence of floats. A C-contiguous float32
+                buffer (``numpy.ndarray`` or ``array.array('f')``) is passed to
+                C without copying.
             metadata: Optional dictionary of key-value metadata pairs.
                 Supports multiple entries; all entries are persisted via WAL when enabled.
 
@@ -842,59 +1195,199 @@ class Database:
         )
 
     def _add_vector_once(self, vector: Sequence[float], metadata: dict[str, str] | None) -> None:
-        self._check_dimension(vector)
-        buf = ffi.new("float[]", list(vector))
-        
+        buf = _as_float_cdata(vector)
+        self._check_dimension(buf)
+
         if not metadata:
-            rc = lib.gv_db_add_vector(self._db, buf, self.dimension)
+            rc = _gv_db_add_vector(self._db, buf, self.dimension)
             if rc != 0:
                 raise RuntimeError("gv_db_add_vector failed")
             return
         
-        metadata_items = list(metadata.items())
-        if len(metadata_items) == 1:
-            k, v = metadata_items[0]
+        n = len(metadata)
+        if n == 1:
+            k, v = next(iter(metadata.items()))
             rc = lib.gv_db_add_vector_with_metadata(self._db, buf, self.dimension, k.encode(), v.encode())
             if rc != 0:
                 raise RuntimeError("gv_db_add_vector_with_metadata failed")
             return
         
-        key_cdatas = [ffi.new("char[]", k.encode()) for k, _ in metadata_items]
-        val_cdatas = [ffi.new("char[]", v.encode()) for _, v in metadata_items]
-        keys_c = ffi.new("const char * []", key_cdatas)
-        vals_c = ffi.new("const char * []", val_cdatas)
-        rc = lib.gv_db_add_vector_with_rich_metadata(
-            self._db, buf, self.dimension, keys_c, vals_c, len(metadata_items)
+        arena, ptrs = _metadata_cstrs(metadata)
+        rc = _gv_db_add_vector_with_rich_metadata(
+            self._db, buf, self.dimension, ptrs, ptrs + n, n
         )
         if rc != 0:
             raise RuntimeError("gv_db_add_vector_with_rich_metadata failed")
 
-    def add_vectors(self, vectors: Iterable[Sequence[float]]) -> None:
+    def add_vectors(self, vectors: Iterable[Sequence[float]],
+                    metadata: Sequence[dict[str, str] | None] | None = None) -> None:
         """Add multiple vectors to the database in batch.
 
+        The whole batch is inserted by a single C call, with or without
+        metadata.
+
         Args:
             vectors: Iterable of vectors, each must match the database dimension.
+                A C-contiguous float32 buffer (``numpy.ndarray`` of shape
+                ``(n, dimension)`` or a flat ``array.array('f')``) is passed
+                to C without copying.
+            metadata: Optional per-vector metadata, one entry per vector. Each
+                entry is None/empty or a dict with a single key/value pair.
 
         Raises:
-            ValueError: If any vector has incorrect dimension.
+            ValueError: If any vector has incorrect dimension, or *metadata*
+                does not line up with *vectors*.
             RuntimeError: If insertion fails after retries.
         """
         call_with_retry(
-            lambda: self._add_vectors_once(vectors),
+            lambda: self._add_vectors_once(vectors, metadata),
             self._retry_policy,
             operation="add_vectors",
         )
 
-    def _add_vectors_once(self, vectors: Iterable[Sequence[float]]) -> None:
-        data = [item for vec in vectors for item in vec]
-        count = len(data) // self.dimension if self.dimension else 0
-        if count * self.dimension != len(data):
+    def _add_vectors_once(self, vectors: Iterable[Sequence[float]],
+                          metadata: Sequence[dict[str, str] | None] | None = None) -> None:
+        buf = _float32_view(vectors, self.dimension)
+        if buf is None:
+            buf = ffi.from_buffer("float[]", _flatten_float32(vectors, self.dimension))
+        count = len(buf) // self.dimension if self.dimension else 0
+        if count * self.dimension != len(buf):
             raise ValueError("all vectors must have the configured dimension")
-        buf = ffi.new("float[]", data)
-        rc = lib.gv_db_add_vectors(self._db, buf, count, self.dimension)
+        if metadata is None:
+            self._add_vectors_ptr(buf, count)
+            return
+        if len(metadata) != count:
+            raise ValueError(f"expected {count} metadata entries, got {len(metadata)}")
+        rows: list[int] = []
+        encoded: list[bytes] = []
+        for i, meta in enumerate(metadata):
+            if not meta:
+                continue
+            if len(meta) != 1:
+                raise ValueError("batch insert supports one metadata key/value per vector")
+            key, val = next(iter(meta.items()))
+            rows.append(i)
+            encoded.append(key.encode())
+            encoded.append(val.encode())
+        # All strings share one arena; rows without metadata keep NULL pointers.
+        arena = ffi.new("char[]", b"\0".join(encoded))
+        keys = ffi.new("const char *[]", count)
+        values = ffi.new("const char *[]", count)
+        offset = 0
+        for j, i in enumerate(rows):
+            keys[i] = arena + offset
+            offset += len(encoded[2 * j]) + 1
+            values[i] = arena + offset
+            offset += len(encoded[2 * j + 1]) + 1
+        rc = lib.gv_db_add_vectors_with_metadata(self._db, buf, keys, values, count, self.dimension)
+        if rc != 0:
+            raise RuntimeError("gv_db_add_vectors_with_metadata failed")
+
+    def _add_vectors_ptr(self, buf: CData, count: int) -> None:
+        rc = _gv_db_add_vectors(self._db, buf, count, self.dimension)
         if rc != 0:
             raise RuntimeError("gv_db_add_vectors failed")
 
+    def add_vectors_from_buffer(self, buf: Any, count: int) -> None:
+        """Add *count* vectors straight from a packed float32 buffer.
+
+        Unlike :meth:`add_vectors`, the buffer only has to hold native float32
+        values; its declared format is ignored, so a ``mmap``, a bytes
+        ``memoryview`` or an Arrow buffer can be ingested without copying.
+
+        Args:
+            buf: Any C-contiguous buffer object (``numpy.ndarray``,
+                ``array.array``, ``mmap.mmap``, ``memoryview``) or a CFFI
+                ``float *``. It must stay alive for the duration of the call.
+            count: Number of vectors in *buf*.
+
+        Raises:
+            ValueError: If the buffer size does not match *count* vectors.
+            RuntimeError: If insertion fails after retries.
+        """
+        if isinstance(buf, ffi.CData):
+            ptr = ffi.cast("float *", buf)
+        else:
+            view = memoryview(buf)
+            if view.nbytes != 4 * count * self.dimension:
+                raise ValueError(
+                    f"buffer holds {view.nbytes} bytes, expected {count} vectors of dim {self.dimension}"
+                )
+            ptr = ffi.from_buffer("float[]", view)
+        call_with_retry(
+            lambda: self._add_vectors_ptr(ptr, count),
+            self._retry_policy,
+            operation="add_vectors_from_buffer",
+        )
+
+    def quantize_sq8(self, vectors: Iterable[Sequence[float]]) -> tuple[array, array, array]:
+        """Encode vectors as 8-bit codes for :meth:`add_vectors_sq8`.
+
+        Each dimension is scaled onto 0..255 using the batch's own minimum
+        and range, so one call should cover the data the codes are meant to
+        represent.
+
+        Args:
+            vectors: Vectors to encode; float32 buffers are read without copying.
+
+        Returns:
+            ``(codes, vmin, vdelta)``: an ``array('B')`` of ``n * dimension``
+            codes and two ``array('f')`` of per-dimension minimum and step.
+        """
+        buf = _float32_view(vectors, self.dimension)
+        if buf is None:
+            buf = ffi.from_buffer("float[]", _flatten_float32(vectors, self.dimension))
+        count = len(buf) // self.dimension if self.dimension else 0
+        if count == 0 or count * self.dimension != len(buf):
+            raise ValueError("all vectors must have the configured dimension")
+        codes = array("B", bytes(len(buf)))
+        vmin = array("f", bytes(4 * self.dimension))
+        vdelta = array("f", bytes(4 * self.dimension))
+        rc = lib.gv_sq8_encode(buf, count, self.dimension, ffi.from_buffer("uint8_t[]", codes),
+                               ffi.from_buffer("float[]", vmin), ffi.from_buffer("float[]", vdelta))
+        if rc != 0:
+            raise RuntimeError("gv_sq8_encode failed")
+        return codes, vmin, vdelta
+
+    def add_vectors_sq8(self, codes: Any, vmin: Sequence[float], vdelta: Sequence[float]) -> None:
+        """Add vectors given as 8-bit scalar-quantized codes.
+
+        The codes are decoded in C as ``vmin + code * vdelta`` per dimension
+        and inserted like :meth:`add_vectors`, so a caller streaming
+        pre-quantized data moves a quarter of the float32 bytes. The decoded
+        values are what the database stores, including any index-side
+        re-quantization.
+
+        Args:
+            codes: C-contiguous buffer of ``n * dimension`` unsigned bytes,
+                e.g. the codes returned by :meth:`quantize_sq8`.
+            vmin: Per-dimension minimum.
+            vdelta: Per-dimension step.
+
+        Raises:
+            ValueError: If the sizes do not match the database dimension.
+            RuntimeError: If insertion fails after retries.
+        """
+        view = memoryview(codes)
+        count = view.nbytes // self.dimension if self.dimension else 0
+        if count * self.dimension != view.nbytes:
+            raise ValueError("codes must hold whole vectors of the configured dimension")
+        vmin_buf = _as_float_cdata(vmin)
+        vdelta_buf = _as_float_cdata(vdelta)
+        self._check_dimension(vmin_buf)
+        self._check_dimension(vdelta_buf)
+        code_buf = ffi.from_buffer("uint8_t[]", view)
+        call_with_retry(
+            lambda: self._add_vectors_sq8_once(code_buf, count, vmin_buf, vdelta_buf),
+            self._retry_policy,
+            operation="add_vectors_sq8",
+        )
+
+    def _add_vectors_sq8_once(self, codes: CData, count: int, vmin: CData, vdelta: CData) -> None:
+        rc = lib.gv_db_add_vectors_sq8(self._db, codes, count, self.dimension, vmin, vdelta)
+        if rc != 0:
+            raise RuntimeError("gv_db_add_vectors_sq8 failed")
+
     def delete_vector(self, vector_index: int) -> None:
         """Delete a vector from the database by its index (insertion order).
 
@@ -919,8 +1412,8 @@ class Database:
             ValueError: If vector dimension doesn't match database dimension.
             RuntimeError: If update fails.
         """
-        self._check_dimension(new_data)
-        buf = ffi.new("float[]", list(new_data))
+        buf = _as_float_cdata(new_data)
+        self._check_dimension(buf)
         rc = lib.gv_db_update_vector(self._db, vector_index, buf, self.dimension)
         if rc != 0:
             raise RuntimeError(f"gv_db_update_vector failed for index {vector_index}")
@@ -938,45 +1431,180 @@ class Database:
         if not metadata:
             return
         
-        metadata_items = list(metadata.items())
-        key_cdatas = [ffi.new("char[]", k.encode()) for k, _ in metadata_items]
-        val_cdatas = [ffi.new("char[]", v.encode()) for _, v in metadata_items]
-        keys_c = ffi.new("const char * []", key_cdatas)
-        vals_c = ffi.new("const char * []", val_cdatas)
+        n = len(metadata)
+        arena, ptrs = _metadata_cstrs(metadata)
         rc = lib.gv_db_update_vector_metadata(
-            self._db, vector_index, keys_c, vals_c, len(metadata_items)
+            self._db, vector_index, ptrs, ptrs + n, n
         )
         if rc != 0:
             raise RuntimeError(f"gv_db_update_vector_metadata failed for index {vector_index}")
 
-    def search(self, query: Sequence[float], k: int, distance: DistanceType = DistanceType.EUCLIDEAN,
-               filter_metadata: tuple[str, str] | None = None) -> list[SearchHit]:
-        self._check_dimension(query)
-        qbuf = ffi.new("float[]", list(query))
-        results = ffi.new("GV_SearchResult[]", k)
+    def _search_buffers(self, query: Sequence[float], k: int) -> tuple[CData, CData]:
+        """Return the query and result buffers for one search on this thread.
+
+        Both buffers are cached per thread and reused across calls. Hits are
+        copied into Python objects before a search returns, so the reuse is
+        never visible to callers. A float32 buffer query is passed through
+        without copying.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        bufs = self._search_bufs
+        qbuf = _float32_view(query)
+        if qbuf is None:
+            self._check_dimension(query)
+            qbuf = getattr(bufs, "query", None)
+            if qbuf is None:
+                qbuf = bufs.query = ffi.new("float[]", self.dimension)
+            if isinstance(query, (list, tuple)):
+                qbuf[0:self.dimension] = query
+            else:
+                ffi.memmove(qbuf, array("f", query), 4 * self.dimension)
+        else:
+            self._check_dimension(qbuf)
+        return qbuf, self._result_buffer(k)
+
+    def _result_buffer(self, k: int) -> CData:
+        """Return this thread's cached ``GV_SearchResult[]`` with room for *k* hits.
+
+        The buffer only grows. Callers must read no more than the hit count
+        the C call reports, since slots past it may hold a previous search's
+        results.
+        """
+        bufs = self._search_bufs
+        results = getattr(bufs, "results", None)
+        if results is None or len(results) < k:
+            results = bufs.results = ffi.new("GV_SearchResult[]", k)
+        return results
+
+    def _search_into(self, qbuf: CData, k: int, results: CData, distance: DistanceType,
+                     filter_metadata: tuple[str, str] | None) -> int:
         if filter_metadata:
             key, value = filter_metadata
-            n = lib.gv_db_search_filtered(self._db, qbuf, k, results, int(distance), key.encode(), value.encode())
+            n = _gv_db_search_filtered(self._db, qbuf, k, results, int(distance), key.encode(), value.encode())
         else:
-            n = lib.gv_db_search(self._db, qbuf, k, results, int(distance))
+            n = _gv_db_search(self._db, qbuf, k, results, int(distance))
         if n < 0:
             raise RuntimeError("gv_db_search failed")
+        return n
+
+    def search(self, query: Sequence[float], k: int, distance: DistanceType = DistanceType.EUCLIDEAN,
+               filter_metadata: tuple[str, str] | None = None, *,
+               with_vectors: bool = True) -> list[SearchHit]:
+        """Search for the *k* nearest neighbors of *query*.
+
+        Args:
+            query: Query vector.
+            k: Number of nearest neighbors.
+            distance: Distance metric to use.
+            filter_metadata: Optional (key, value) tuple for metadata filtering.
+            with_vectors: When False, hit vectors carry only their metadata
+                (``data`` is empty), skipping the per-hit float copy for
+                callers that only need ids and distances.
+
+        Returns:
+            List of search hits, nearest first.
+        """
+        qbuf, results = self._search_buffers(query, k)
+        n = self._search_into(qbuf, k, results, distance, filter_metadata)
         out: list[SearchHit] = []
+        dim = self.dimension
+        unpack = ffi.unpack
+        null = ffi.NULL
         for i in range(n):
             res = results[i]
-            try:
-                if res.is_sparse:
-                    if res.sparse_vector != ffi.NULL:
-                        vec = _copy_sparse_vector(res.sparse_vector, self.dimension)
-                        out.append(SearchHit(distance=float(res.distance), vector=vec, id=int(res.id)))
+            if res.is_sparse:
+                sv = res.sparse_vector
+                if sv == null:
+                    continue
+                if with_vectors:
+                    vec = _copy_sparse_vector(sv, dim)
                 else:
-                    if res.vector != ffi.NULL:
-                        vec = _copy_vector(res.vector)
-                        out.append(SearchHit(distance=float(res.distance), vector=vec, id=int(res.id)))
-            except (AttributeError, TypeError, ValueError, RuntimeError, OSError):
-                continue
+                    vec = Vector(data=[], metadata=_metadata_to_dict(sv.metadata))
+            else:
+                # Dense hits are copied inline: every stored vector has the
+                # database dimension, so no per-hit range check is needed.
+                v = res.vector
+                if v == null:
+                    continue
+                data = unpack(v.data, dim) if with_vectors and v.data != null else []
+                vec = Vector(data=data, metadata=_metadata_to_dict(v.metadata))
+            out.append(SearchHit(distance=res.distance, vector=vec, id=res.id))
         return out
 
+    def search_arrays(self, query: Sequence[float], k: int,
+                      distance: DistanceType = DistanceType.EUCLIDEAN,
+                      filter_metadata: tuple[str, str] | None = None) -> tuple[array, array, array]:
+        """Search and return dense hits as packed arrays instead of SearchHit objects.
+
+        The hits are packed in C into one contiguous float32 block, so
+        callers that re-rank or post-filter can wrap the result with
+        ``numpy.frombuffer`` instead of converting Python floats per hit.
+        Metadata is not copied and sparse hits are skipped.
+
+        Args:
+            query: Query vector.
+            k: Number of nearest neighbors.
+            distance: Distance metric to use.
+            filter_metadata: Optional (key, value) tuple for metadata filtering.
+
+        Returns:
+            ``(ids, distances, vectors)``: an ``array('Q')`` of vector ids, an
+            ``array('f')`` of distances, and an ``array('f')`` holding the hit
+            vectors row by row (``len(ids) * dimension`` floats).
+        """
+        qbuf, results = self._search_buffers(query, k)
+        n = self._search_into(qbuf, k, results, distance, filter_metadata)
+        dim = self.dimension
+        ids = array("Q", bytes(8 * n))
+        distances = array("f", bytes(4 * n))
+        vectors = array("f", bytes(4 * n * dim))
+        id_buf = ffi.from_buffer("uint64_t[]", ids)
+        dist_buf = ffi.from_buffer("float[]", distances)
+        vec_buf = ffi.from_buffer("float[]", vectors)
+        packed = _gv_search_results_pack(results, n, dim, id_buf, dist_buf, vec_buf)
+        if packed < n:
+            # The arrays cannot be resized while C still holds their buffers.
+            for buf in (id_buf, dist_buf, vec_buf):
+                ffi.release(buf)
+            del ids[packed:]
+            del distances[packed:]
+            del vectors[packed * dim:]
+        return ids, distances, vectors
+
+    def search_arrays_into(self, query: Sequence[float], k: int, ids: Any, distances: Any, vectors: Any,
+                           distance: DistanceType = DistanceType.EUCLIDEAN,
+                           filter_metadata: tuple[str, str] | None = None) -> int:
+        """Like :meth:`search_arrays`, but write the hits into caller-owned buffers.
+
+        Reusing the same buffers (e.g. preallocated numpy arrays) across
+        queries avoids allocating result arrays per search; the hit vectors
+        are copied once, in C, straight into *vectors*.
+
+        Args:
+            query: Query vector.
+            k: Number of nearest neighbors.
+            ids: Writable buffer with room for *k* uint64 ids.
+            distances: Writable buffer with room for *k* float32 distances.
+            vectors: Writable buffer with room for ``k * dimension`` float32 values.
+            distance: Distance metric to use.
+            filter_metadata: Optional (key, value) tuple for metadata filtering.
+
+        Returns:
+            Number of hits written; only that many leading entries are valid.
+        """
+        dim = self.dimension
+        for name, buf, nbytes in (("ids", ids, 8 * k), ("distances", distances, 4 * k),
+                                  ("vectors", vectors, 4 * k * dim)):
+            if memoryview(buf).nbytes < nbytes:
+                raise ValueError(f"{name} buffer holds fewer than {nbytes} bytes")
+        id_buf = ffi.from_buffer("uint64_t[]", ids, require_writable=True)
+        dist_buf = ffi.from_buffer("float[]", distances, require_writable=True)
+        vec_buf = ffi.from_buffer("float[]", vectors, require_writable=True)
+        qbuf, results = self._search_buffers(query, k)
+        n = self._search_into(qbuf, k, results, distance, filter_metadata)
+        return _gv_search_results_pack(results, n, dim, id_buf, dist_buf, vec_buf)
+
     def search_with_filter_expr(self, query: Sequence[float], k: int,
                                 distance: DistanceType = DistanceType.EUCLIDEAN,
                                 filter_expr: str | None = None) -> list[SearchHit]:
@@ -997,60 +1625,98 @@ class Database:
         """
         if filter_expr is None:
             raise ValueError("filter_expr must be provided")
-        self._check_dimension(query)
-        qbuf = ffi.new("float[]", list(query))
-        results = ffi.new("GV_SearchResult[]", k)
-        n = lib.gv_db_search_with_filter_expr(self._db, qbuf, k, results, int(distance), filter_expr.encode())
+        qbuf, results = self._search_buffers(query, k)
+        n = _gv_db_search_with_filter_expr(self._db, qbuf, k, results, int(distance), filter_expr.encode())
         if n < 0:
             raise RuntimeError("gv_db_search_with_filter_expr failed")
         out: list[SearchHit] = []
+        dim = self.dimension
+        null = ffi.NULL
         for i in range(n):
             res = results[i]
-            if res.is_sparse and res.sparse_vector != ffi.NULL:
-                out.append(SearchHit(distance=float(res.distance),
-                                     vector=_copy_sparse_vector(res.sparse_vector, self.dimension), id=int(res.id)))
-            elif not res.is_sparse and res.vector != ffi.NULL:
-                out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(res.vector), id=int(res.id)))
+            if res.is_sparse:
+                sv = res.sparse_vector
+                if sv != null:
+                    out.append(SearchHit(distance=float(res.distance),
+                                         vector=_copy_sparse_vector(sv, dim), id=int(res.id)))
+            else:
+                v = res.vector
+                if v != null:
+                    out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(v), id=int(res.id)))
         return out
 
     def add_sparse_vector(self, indices: Sequence[int], values: Sequence[float],
-                          metadata: dict[str, str] | None = None) -> None:
+                          metadata: dict[str, str] | None = None, *,
+                          scale: float | None = None) -> None:
+        """Add a sparse vector (sparse index only).
+
+        Args:
+            indices: Dimension indices of the non-zero entries.
+            values: Values of the non-zero entries.
+            metadata: Optional single key/value pair.
+            scale: When given, *values* are int8 codes (for example from
+                :meth:`quantize_sparse_i8`) decoded in C as ``code * scale``.
+        """
         if self._db is None or self._closed:
             raise RuntimeError("database is closed")
         if len(indices) != len(values):
             raise ValueError("indices and values must have same length")
         nnz = len(indices)
-        idx_buf = ffi.new("uint32_t[]", [int(i) for i in indices])
-        val_buf = ffi.new("float[]", [float(v) for v in values])
+        idx_buf = _as_uint_cdata(indices)
         key = None
         val = None
         if metadata:
             if len(metadata) != 1:
                 raise ValueError("only one metadata key/value supported in this helper")
             key, val = next(iter(metadata.items()))
-        rc = lib.gv_db_add_sparse_vector(self._db, idx_buf, val_buf, nnz, self.dimension,
-                                         key.encode() if key else ffi.NULL,
-                                         val.encode() if val else ffi.NULL)
+        c_key = key.encode() if key else ffi.NULL
+        c_val = val.encode() if val else ffi.NULL
+        if scale is None:
+            rc = lib.gv_db_add_sparse_vector(self._db, idx_buf, _as_float_cdata(values), nnz,
+                                             self.dimension, c_key, c_val)
+        else:
+            rc = lib.gv_db_add_sparse_vector_i8(self._db, idx_buf, _as_int8_cdata(values), scale,
+                                                nnz, self.dimension, c_key, c_val)
         if rc != 0:
             raise RuntimeError("gv_db_add_sparse_vector failed")
 
+    @staticmethod
+    def quantize_sparse_i8(values: Sequence[float]) -> tuple[array, float]:
+        """Quantize sparse values to int8 codes with one symmetric scale.
+
+        Returns:
+            ``(codes, scale)``: an ``array('b')`` and the step to pass as
+            ``scale`` to :meth:`add_sparse_vector` / :meth:`search_sparse`.
+        """
+        peak = max((abs(v) for v in values), default=0.0)
+        scale = peak / 127.0 if peak > 0.0 else 1.0
+        return array("b", [max(-127, min(127, round(v / scale))) for v in values]), scale
+
     def search_sparse(self, indices: Sequence[int], values: Sequence[float], k: int,
-                      distance: DistanceType = DistanceType.DOT_PRODUCT) -> list[SearchHit]:
+                      distance: DistanceType = DistanceType.DOT_PRODUCT, *,
+                      scale: float | None = None) -> list[SearchHit]:
         if len(indices) != len(values):
             raise ValueError("indices and values must have same length")
         nnz = len(indices)
-        idx_buf = ffi.new("uint32_t[]", [int(i) for i in indices])
-        val_buf = ffi.new("float[]", [float(v) for v in values])
-        results = ffi.new("GV_SearchResult[]", k)
-        n = lib.gv_db_search_sparse(self._db, idx_buf, val_buf, nnz, k, results, int(distance))
+        idx_buf = _as_uint_cdata(indices)
+        results = self._result_buffer(k)
+        if scale is None:
+            n = lib.gv_db_search_sparse(self._db, idx_buf, _as_float_cdata(values), nnz, k, results,
+                                        int(distance))
+        else:
+            n = lib.gv_db_search_sparse_i8(self._db, idx_buf, _as_int8_cdata(values), scale, nnz, k,
+                                           results, int(distance))
         if n < 0:
             raise RuntimeError("gv_db_search_sparse failed")
         out: list[SearchHit] = []
+        dim = self.dimension
+        null = ffi.NULL
         for i in range(n):
             res = results[i]
-            if res.sparse_vector != ffi.NULL:
+            sv = res.sparse_vector
+            if sv != null:
                 out.append(SearchHit(distance=float(res.distance),
-                                     vector=_copy_sparse_vector(res.sparse_vector, self.dimension), id=int(res.id)))
+                                     vector=_copy_sparse_vector(sv, dim), id=int(res.id)))
         return out
 
     def range_search(self, query: Sequence[float], radius: float, max_results: int = 1000,
@@ -1069,14 +1735,14 @@ class Database:
         Returns:
             List of search hits within the radius.
         """
-        self._check_dimension(query)
+        qbuf = _as_float_cdata(query)
+        self._check_dimension(qbuf)
         if radius < 0.0:
             raise ValueError("radius must be non-negative")
         if max_results <= 0:
             raise ValueError("max_results must be positive")
-        
-        qbuf = ffi.new("float[]", list(query))
-        results = ffi.new("GV_SearchResult[]", max_results)
+
+        results = self._result_buffer(max_results)
         if filter_metadata:
             key, value = filter_metadata
             n = lib.gv_db_range_search_filtered(self._db, qbuf, radius, results, max_results,
@@ -1086,60 +1752,282 @@ class Database:
         if n < 0:
             raise RuntimeError("gv_db_range_search failed")
         out: list[SearchHit] = []
+        dim = self.dimension
+        null = ffi.NULL
         for i in range(n):
             res = results[i]
-            if res.is_sparse and res.sparse_vector != ffi.NULL:
-                out.append(SearchHit(distance=float(res.distance),
-                                     vector=_copy_sparse_vector(res.sparse_vector, self.dimension), id=int(res.id)))
-            elif not res.is_sparse and res.vector != ffi.NULL:
-                out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(res.vector), id=int(res.id)))
+            if res.is_sparse:
+                sv = res.sparse_vector
+                if sv != null:
+                    out.append(SearchHit(distance=float(res.distance),
+                                         vector=_copy_sparse_vector(sv, dim), id=int(res.id)))
+            else:
+                v = res.vector
+                if v != null:
+                    out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(v), id=int(res.id)))
         return out
 
     def search_batch(self, queries: Iterable[Sequence[float]], k: int,
-                     distance: DistanceType = DistanceType.EUCLIDEAN) -> list[list[SearchHit]]:
-        queries_list = list(queries)
-        if not queries_list:
+                     distance: DistanceType = DistanceType.EUCLIDEAN, *,
+                     with_vectors: bool = True) -> list[list[SearchHit]]:
+        """Search several queries with a single call into the C library.
+
+        Args:
+            queries: Query vectors, each matching the database dimension. A
+                C-contiguous float32 buffer (``numpy.ndarray`` of shape
+                ``(nq, dimension)`` or a flat ``array.array('f')``) is passed
+                to C without copying; other inputs are packed into one
+                ``array('f')``.
+            k: Number of nearest neighbors per query.
+            distance: Distance metric to use.
+            with_vectors: When False, hit vectors carry only their metadata,
+                as in :meth:`search`.
+
+        Returns:
+            One list of hits per query, in query order.
+        """
+        qbuf, nq = self._batch_queries(queries)
+        if nq == 0:
             return []
-        for q in queries_list:
-            self._check_dimension(q)
-        flat = [item for q in queries_list for item in q]
-        qbuf = ffi.new("float[]", flat)
-        results = ffi.new("GV_SearchResult[]", len(queries_list) * k)
-        n = lib.gv_db_search_batch(self._db, qbuf, len(queries_list), k, results, int(distance))
-        if n < 0:
-            raise RuntimeError("gv_db_search_batch failed")
+        return self._unpack_batch(self._search_batch_into(qbuf, nq, k, distance), nq, k, with_vectors)
+
+    def search_batch_stream(self, batches: Iterable[Iterable[Sequence[float]]], k: int,
+                            distance: DistanceType = DistanceType.EUCLIDEAN, *,
+                            with_vectors: bool = True) -> Iterator[list[list[SearchHit]]]:
+        """Run :meth:`search_batch` over a stream of query batches, pipelined.
+
+        The C search for the next batch runs on a worker thread, which does
+        not hold the GIL during the call, while the current batch's hits are
+        converted to Python objects. Only one C search is in flight at a
+        time.
+
+        Args:
+            batches: Iterable of query batches, each accepted by :meth:`search_batch`.
+            k: Number of nearest neighbors per query.
+            distance: Distance metric to use.
+            with_vectors: As in :meth:`search_batch`.
+
+        Yields:
+            The :meth:`search_batch` result for each batch, in order.
+        """
+        pending: tuple[Future | None, int] | None = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for queries in batches:
+                qbuf, nq = self._batch_queries(queries)
+                future = pool.submit(self._search_batch_into, qbuf, nq, k, distance) if nq else None
+                if pending is not None:
+                    yield self._unpack_pending(pending, k, with_vectors)
+                pending = (future, nq)
+            if pending is not None:
+                yield self._unpack_pending(pending, k, with_vectors)
+
+    def _unpack_pending(self, pending: tuple[Future | None, int], k: int,
+                        with_vectors: bool) -> list[list[SearchHit]]:
+        future, nq = pending
+        if future is None:
+            return []
+        return self._unpack_batch(future.result(), nq, k, with_vectors)
+
+    def _unpack_batch(self, results: CData, nq: int, k: int, with_vectors: bool) -> list[list[SearchHit]]:
         out: list[list[SearchHit]] = []
-        for qi in range(len(queries_list)):
+        for start in range(0, nq * k, k):
             hits = []
-            for hi in range(k):
-                idx = qi * k + hi
-                if idx >= n:
-                    break
+            for idx in range(start, start + k):
                 res = results[idx]
-                if res.vector != ffi.NULL:
-                    hits.append(SearchHit(distance=float(res.distance), vector=_copy_vector(res.vector), id=int(res.id)))
+                v = res.vector
+                if v == ffi.NULL:
+                    continue
+                if with_vectors:
+                    vec = _copy_vector(v)
+                else:
+                    vec = Vector(data=[], metadata=_metadata_to_dict(v.metadata))
+                hits.append(SearchHit(distance=float(res.distance), vector=vec, id=int(res.id)))
             out.append(hits)
         return out
 
+    def search_concurrent(self, queries: Iterable[Sequence[float]], k: int,
+                          distance: DistanceType = DistanceType.EUCLIDEAN,
+                          filter_metadata: tuple[str, str] | None = None, *,
+                          max_workers: int | None = None,
+                          with_vectors: bool = True) -> list[list[SearchHit]]:
+        """Run :meth:`search` for each query from a pool of threads.
+
+        The GIL is released inside the C search, so on index types that
+        support concurrent readers the queries proceed in parallel, each
+        thread using its own result buffer. On other index types the queries
+        run one after another. Prefer :meth:`search_batch` when the queries
+        are available together and no metadata filter is needed.
+
+        Args:
+            queries: Query vectors.
+            k: Number of nearest neighbors per query.
+            distance: Distance metric to use.
+            filter_metadata: Optional (key, value) tuple for metadata filtering.
+            max_workers: Thread count, as for ``ThreadPoolExecutor``.
+            with_vectors: As in :meth:`search`.
+
+        Returns:
+            One list of hits per query, in query order.
+        """
+        def run(query: Sequence[float]) -> list[SearchHit]:
+            return self.search(query, k, distance, filter_metadata, with_vectors=with_vectors)
+
+        queries = list(queries)
+        if len(queries) <= 1 or max_workers == 1 or self._db.index_type not in _CONCURRENT_SEARCH_INDEXES:
+            return [run(q) for q in queries]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(run, queries))
+
+    def search_batch_arrays(self, queries: Iterable[Sequence[float]], k: int,
+                            distance: DistanceType = DistanceType.EUCLIDEAN) -> tuple[array, array, array, array]:
+        """Batch counterpart of :meth:`search_arrays`.
+
+        Each query's slot of the C result array is packed in C, so no
+        per-hit Python objects are created. Metadata is not copied and sparse
+        hits are skipped.
+
+        Args:
+            queries: Query vectors, accepted in the same forms as :meth:`search_batch`.
+            k: Number of nearest neighbors per query.
+            distance: Distance metric to use.
+
+        Returns:
+            ``(counts, ids, distances, vectors)``: an ``array('I')`` with the
+            number of hits per query, followed by the hits of all queries in
+            query order, laid out as in :meth:`search_arrays`.
+        """
+        qbuf, nq = self._batch_queries(queries)
+        counts = array("I", bytes(4 * nq))
+        if nq == 0:
+            return counts, array("Q"), array("f"), array("f")
+        results = self._search_batch_into(qbuf, nq, k, distance)
+        dim = self.dimension
+        ids = array("Q", bytes(8 * nq * k))
+        distances = array("f", bytes(4 * nq * k))
+        vectors = array("f", bytes(4 * nq * k * dim))
+        id_buf = ffi.from_buffer("uint64_t[]", ids)
+        dist_buf = ffi.from_buffer("float[]", distances)
+        vec_buf = ffi.from_buffer("float[]", vectors)
+        total = 0
+        for qi in range(nq):
+            packed = _gv_search_results_pack(results + qi * k, k, dim, id_buf + total,
+                                             dist_buf + total, vec_buf + total * dim)
+            counts[qi] = packed
+            total += packed
+        if total < nq * k:
+            # The arrays cannot be resized while C still holds their buffers.
+            for buf in (id_buf, dist_buf, vec_buf):
+                ffi.release(buf)
+            del ids[total:]
+            del distances[total:]
+            del vectors[total * dim:]
+        return counts, ids, distances, vectors
+
+    def _batch_queries(self, queries: Iterable[Sequence[float]]) -> tuple[CData, int]:
+        qbuf = _float32_view(queries, self.dimension)
+        if qbuf is None:
+            qbuf = ffi.from_buffer("float[]", _flatten_float32(queries, self.dimension))
+        nq = len(qbuf) // self.dimension if self.dimension else 0
+        if nq * self.dimension != len(qbuf):
+            raise ValueError("all queries must have the configured dimension")
+        return qbuf, nq
+
+    def _search_batch_into(self, qbuf: CData, nq: int, k: int, distance: DistanceType) -> CData:
+        # A fresh zeroed array: queries with fewer than k hits leave NULL
+        # vectors in the rest of their slot.
+        results = ffi.new("GV_SearchResult[]", nq * k)
+        if _gv_db_search_batch(self._db, qbuf, nq, k, results, int(distance)) < 0:
+            raise RuntimeError("gv_db_search_batch failed")
+        return results
+
     def search_ivfpq_opts(self, query: Sequence[float], k: int,
                           distance: DistanceType = DistanceType.EUCLIDEAN,
                           nprobe_override: int | None = None, rerank_top: int | None = None) -> list[SearchHit]:
-        self._check_dimension(query)
-        qbuf = ffi.new("float[]", list(query))
-        results = ffi.new("GV_SearchResult[]", k)
-        nprobe = nprobe_override if nprobe_override is not None else 4
-        rerank = rerank_top if rerank_top is not None else 32
+        """IVF-PQ search with per-query probe and rerank settings.
+
+        When an argument is None, the value found by :meth:`auto_tune_ivfpq`
+        is used, or the index's configured default if it has not been tuned.
+        """
+        qbuf = _as_float_cdata(query)
+        self._check_dimension(qbuf)
+        results = self._result_buffer(k)
+        nprobe = nprobe_override if nprobe_override is not None else self._ivfpq_nprobe
+        rerank = rerank_top if rerank_top is not None else self._ivfpq_rerank
         n = lib.gv_db_search_ivfpq_opts(self._db, qbuf, k, results, int(distance), nprobe, rerank)
         if n < 0:
             raise RuntimeError("gv_db_search_ivfpq_opts failed")
         out: list[SearchHit] = []
+        null = ffi.NULL
         for i in range(n):
             res = results[i]
-            if res.vector != ffi.NULL:
-                vec = _copy_vector(res.vector)
-                out.append(SearchHit(distance=float(res.distance), vector=vec, id=int(res.id)))
+            v = res.vector
+            if v != null:
+                out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(v), id=int(res.id)))
         return out
 
+    def auto_tune_ivfpq(self, queries: Iterable[Sequence[float]], ground_truth: Sequence[Sequence[int]],
+                        k: int = 10, target_recall: float = 0.9,
+                        distance: DistanceType = DistanceType.EUCLIDEAN,
+                        max_nprobe: int = 256) -> tuple[int, int]:
+        """Pick the smallest IVF-PQ nprobe and rerank depth that meet a recall target.
+
+        nprobe is searched first (doubling, then bisection) with a generous
+        rerank depth; rerank is then bisected down at that nprobe. The result
+        becomes the default for :meth:`search_ivfpq_opts`.
+
+        Args:
+            queries: Validation queries.
+            ground_truth: For each query, the ids of its true nearest neighbors.
+            k: Neighbors per query used to measure recall@k.
+            target_recall: Mean recall@k to reach.
+            distance: Distance metric to use.
+            max_nprobe: Upper bound for nprobe; the index clamps it to nlist.
+
+        Returns:
+            The chosen ``(nprobe, rerank)``.
+        """
+        qbuf, nq = self._batch_queries(queries)
+        if nq == 0 or nq != len(ground_truth):
+            raise ValueError("need one ground-truth list per query")
+        dim = self.dimension
+        results = ffi.new("GV_SearchResult[]", k)
+        truth = [set(list(ids)[:k]) for ids in ground_truth]
+
+        def recall(nprobe: int, rerank: int) -> float:
+            total = 0.0
+            for qi in range(nq):
+                n = lib.gv_db_search_ivfpq_opts(self._db, qbuf + qi * dim, k, results,
+                                                int(distance), nprobe, rerank)
+                if n < 0:
+                    raise RuntimeError("gv_db_search_ivfpq_opts failed")
+                if truth[qi]:
+                    found = sum(1 for i in range(n) if results[i].id in truth[qi])
+                    total += found / len(truth[qi])
+                else:
+                    total += 1.0
+            return total / nq
+
+        max_rerank = max(200, 4 * k)
+        lo, hi = 0, 1
+        while hi < max_nprobe and recall(hi, max_rerank) < target_recall:
+            lo, hi = hi, min(2 * hi, max_nprobe)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if recall(mid, max_rerank) >= target_recall:
+                hi = mid
+            else:
+                lo = mid
+        nprobe = hi
+        lo, hi = k - 1, max_rerank
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if recall(nprobe, mid) >= target_recall:
+                hi = mid
+            else:
+                lo = mid
+        self._ivfpq_nprobe, self._ivfpq_rerank = nprobe, hi
+        return nprobe, hi
+
     def record_latency(self, latency_us: int, is_insert: bool) -> None:
         """Record operation latency for monitoring.
 
@@ -1170,7 +2058,7 @@ class Database:
         ptr = lib.gv_database_get_vector(self._db, index)
         if ptr == ffi.NULL:
             return None
-        return [ptr[i] for i in range(self.dimension)]
+        return ffi.unpack(ptr, self.dimension)
 
     def upsert(self, vector_index: int, vector: Sequence[float],
                metadata: dict[str, str] | None = None) -> None:
@@ -1181,17 +2069,14 @@ class Database:
             vector: Vector data.
             metadata: Optional metadata dictionary.
         """
-        self._check_dimension(vector)
-        buf = ffi.new("float[]", list(vector))
+        buf = _as_float_cdata(vector)
+        self._check_dimension(buf)
         if metadata:
-            items = list(metadata.items())
-            key_cdatas = [ffi.new("char[]", k.encode()) for k, _ in items]
-            val_cdatas = [ffi.new("char[]", v.encode()) for _, v in items]
-            keys_c = ffi.new("const char * []", key_cdatas)
-            vals_c = ffi.new("const char * []", val_cdatas)
+            n = len(metadata)
+            arena, ptrs = _metadata_cstrs(metadata)
             rc = lib.gv_db_upsert_with_metadata(
                 self._db, vector_index, buf, self.dimension,
-                keys_c, vals_c, len(items))
+                ptrs, ptrs + n, n)
         else:
             rc = lib.gv_db_upsert(self._db, vector_index, buf, self.dimension)
         if rc != 0:
@@ -1206,10 +2091,10 @@ class Database:
         Returns:
             Number of vectors successfully deleted.
         """
-        if not indices:
+        if len(indices) == 0:
             return 0
-        buf = ffi.new("size_t[]", [int(i) for i in indices])
-        n = lib.gv_db_delete_vectors(self._db, buf, len(indices))
+        buf = _as_uint_cdata(indices, "size_t")
+        n = lib.gv_db_delete_vectors(self._db, buf, len(buf))
         if n < 0:
             raise RuntimeError("gv_db_delete_vectors failed")
         return int(n)
@@ -1251,8 +2136,8 @@ class Database:
             List of search hits.
         """
         self._check_dimension(query)
-        qbuf = ffi.new("float[]", list(query))
-        results = ffi.new("GV_SearchResult[]", k)
+        qbuf = _as_float_cdata(query)
+        results = self._result_buffer(k)
         if params is not None:
             p = ffi.new("GV_SearchParams *", {
                 "ef_search": params.ef_search,
@@ -1265,10 +2150,12 @@ class Database:
         if n < 0:
             raise RuntimeError("gv_db_search_with_params failed")
         out: list[SearchHit] = []
+        null = ffi.NULL
         for i in range(n):
             res = results[i]
-            if res.vector != ffi.NULL:
-                out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(res.vector), id=int(res.id)))
+            v = res.vector
+            if v != null:
+                out.append(SearchHit(distance=float(res.distance), vector=_copy_vector(v), id=int(res.id)))
         return out
 
     def export_json(self, filepath: str) -> int:
@@ -1331,7 +2218,7 @@ class LLMProvider(IntEnum):
 
 
 @dataclass
-class LLMConfig:
+class LLMConfig(_CConfigCache):
     provider: LLMProvider
     api_key: str
     model: str
@@ -1342,28 +2229,20 @@ class LLMConfig:
     custom_prompt: Optional[str] = None
     max_retries: int = 2
 
-    def _to_c_config(self) -> CData:
+    def _to_c_config(self) -> tuple[CData, list]:
+        return _memoized_c_config(self, self._build_c_config)
+
+    def _build_c_config(self) -> tuple[CData, list]:
         c_config = ffi.new("GV_LLMConfig *")
-        # Keep references to prevent GC of char[] buffers
+        # Keep references to prevent GC of the string block
         _refs: list = []
         c_config.provider = int(self.provider)
-        _api_key = ffi.new("char[]", self.api_key.encode()); _refs.append(_api_key)
-        c_config.api_key = _api_key
-        _model = ffi.new("char[]", self.model.encode()); _refs.append(_model)
-        c_config.model = _model
-        if self.base_url:
-            _base_url = ffi.new("char[]", self.base_url.encode()); _refs.append(_base_url)
-            c_config.base_url = _base_url
-        else:
-            c_config.base_url = ffi.NULL
+        (c_config.api_key, c_config.model, c_config.base_url,
+         c_config.custom_prompt) = _cstr_block(
+            (self.api_key, self.model, self.base_url or None, self.custom_prompt or None), _refs)
         c_config.temperature = self.temperature
         c_config.max_tokens = self.max_tokens
         c_config.timeout_seconds = self.timeout_seconds
-        if self.custom_prompt:
-            _prompt = ffi.new("char[]", self.custom_prompt.encode()); _refs.append(_prompt)
-            c_config.custom_prompt = _prompt
-        else:
-            c_config.custom_prompt = ffi.NULL
         return c_config, _refs  # Caller must keep _refs alive until C call completes
 
 
@@ -1372,13 +2251,12 @@ class LLMMessage:
     role: str
     content: str
 
-    def _to_c_message(self) -> tuple[CData, bytes, bytes]:
-        role_bytes = self.role.encode()
-        content_bytes = self.content.encode()
-        c_msg = ffi.new("GV_LLMMessage *")
-        c_msg.role = ffi.new("char[]", role_bytes)
-        c_msg.content = ffi.new("char[]", content_bytes)
-        return (c_msg, role_bytes, content_bytes)
+    def _to_c_message(self, c_msg: Optional[CData] = None) -> tuple[CData, list]:
+        refs: list = []
+        if c_msg is None:
+            c_msg = ffi.new("GV_LLMMessage *")
+        c_msg.role, c_msg.content = _cstr_block((self.role, self.content), refs)
+        return (c_msg, refs)
 
 
 @dataclass
@@ -1454,20 +2332,17 @@ class LLM:
         message_refs = []  # Keep references alive
         
         for i, msg in enumerate(messages):
-            c_msg, role_bytes, content_bytes = msg._to_c_message()
-            c_messages[i] = c_msg[0]
-            message_refs.append((c_msg, role_bytes, content_bytes))
+            message_refs.append(msg._to_c_message(c_messages + i)[1])
 
         response_format_bytes = response_format.encode() if response_format else ffi.NULL
         c_response = ffi.new("GV_LLMResponse *")
 
+        # The message strings are Python-owned, so they are not passed to
+        # gv_llm_message_free afterwards.
         result = lib.gv_llm_generate_response(
             self._llm, c_messages, len(messages), response_format_bytes, c_response
         )
 
-        for c_msg, _, _ in message_refs:
-            lib.gv_llm_message_free(c_msg)
-
         if result != 0:
             error_msg = lib.gv_llm_get_last_error(self._llm)
             error_str = lib.gv_llm_error_string(result)
@@ -1475,7 +2350,12 @@ class LLM:
             error_detail = ffi.string(error_msg).decode("utf-8") if error_msg != ffi.NULL else error_str.decode("utf-8") if error_str != ffi.NULL else "Unknown error"
             raise RuntimeError(f"Failed to generate LLM response: {error_detail} (code: {result})")
 
-        content = ffi.string(c_response.content).decode("utf-8") if c_response.content != ffi.NULL else ""
+        if c_response.content == ffi.NULL:
+            content = ""
+        elif c_response.content_length:
+            content = ffi.unpack(c_response.content, c_response.content_length).decode("utf-8")
+        else:
+            content = ffi.string(c_response.content).decode("utf-8")
         response = LLMResponse(
             content=content,
             finish_reason=int(c_response.finish_reason),
@@ -1518,7 +2398,7 @@ class EmbeddingProvider(IntEnum):
 
 
 @dataclass
-class EmbeddingConfig:
+class EmbeddingConfig(_CConfigCache):
     provider: EmbeddingProvider = EmbeddingProvider.NONE
     api_key: Optional[str] = None
     model: Optional[str] = None
@@ -1533,37 +2413,26 @@ class EmbeddingConfig:
     def _to_c_config(self) -> tuple:
         """Convert to C configuration structure.
 
+        The struct is built once and reused until a field changes.
+
         Returns:
             Tuple of (CFFI pointer to GV_EmbeddingConfig, list of refs to keep alive).
         """
+        return _memoized_c_config(self, self._build_c_config)
+
+    def _build_c_config(self) -> tuple:
         c_config = ffi.new("GV_EmbeddingConfig *")
         _refs: list = []
         c_config.provider = int(self.provider)
-        if self.api_key:
-            _buf = ffi.new("char[]", self.api_key.encode()); _refs.append(_buf)
-            c_config.api_key = _buf
-        else:
-            c_config.api_key = ffi.NULL
-        if self.model:
-            _buf = ffi.new("char[]", self.model.encode()); _refs.append(_buf)
-            c_config.model = _buf
-        else:
-            c_config.model = ffi.NULL
-        if self.base_url:
-            _buf = ffi.new("char[]", self.base_url.encode()); _refs.append(_buf)
-            c_config.base_url = _buf
-        else:
-            c_config.base_url = ffi.NULL
+        (c_config.api_key, c_config.model, c_config.base_url,
+         c_config.huggingface_model_path) = _cstr_block(
+            (self.api_key or None, self.model or None, self.base_url or None,
+             self.huggingface_model_path or None), _refs)
         c_config.embedding_dimension = self.embedding_dimension
         c_config.batch_size = self.batch_size
         c_config.enable_cache = 1 if self.enable_cache else 0
         c_config.cache_size = self.cache_size
         c_config.timeout_seconds = self.timeout_seconds
-        if self.huggingface_model_path:
-            _buf = ffi.new("char[]", self.huggingface_model_path.encode()); _refs.append(_buf)
-            c_config.huggingface_model_path = _buf
-        else:
-            c_config.huggingface_model_path = ffi.NULL
         return c_config, _refs
 
 
@@ -1621,8 +2490,9 @@ class EmbeddingService:
         if self._closed:
             raise ValueError("Embedding service is closed")
         
-        embedding_dim_ptr = ffi.new("size_t *")
-        embedding_ptr = ffi.new("float **")
+        embedding_dim_ptr = _scratch_cell("size_t *")
+        embedding_ptr = _scratch_cell("float **")
+        embedding_ptr[0] = ffi.NULL
         
         result = lib.gv_embedding_generate(
             self._service, text.encode(), embedding_dim_ptr, embedding_ptr
@@ -1634,7 +2504,7 @@ class EmbeddingService:
         if embedding_ptr[0] == ffi.NULL:
             raise RuntimeError("gv_embedding_generate returned NULL")
         
-        embedding = [embedding_ptr[0][i] for i in range(embedding_dim_ptr[0])]
+        embedding = ffi.unpack(embedding_ptr[0], embedding_dim_ptr[0])
         lib.gv_free(embedding_ptr[0])
         
         return embedding
@@ -1654,8 +2524,9 @@ class EmbeddingService:
         if not texts:
             return []
         
-        text_ptrs = [ffi.new("char[]", text.encode()) for text in texts]
-        text_array = ffi.new("char *[]", text_ptrs)
+        # All texts share one buffer instead of one allocation each.
+        text_refs: list = []
+        text_array = ffi.new("const char *[]", _cstr_block(texts, text_refs))
         
         embedding_dims_ptr = ffi.new("size_t **")
         embeddings_ptr = ffi.new("float ***")
@@ -1671,7 +2542,7 @@ class EmbeddingService:
         if embeddings_ptr[0] != ffi.NULL:
             for i in range(len(texts)):
                 if embeddings_ptr[0][i] != ffi.NULL and embedding_dims_ptr[0][i] > 0:
-                    emb: list[float] = [embeddings_ptr[0][i][j] for j in range(embedding_dims_ptr[0][i])]
+                    emb: list[float] = ffi.unpack(embeddings_ptr[0][i], embedding_dims_ptr[0][i])
                     lib.gv_free(embeddings_ptr[0][i])
                     embeddings.append(emb)
                 else:
@@ -1724,8 +2595,9 @@ class EmbeddingCache:
         if self._closed:
             raise ValueError("Cache is closed")
         
-        embedding_dim_ptr = ffi.new("size_t *")
-        embedding_ptr = ffi.new("const float **")
+        embedding_dim_ptr = _scratch_cell("size_t *")
+        embedding_ptr = _scratch_cell("const float **")
+        embedding_ptr[0] = ffi.NULL
         
         result = lib.gv_embedding_cache_get(
             self._cache, text.encode(), embedding_dim_ptr, embedding_ptr
@@ -1737,7 +2609,7 @@ class EmbeddingCache:
         if embedding_ptr[0] == ffi.NULL:
             return None
         
-        embedding = [embedding_ptr[0][i] for i in range(embedding_dim_ptr[0])]
+        embedding = ffi.unpack(embedding_ptr[0], embedding_dim_ptr[0])
         return embedding
     
     def put(self, text: str, embedding: Sequence[float]) -> bool:
@@ -1753,12 +2625,41 @@ class EmbeddingCache:
         if self._closed:
             raise ValueError("Cache is closed")
         
-        c_embedding = ffi.new("float[]", embedding)
+        c_embedding = _as_float_cdata(embedding)
         result = lib.gv_embedding_cache_put(
-            self._cache, text.encode(), len(embedding), c_embedding
+            self._cache, text.encode(), len(c_embedding), c_embedding
         )
         
         return result == 0
+
+    def put_batch(self, texts: Sequence[str], embeddings: Iterable[Sequence[float]]) -> bool:
+        """Store several embeddings of the same dimension in one call.
+
+        Args:
+            texts: Text keys
+            embeddings: One embedding per text; a C-contiguous float32 buffer
+                of shape ``(len(texts), dim)`` is passed without copying
+
+        Returns:
+            True on success, False on error
+        """
+        if self._closed:
+            raise ValueError("Cache is closed")
+        if not texts:
+            return True
+
+        buf = _float32_view(embeddings)
+        if buf is None:
+            rows = list(embeddings)
+            buf = ffi.from_buffer("float[]", _flatten_float32(rows, len(rows[0]) if rows else None))
+        dim = len(buf) // len(texts)
+        if dim == 0 or dim * len(texts) != len(buf):
+            raise ValueError("embeddings must hold one vector of a shared dimension per text")
+        refs: list = []
+        text_array = ffi.new("const char *[]", _cstr_block(texts, refs))
+        result = lib.gv_embedding_cache_put_batch(self._cache, text_array, len(texts), dim, buf)
+
+        return result == 0
     
     def clear(self) -> None:
         """Clear all entries from cache."""
@@ -1775,9 +2676,9 @@ class EmbeddingCache:
         if self._closed:
             raise ValueError("Cache is closed")
         
-        size_ptr = ffi.new("size_t *")
-        hits_ptr = ffi.new("uint64_t *")
-        misses_ptr = ffi.new("uint64_t *")
+        size_ptr = _scratch_cell("size_t *")
+        hits_ptr = _scratch_cell("uint64_t *")
+        misses_ptr = _scratch_cell("uint64_t *", 1)
         
         lib.gv_embedding_cache_stats(self._cache, size_ptr, hits_ptr, misses_ptr)
         
@@ -1795,6 +2696,9 @@ class MemoryType(IntEnum):
     EVENT = 3
 
 
+_MEMORY_TYPE_BY_VALUE: dict[int, MemoryType] = {m.value: m for m in MemoryType}
+
+
 class ConsolidationStrategy(IntEnum):
     MERGE = 0
     UPDATE = 1
@@ -1822,7 +2726,7 @@ class MemoryLink:
     reason: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class MemoryMetadata:
     memory_id: Optional[str] = None
     memory_type: MemoryType = MemoryType.FACT
@@ -1838,7 +2742,7 @@ class MemoryMetadata:
     last_accessed: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class MemoryResult:
     memory_id: str
     content: str
@@ -1848,7 +2752,7 @@ class MemoryResult:
     related: Sequence[MemoryResult] = ()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MemoryLayerConfig:
     extraction_threshold: float = 0.5
     consolidation_threshold: float = 0.85
@@ -1866,119 +2770,218 @@ class MemoryLayerConfig:
     retry: Optional[RetryPolicy] = None
 
 
-def _create_c_metadata(meta: Optional[MemoryMetadata]) -> CData:
+def _create_c_metadata(meta: Optional[MemoryMetadata]) -> tuple[CData, list]:
     """Convert Python MemoryMetadata to C structure.
 
+    The strings, including the related memory ids, share one block from
+    :func:`_cstr_block`, so the related ids cost a single pointer array
+    rather than one allocation each. The source comes from
+    :func:`_interned_cstr`.
+
     Args:
         meta: Python memory metadata object, or None.
 
     Returns:
-        CFFI pointer to GV_MemoryMetadata, or ffi.NULL if meta is None.
+        Tuple of (CFFI pointer to GV_MemoryMetadata or ffi.NULL if meta is
+        None, list of refs to keep alive for the duration of the C call).
     """
+    refs: list = []
     if meta is None:
-        return ffi.NULL
-
-    c_meta = ffi.new("GV_MemoryMetadata *")
-    c_meta.memory_id = ffi.new("char[]", meta.memory_id.encode()) if meta.memory_id else ffi.NULL
+        return ffi.NULL, refs
+
+    related = meta.related_memory_ids or ()
+    c_meta = _new_uncleared("GV_MemoryMetadata *")
+    refs.append(c_meta)
+    ptrs = _cstr_block((meta.memory_id or None, meta.extraction_metadata or None, *related), refs)
+    c_meta.memory_id, c_meta.extraction_metadata = ptrs[:2]
+    if meta.source:
+        # Sources repeat heavily (one per conversation or user), so their
+        # C strings are cached instead of packed into the block.
+        c_source = _interned_cstr(meta.source)
+        refs.append(c_source)
+        c_meta.source = c_source
+    else:
+        c_meta.source = ffi.NULL
     c_meta.memory_type = int(meta.memory_type)
-    c_meta.source = ffi.new("char[]", meta.source.encode()) if meta.source else ffi.NULL
     c_meta.timestamp = meta.timestamp if meta.timestamp else 0
     c_meta.last_accessed = meta.last_accessed if meta.last_accessed else 0
     c_meta.access_count = meta.access_count
     c_meta.importance_score = meta.importance_score
-    c_meta.extraction_metadata = ffi.new("char[]", meta.extraction_metadata.encode()) if meta.extraction_metadata else ffi.NULL
-    c_meta.related_count = len(meta.related_memory_ids) if meta.related_memory_ids else 0
+    c_meta.related_count = len(related)
     c_meta.links = ffi.NULL
     c_meta.link_count = 0
     c_meta.consolidated = 1 if meta.consolidated else 0
     c_meta.valid_from = meta.valid_from if meta.valid_from else 0
     c_meta.valid_to = meta.valid_to if meta.valid_to else 0
 
-    if meta.related_memory_ids:
-        c_meta.related_memory_ids = ffi.new("char*[]", [ffi.new("char[]", id.encode()) for id in meta.related_memory_ids])
+    if related:
+        c_ids = ffi.new("char*[]", ptrs[2:])
+        refs.append(c_ids)
+        c_meta.related_memory_ids = c_ids
     else:
         c_meta.related_memory_ids = ffi.NULL
 
-    return c_meta
+    return c_meta, refs
 
 
 def _copy_memory_metadata(c_meta_ptr: CData) -> Optional[MemoryMetadata]:
     """Copy C memory metadata structure to Python object.
 
+    Strings are decoded with ``errors="replace"`` so a malformed byte in
+    one field does not discard the whole record.
+
     Args:
         c_meta_ptr: CFFI pointer to GV_MemoryMetadata structure.
 
     Returns:
-        Python MemoryMetadata object, or None on error.
+        Python MemoryMetadata object, or None if the pointer is NULL or the
+        memory type is unknown.
     """
-    if c_meta_ptr == ffi.NULL:
+    null = ffi.NULL
+    if c_meta_ptr == null:
         return None
-
-    try:
-        memory_id = ffi.string(c_meta_ptr.memory_id).decode("utf-8") if c_meta_ptr.memory_id != ffi.NULL else None
-        source = ffi.string(c_meta_ptr.source).decode("utf-8") if c_meta_ptr.source != ffi.NULL else None
-        extraction_metadata = ffi.string(c_meta_ptr.extraction_metadata).decode("utf-8") if c_meta_ptr.extraction_metadata != ffi.NULL else None
-
-        related_ids = []
-        if c_meta_ptr.related_memory_ids != ffi.NULL and c_meta_ptr.related_count > 0:
-            for i in range(c_meta_ptr.related_count):
-                if c_meta_ptr.related_memory_ids[i] != ffi.NULL:
-                    related_ids.append(ffi.string(c_meta_ptr.related_memory_ids[i]).decode("utf-8"))
-
-        return MemoryMetadata(
-            memory_id=memory_id,
-            memory_type=MemoryType(int(c_meta_ptr.memory_type)),
-            source=source,
-            timestamp=int(c_meta_ptr.timestamp) if c_meta_ptr.timestamp > 0 else None,
-            importance_score=float(c_meta_ptr.importance_score),
-            extraction_metadata=extraction_metadata,
-            related_memory_ids=tuple(related_ids),
-            consolidated=bool(c_meta_ptr.consolidated),
-            valid_from=int(c_meta_ptr.valid_from) if c_meta_ptr.valid_from > 0 else None,
-            valid_to=int(c_meta_ptr.valid_to) if c_meta_ptr.valid_to > 0 else None,
-            access_count=int(c_meta_ptr.access_count),
-            last_accessed=int(c_meta_ptr.last_accessed) if c_meta_ptr.last_accessed > 0 else None,
-        )
-    except (AttributeError, TypeError, ValueError, UnicodeDecodeError):
+    memory_type = _MEMORY_TYPE_BY_VALUE.get(int(c_meta_ptr.memory_type))
+    if memory_type is None:
         return None
 
+    string = ffi.string
+    c_str = c_meta_ptr.memory_id
+    memory_id = string(c_str).decode("utf-8", "replace") if c_str != null else None
+    c_str = c_meta_ptr.source
+    source = string(c_str).decode("utf-8", "replace") if c_str != null else None
+    c_str = c_meta_ptr.extraction_metadata
+    extraction_metadata = string(c_str).decode("utf-8", "replace") if c_str != null else None
+
+    related_ids: Sequence[str] = ()
+    c_ids = c_meta_ptr.related_memory_ids
+    if c_ids != null and c_meta_ptr.related_count:
+        related_ids = tuple(string(c_str).decode("utf-8", "replace")
+                            for c_str in ffi.unpack(c_ids, c_meta_ptr.related_count) if c_str != null)
+
+    timestamp = c_meta_ptr.timestamp
+    valid_from = c_meta_ptr.valid_from
+    valid_to = c_meta_ptr.valid_to
+    last_accessed = c_meta_ptr.last_accessed
+    return MemoryMetadata(
+        memory_id=memory_id,
+        memory_type=memory_type,
+        source=source,
+        timestamp=timestamp if timestamp > 0 else None,
+        importance_score=c_meta_ptr.importance_score,
+        extraction_metadata=extraction_metadata,
+        related_memory_ids=related_ids,
+        consolidated=bool(c_meta_ptr.consolidated),
+        valid_from=valid_from if valid_from > 0 else None,
+        valid_to=valid_to if valid_to > 0 else None,
+        access_count=c_meta_ptr.access_count,
+        last_accessed=last_accessed if last_accessed > 0 else None,
+    )
+
 
-def _copy_memory_result(c_result_ptr: CData) -> Optional[MemoryResult]:
+def _copy_memory_result(
+    c_result_ptr: CData, with_metadata: bool = True, with_related: bool = True
+) -> Optional[MemoryResult]:
     """Copy C memory result structure to Python object.
 
+    ``related`` holds ``GV_MemoryMetadata`` records rather than nested
+    results, so the copy is a single flat pass: each related record becomes
+    a metadata-only MemoryResult.
+
     Args:
         c_result_ptr: CFFI pointer to GV_MemoryResult structure.
+        with_metadata: Copy the result's metadata; ``metadata`` is None otherwise.
+        with_related: Copy the related records; ``related`` is empty otherwise.
 
     Returns:
-        Python MemoryResult object, or None on error.
+        Python MemoryResult object, or None if the pointer is NULL.
     """
-    if c_result_ptr == ffi.NULL:
+    null = ffi.NULL
+    if c_result_ptr == null:
         return None
 
-    try:
-        memory_id = ffi.string(c_result_ptr.memory_id).decode("utf-8") if c_result_ptr.memory_id != ffi.NULL else ""
-        content = ffi.string(c_result_ptr.content).decode("utf-8") if c_result_ptr.content != ffi.NULL else ""
-        
-        metadata = _copy_memory_metadata(c_result_ptr.metadata) if c_result_ptr.metadata != ffi.NULL else None
-        
-        related = []
-        if c_result_ptr.related != ffi.NULL and c_result_ptr.related_count > 0:
-            for i in range(c_result_ptr.related_count):
-                if c_result_ptr.related[i] != ffi.NULL:
-                    rel = _copy_memory_result(c_result_ptr.related[i])
-                    if rel:
-                        related.append(rel)
-        
-        return MemoryResult(
-            memory_id=memory_id,
-            content=content,
-            relevance_score=float(c_result_ptr.relevance_score),
-            distance=float(c_result_ptr.distance),
-            metadata=metadata,
-            related=tuple(related)
-        )
-    except (AttributeError, TypeError, ValueError, UnicodeDecodeError):
-        return None
+    string = ffi.string
+    c_str = c_result_ptr.memory_id
+    memory_id = string(c_str).decode("utf-8", "replace") if c_str != null else ""
+    c_str = c_result_ptr.content
+    content = string(c_str).decode("utf-8", "replace") if c_str != null else ""
+    return _build_memory_result(c_result_ptr, memory_id, content, with_metadata, with_related)
+
+
+def _build_memory_result(
+    c_result_ptr: CData, memory_id: str, content: str, with_metadata: bool, with_related: bool
+) -> MemoryResult:
+    """Build a MemoryResult from already-decoded text plus the C struct's other fields."""
+    null = ffi.NULL
+    c_meta = c_result_ptr.metadata if with_metadata else null
+    metadata = _copy_memory_metadata(c_meta) if c_meta != null else None
+
+    related = []
+    c_related = c_result_ptr.related if with_related else null
+    if c_related != null:
+        for i in range(c_result_ptr.related_count):
+            rel = _copy_memory_metadata(c_related[i])
+            if rel is not None:
+                related.append(MemoryResult(memory_id=rel.memory_id or "", content="",
+                                            relevance_score=0.0, distance=0.0, metadata=rel))
+
+    return MemoryResult(
+        memory_id=memory_id,
+        content=content,
+        relevance_score=c_result_ptr.relevance_score,
+        distance=c_result_ptr.distance,
+        metadata=metadata,
+        related=tuple(related)
+    )
+
+
+def _copy_memory_results(
+    c_results: CData, count: int, with_metadata: bool = True, with_related: bool = True
+) -> list[MemoryResult]:
+    """Copy the first *count* entries of a ``GV_MemoryResult[]`` and free them in C.
+
+    C joins every id and content into one buffer first, so the text of a
+    whole page is read with one copy and one decode instead of two
+    ``ffi.string`` calls per result.
+    """
+    if count <= 0:
+        return []
+    size = _scratch_cell("size_t *")
+    packed = lib.gv_memory_results_pack_text(c_results, count, size)
+    if packed == ffi.NULL:
+        for i in range(count):
+            _gv_memory_result_free(c_results + i)
+        raise MemoryError("failed to read memory results")
+    text = ffi.unpack(packed, size[0]).decode("utf-8", "replace").split("\0")
+    _gv_free(packed)
+
+    build = _build_memory_result
+    free = _gv_memory_result_free
+    out: list[MemoryResult] = []
+    for i in range(count):
+        c_result = c_results + i
+        out.append(build(c_result, text[2 * i], text[2 * i + 1], with_metadata, with_related))
+        free(c_result)
+    return out
+
+
+def _take_memory_ids(memory_ids_ptr: CData, count: int, embeddings: CData) -> list[str]:
+    """Decode the ids returned by a memory extraction or batch add and free the C arrays.
+
+    C joins the ids into one NUL-separated buffer (freeing the id array), so
+    reading them costs one copy and one decode however many there are.
+    """
+    null = ffi.NULL
+    if embeddings != null:
+        _gv_free(embeddings)
+    if memory_ids_ptr == null:
+        return []
+    size = _scratch_cell("size_t *")
+    packed = lib.gv_memory_ids_pack(memory_ids_ptr, count, size)
+    if packed == null:
+        raise MemoryError("failed to read memory ids")
+    data = ffi.unpack(packed, size[0])
+    _gv_free(packed)
+    return data.decode("utf-8").split("\0") if data else []
 
 
 class MemoryLayer:
@@ -1990,6 +2993,7 @@ class MemoryLayer:
     _owned: bool
     _retry_policy: RetryPolicy
     _c_refs: list
+    _search_bufs: threading.local
 
     def __init__(self, db: Database, config: Optional[MemoryLayerConfig] = None) -> None:
         if db._closed:
@@ -1999,18 +3003,22 @@ class MemoryLayer:
             config = MemoryLayerConfig()
         self._retry_policy = config.retry if config.retry is not None else db._retry_policy
         self._c_refs = []
-
-        c_config = ffi.new("GV_MemoryLayerConfig *")
-        c_config.extraction_threshold = config.extraction_threshold
-        c_config.consolidation_threshold = config.consolidation_threshold
-        c_config.default_strategy = int(config.default_strategy)
-        c_config.enable_temporal_weighting = 1 if config.enable_temporal_weighting else 0
-        c_config.enable_relationship_retrieval = 1 if config.enable_relationship_retrieval else 0
-        c_config.max_related_memories = config.max_related_memories
-        c_config.use_llm_extraction = 1 if config.use_llm_extraction else 0
-        c_config.use_llm_consolidation = 1 if config.use_llm_consolidation else 0
-        c_config.context_graph_config = ffi.NULL
-        c_config.enable_context_graph = 0
+        self._search_bufs = threading.local()
+
+        # One C call fills every field (pointers cleared) instead of one
+        # CFFI attribute store per field.
+        c_config = _new_uncleared("GV_MemoryLayerConfig *")
+        lib.gv_memory_layer_config_pack(
+            c_config,
+            config.extraction_threshold,
+            config.consolidation_threshold,
+            config.default_strategy,
+            1 if config.enable_temporal_weighting else 0,
+            1 if config.enable_relationship_retrieval else 0,
+            config.max_related_memories,
+            1 if config.use_llm_extraction else 0,
+            1 if config.use_llm_consolidation else 0,
+        )
 
         if config.enable_context_graph:
             cg_cfg = config.context_graph_config or ContextGraphConfig()
@@ -2027,8 +3035,6 @@ class MemoryLayer:
             c_llm_config, _llm_refs = config.llm_config._to_c_config()
             self._c_refs.extend(_llm_refs)
             c_config.llm_config = c_llm_config
-        else:
-            c_config.llm_config = ffi.NULL
         
         self._layer = lib.gv_memory_layer_create(db._db, c_config)
         if self._layer == ffi.NULL:
@@ -2047,6 +3053,7 @@ class MemoryLayer:
         obj._closed = False
         obj._owned = False
         obj._retry_policy = db._retry_policy
+        obj._search_bufs = threading.local()
         return obj
 
     def __enter__(self) -> MemoryLayer:
@@ -2067,24 +3074,42 @@ class MemoryLayer:
                 lib.gv_memory_layer_destroy(self._layer)
             self._layer = ffi.NULL
             self._closed = True
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
     
+    def _embedding_cdata(self, embedding: Sequence[float], label: str) -> CData:
+        """Marshal *embedding* and check its length once, on the C buffer."""
+        c_embedding = _as_float_cdata(embedding)
+        n = len(c_embedding)
+        dim = self._db.dimension
+        if n != dim:
+            raise ValueError(f"{label} dimension {n} does not match database dimension {dim}")
+        return c_embedding
+
     def add(
         self,
-        content: str,
+        content: str | bytes,
         embedding: Sequence[float],
         metadata: Optional[MemoryMetadata] = None,
         *,
         ingest_context: bool = True,
     ) -> str:
+        # Encode once up front (UTF-8 ``bytes`` are used as given) so retries
+        # do not re-encode long content.
+        c_content = content.encode() if isinstance(content, str) else content
         return call_with_retry(
-            lambda: self._add_once(content, embedding, metadata, ingest_context=ingest_context),
+            lambda: self._add_once(c_content, embedding, metadata, ingest_context=ingest_context),
             self._retry_policy,
             operation="memory_add",
         )
 
     def _add_once(
         self,
-        content: str,
+        content: bytes,
         embedding: Sequence[float],
         metadata: Optional[MemoryMetadata],
         *,
@@ -2093,15 +3118,13 @@ class MemoryLayer:
         if self._closed:
             raise ValueError("Memory layer is closed")
         
-        if len(embedding) != self._db.dimension:
-            raise ValueError(f"Embedding dimension {len(embedding)} does not match database dimension {self._db.dimension}")
-        
-        c_embedding = ffi.new("float[]", embedding)
-        c_meta = _create_c_metadata(metadata) if metadata else ffi.NULL
+        c_embedding = self._embedding_cdata(embedding, "Embedding")
+
+        c_meta, _meta_refs = _create_c_metadata(metadata)
         
-        memory_id_ptr = lib.gv_memory_add_opts(
+        memory_id_ptr = _gv_memory_add_opts(
             self._layer,
-            content.encode(),
+            content,
             c_embedding,
             c_meta,
             1 if ingest_context else 0,
@@ -2110,72 +3133,116 @@ class MemoryLayer:
             raise RuntimeError("Failed to add memory")
         
         memory_id = ffi.string(memory_id_ptr).decode("utf-8")
-        lib.gv_free(memory_id_ptr)
+        _gv_free(memory_id_ptr)
         
         return memory_id
     
-    def extract_from_conversation(self, conversation: str, conversation_id: Optional[str] = None) -> list[str]:
+    def add_many(
+        self,
+        contents: Sequence[str | bytes],
+        embeddings: Iterable[Sequence[float]],
+        metadatas: Optional[Sequence[Optional[MemoryMetadata]]] = None,
+        *,
+        ingest_context: bool = True,
+    ) -> list[str]:
+        """Add several memories with a single call into the C library.
+
+        Args:
+            contents: Memory content strings (or UTF-8 ``bytes``).
+            embeddings: One embedding per content, accepted in the same forms
+                as :meth:`Database.add_vectors`; a ``(n, dimension)`` float32
+                ndarray is passed to C without copying.
+            metadatas: Optional per-memory metadata; entries may be None.
+            ingest_context: As in :meth:`add`.
+
+        Returns:
+            The new memory ids, in input order.
+
+        Raises:
+            ValueError: If *embeddings* or *metadatas* do not line up with
+                *contents*.
+            RuntimeError: If a memory cannot be added. Memories before it in
+                the batch stay added.
+        """
+        if self._closed:
+            raise ValueError("Memory layer is closed")
+        count = len(contents)
+        if count == 0:
+            return []
+        dim = self._db.dimension
+        c_embeddings = _float32_view(embeddings, dim)
+        if c_embeddings is None:
+            c_embeddings = ffi.from_buffer("float[]", _flatten_float32(embeddings, dim))
+        if len(c_embeddings) != count * dim:
+            raise ValueError(f"expected {count} embeddings of dimension {dim}, got {len(c_embeddings)} floats")
+
+        refs: list = []
+        c_contents = ffi.new("char *[]", _cstr_block(contents, refs))
+        c_metas = ffi.NULL
+        if metadatas is not None:
+            if len(metadatas) != count:
+                raise ValueError(f"expected {count} metadata entries, got {len(metadatas)}")
+            c_metas = ffi.new("GV_MemoryMetadata *[]", count)
+            for i, meta in enumerate(metadatas):
+                c_metas[i], meta_refs = _create_c_metadata(meta)
+                refs.append(meta_refs)
+
+        added_ptr = _scratch_cell("size_t *")
+        memory_ids_ptr = lib.gv_memory_add_many(
+            self._layer, c_contents, count, c_embeddings, c_metas,
+            1 if ingest_context else 0, added_ptr,
+        )
+        added = added_ptr[0]
+        memory_ids = _take_memory_ids(memory_ids_ptr, added, ffi.NULL)
+        if memory_ids_ptr == ffi.NULL:
+            raise RuntimeError("Failed to add memories")
+        if added != count:
+            raise RuntimeError(f"Failed to add memory {added} of {count}; {added} were added")
+        return memory_ids
+
+    @staticmethod
+    def _extract_out_cells() -> tuple[CData, CData]:
+        """Return this thread's cleared ``(float **, size_t *)`` extraction out-params.
+
+        C leaves them untouched on some early returns, so they are reset here
+        to keep a previous call's embeddings pointer from being freed twice.
+        """
+        embeddings_ptr = _scratch_cell("float **")
+        count_ptr = _scratch_cell("size_t *")
+        embeddings_ptr[0] = ffi.NULL
+        count_ptr[0] = 0
+        return embeddings_ptr, count_ptr
+
+    def extract_from_conversation(self, conversation: str | bytes, conversation_id: Optional[str] = None) -> list[str]:
         if self._closed:
             raise ValueError("Memory layer is closed")
         
         conv_id_bytes = conversation_id.encode() if conversation_id else ffi.NULL
-        embeddings_ptr = ffi.new("float**")
-        count_ptr = ffi.new("size_t *")
+        embeddings_ptr, count_ptr = self._extract_out_cells()
         
         memory_ids_ptr = lib.gv_memory_extract_from_conversation(
-            self._layer, conversation.encode(), conv_id_bytes, embeddings_ptr, count_ptr
+            self._layer, conversation.encode() if isinstance(conversation, str) else conversation, conv_id_bytes, embeddings_ptr, count_ptr
         )
-        
-        if memory_ids_ptr == ffi.NULL:
-            return []
-        
-        count = int(count_ptr[0])
-        memory_ids = []
-        for i in range(count):
-            if memory_ids_ptr[i] != ffi.NULL:
-                memory_ids.append(ffi.string(memory_ids_ptr[i]).decode("utf-8"))
-                lib.gv_free(memory_ids_ptr[i])
-        
-        lib.gv_free(memory_ids_ptr)
-        if embeddings_ptr[0] != ffi.NULL:
-            lib.gv_free(embeddings_ptr[0])
-        
-        return memory_ids
+        return _take_memory_ids(memory_ids_ptr, count_ptr[0], embeddings_ptr[0])
     
-    def extract_from_text(self, text: str, source: Optional[str] = None) -> list[str]:
+    def extract_from_text(self, text: str | bytes, source: Optional[str] = None) -> list[str]:
         if self._closed:
             raise ValueError("Memory layer is closed")
         
         source_bytes = source.encode() if source else ffi.NULL
-        embeddings_ptr = ffi.new("float**")
-        count_ptr = ffi.new("size_t *")
+        embeddings_ptr, count_ptr = self._extract_out_cells()
         
         memory_ids_ptr = lib.gv_memory_extract_from_text(
-            self._layer, text.encode(), source_bytes, embeddings_ptr, count_ptr
+            self._layer, text.encode() if isinstance(text, str) else text, source_bytes, embeddings_ptr, count_ptr
         )
-        
-        if memory_ids_ptr == ffi.NULL:
-            return []
-        
-        count = int(count_ptr[0])
-        memory_ids = []
-        for i in range(count):
-            if memory_ids_ptr[i] != ffi.NULL:
-                memory_ids.append(ffi.string(memory_ids_ptr[i]).decode("utf-8"))
-                lib.gv_free(memory_ids_ptr[i])
-        
-        lib.gv_free(memory_ids_ptr)
-        if embeddings_ptr[0] != ffi.NULL:
-            lib.gv_free(embeddings_ptr[0])
-        
-        return memory_ids
+        return _take_memory_ids(memory_ids_ptr, count_ptr[0], embeddings_ptr[0])
     
     def consolidate(self, threshold: Optional[float] = None, strategy: Optional[ConsolidationStrategy] = None) -> int:
         if self._closed:
             raise ValueError("Memory layer is closed")
         
         actual_threshold = threshold if threshold is not None else -1.0
-        actual_strategy = int(strategy) if strategy is not None else -1
+        actual_strategy = strategy if strategy is not None else -1
         
         result = lib.gv_memory_consolidate(self._layer, actual_threshold, actual_strategy)
         if result < 0:
@@ -2183,27 +3250,75 @@ class MemoryLayer:
         
         return result
     
-    def search(self, query_embedding: Sequence[float], k: int = 10, distance: DistanceType = DistanceType.COSINE) -> list[MemoryResult]:
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        k: int = 10,
+        distance: DistanceType = DistanceType.COSINE,
+        *,
+        with_metadata: bool = True,
+        with_related: bool = True,
+    ) -> list[MemoryResult]:
+        """Search memories by embedding similarity.
+
+        Pass ``with_metadata=False`` / ``with_related=False`` when only ids,
+        content and scores are needed; the C-side metadata is then freed
+        without being copied into Python objects.
+        """
         if self._closed:
             raise ValueError("Memory layer is closed")
         
-        if len(query_embedding) != self._db.dimension:
-            raise ValueError(f"Query embedding dimension {len(query_embedding)} does not match database dimension {self._db.dimension}")
-        
-        c_embedding = ffi.new("float[]", query_embedding)
-        c_results = ffi.new("GV_MemoryResult[]", k)
+        c_embedding = self._embedding_cdata(query_embedding, "Query embedding")
+
+        c_results = self._result_buffer(k)
         
-        count = lib.gv_memory_search(self._layer, c_embedding, k, c_results, int(distance))
+        count = _gv_memory_search(self._layer, c_embedding, k, c_results, distance)
         if count < 0:
             raise RuntimeError("Failed to search memories")
         
-        results = []
-        for i in range(count):
-            result = _copy_memory_result(c_results + i)
-            if result:
-                results.append(result)
-            lib.gv_memory_result_free(c_results + i)
-        
+        return _copy_memory_results(c_results, count, with_metadata, with_related)
+
+    def search_ids_only(
+        self,
+        query_embedding: Sequence[float],
+        k: int = 10,
+        distance: DistanceType = DistanceType.COSINE,
+    ) -> list[tuple[str, float]]:
+        """Search memories, returning ``(memory_id, distance)`` pairs only.
+
+        Ranks like :meth:`search` but never builds MemoryResult objects; C
+        skips parsing metadata. Content is still copied there, since
+        importance reranking reads it.
+        """
+        if self._closed:
+            raise ValueError("Memory layer is closed")
+
+        c_embedding = self._embedding_cdata(query_embedding, "Query embedding")
+        dists = _new_uncleared("float[]", max(k, 1))
+        count_ptr = _scratch_cell("size_t *")
+
+        ids_ptr = lib.gv_memory_search_ids(self._layer, c_embedding, k, dists, distance, count_ptr)
+        if ids_ptr == ffi.NULL:
+            raise RuntimeError("Failed to search memories")
+        count = count_ptr[0]
+        # Ids are never NULL here, so an empty packed buffer with count == 1
+        # is a single result stored without a memory id.
+        ids = _take_memory_ids(ids_ptr, count, ffi.NULL) or [""] * count
+        return list(zip(ids, ffi.unpack(dists, count)))
+
+    def _result_buffer(self, k: int) -> CData:
+        """Return this thread's cached ``GV_MemoryResult[]`` with room for *k* results.
+
+        The buffer grows by at least doubling and is never shrunk. It is
+        only used with ``gv_memory_search``, which overwrites each returned
+        slot whole, and the slots are freed in C right after copying, so a
+        previous search's entries are never read again.
+        """
+        bufs = self._search_bufs
+        results = getattr(bufs, "results", None)
+        if results is None or len(results) < k:
+            size = max(k, 2 * len(results)) if results is not None else k
+            results = bufs.results = ffi.new("GV_MemoryResult[]", size)
         return results
 
     def search_advanced(
@@ -2221,14 +3336,12 @@ class MemoryLayer:
         memory_type: int = -1,
         source: Optional[str] = None,
         candidate_vector_indices: Optional[Sequence[int]] = None,
+        with_metadata: bool = True,
+        with_related: bool = True,
     ) -> list[MemoryResult]:
         if self._closed:
             raise ValueError("Memory layer is closed")
-        if len(query_embedding) != self._db.dimension:
-            raise ValueError(
-                f"Query embedding dimension {len(query_embedding)} does not match "
-                f"database dimension {self._db.dimension}"
-            )
+        c_embedding = self._embedding_cdata(query_embedding, "Query embedding")
         opts = ffi.new("GV_MemorySearchOptions *")
         opts[0] = lib.gv_memory_search_options_default()
         opts[0].temporal_weight = temporal_weight
@@ -2244,20 +3357,13 @@ class MemoryLayer:
             c_idx = ffi.new("size_t[]", list(candidate_vector_indices))
             opts[0].candidate_vector_indices = c_idx
             opts[0].candidate_count = len(candidate_vector_indices)
-        c_embedding = ffi.new("float[]", query_embedding)
         c_results = ffi.new("GV_MemoryResult[]", k)
-        count = lib.gv_memory_search_advanced(
-            self._layer, c_embedding, k, c_results, int(distance), opts,
+        count = _gv_memory_search_advanced(
+            self._layer, c_embedding, k, c_results, distance, opts,
         )
         if count < 0:
             raise RuntimeError("Failed to search memories (advanced)")
-        results: list[MemoryResult] = []
-        for i in range(count):
-            result = _copy_memory_result(c_results + i)
-            if result:
-                results.append(result)
-            lib.gv_memory_result_free(c_results + i)
-        return results
+        return _copy_memory_results(c_results, count, with_metadata, with_related)
     
     def get(self, memory_id: str) -> Optional[MemoryResult]:
         if self._closed:
@@ -2270,7 +3376,7 @@ class MemoryLayer:
             return None
         
         result = _copy_memory_result(c_result)
-        lib.gv_memory_result_free(c_result)
+        _gv_memory_result_free(c_result)
         return result
     
     def delete(self, memory_id: str) -> bool:
@@ -2291,13 +3397,8 @@ class MemoryLayer:
             raise ValueError("Memory layer is closed")
         c_embedding = ffi.NULL
         if embedding is not None:
-            if len(embedding) != self._db.dimension:
-                raise ValueError(
-                    f"Embedding dimension {len(embedding)} does not match "
-                    f"database dimension {self._db.dimension}"
-                )
-            c_embedding = ffi.new("float[]", list(embedding))
-        c_meta = _create_c_metadata(metadata) if metadata else ffi.NULL
+            c_embedding = self._embedding_cdata(embedding, "Embedding")
+        c_meta, _meta_refs = _create_c_metadata(metadata)
         result = lib.gv_memory_update(
             self._layer, memory_id.encode(), c_embedding, c_meta,
         )
@@ -2411,7 +3512,10 @@ class EntityType(IntEnum):
     USER = 6
 
 
-@dataclass
+_ENTITY_TYPE_BY_VALUE: dict[int, EntityType] = {t.value: t for t in EntityType}
+
+
+@dataclass(**_SLOTS)
 class GraphEntity:
     entity_id: Optional[str] = None
     name: str = ""
@@ -2425,34 +3529,50 @@ class GraphEntity:
     agent_id: Optional[str] = None
     run_id: Optional[str] = None
 
-    def _to_c_entity(self) -> CData:
+    def __post_init__(self) -> None:
+        # Keep embeddings as packed float32 (4 bytes per value instead of a
+        # boxed float) so _to_c_entity can hand them to C without copying;
+        # embedding_dim always mirrors the stored length.
+        if self.embedding is not None:
+            if _float32_view(self.embedding) is None:
+                self.embedding = array("f", self.embedding)
+            self.embedding_dim = len(self.embedding)
+
+    def _to_c_entity(self, c_entity: Optional[CData] = None) -> tuple[CData, list]:
         """Convert to C entity structure.
 
+        The strings share one :func:`_cstr_block` buffer, so each entity
+        costs a single backing allocation rather than one per field.
+
+        Args:
+            c_entity: ``GV_GraphEntity *`` to fill in place (e.g. a slot of a
+                batch array); a new zeroed struct is allocated when omitted.
+
         Returns:
-            CFFI pointer to GV_GraphEntity structure.
+            ``(c_entity, refs)``; keep *refs* alive while C reads the struct.
         """
-        c_entity = ffi.new("GV_GraphEntity *")
-        if self.entity_id:
-            c_entity.entity_id = ffi.new("char[]", self.entity_id.encode())
-        if self.name:
-            c_entity.name = ffi.new("char[]", self.name.encode())
-        c_entity.entity_type = int(self.entity_type)
+        if c_entity is None:
+            c_entity = ffi.new("GV_GraphEntity *")
+        refs: list = []
+        (c_entity.entity_id, c_entity.name, c_entity.user_id,
+         c_entity.agent_id, c_entity.run_id) = _cstr_block(
+            (self.entity_id or None, self.name or None, self.user_id or None,
+             self.agent_id or None, self.run_id or None),
+            refs,
+        )
+        c_entity.entity_type = self.entity_type
         if self.embedding:
-            c_entity.embedding = ffi.new("float[]", self.embedding)
-            c_entity.embedding_dim = len(self.embedding)
+            c_embedding = _as_float_cdata(self.embedding)
+            refs.append(c_embedding)
+            c_entity.embedding = c_embedding
+            c_entity.embedding_dim = len(c_embedding)
         c_entity.created = self.created
         c_entity.updated = self.updated
         c_entity.mentions = self.mentions
-        if self.user_id:
-            c_entity.user_id = ffi.new("char[]", self.user_id.encode())
-        if self.agent_id:
-            c_entity.agent_id = ffi.new("char[]", self.agent_id.encode())
-        if self.run_id:
-            c_entity.run_id = ffi.new("char[]", self.run_id.encode())
-        return c_entity
+        return c_entity, refs
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GraphRelationship:
     relationship_id: Optional[str] = None
     source_entity_id: str = ""
@@ -2462,36 +3582,32 @@ class GraphRelationship:
     updated: int = 0
     mentions: int = 0
 
-    def _to_c_relationship(self) -> CData:
+    def _to_c_relationship(self, c_rel: Optional[CData] = None) -> tuple[CData, list]:
         """Convert to C relationship structure.
 
+        Args:
+            c_rel: ``GV_GraphRelationship *`` to fill in place; a new zeroed
+                struct is allocated when omitted.
+
         Returns:
-            CFFI pointer to GV_GraphRelationship structure.
+            ``(c_rel, refs)``; keep *refs* alive while C reads the struct.
         """
-        c_rel = ffi.new("GV_GraphRelationship *")
-        if self.relationship_id:
-            c_rel.relationship_id = ffi.new("char[]", self.relationship_id.encode())
-        else:
-            c_rel.relationship_id = ffi.NULL
-        if self.source_entity_id:
-            c_rel.source_entity_id = ffi.new("char[]", self.source_entity_id.encode())
-        else:
-            c_rel.source_entity_id = ffi.NULL
-        if self.destination_entity_id:
-            c_rel.destination_entity_id = ffi.new("char[]", self.destination_entity_id.encode())
-        else:
-            c_rel.destination_entity_id = ffi.NULL
-        if self.relationship_type:
-            c_rel.relationship_type = ffi.new("char[]", self.relationship_type.encode())
-        else:
-            c_rel.relationship_type = ffi.NULL
+        if c_rel is None:
+            c_rel = ffi.new("GV_GraphRelationship *")
+        refs: list = []
+        (c_rel.relationship_id, c_rel.source_entity_id,
+         c_rel.destination_entity_id, c_rel.relationship_type) = _cstr_block(
+            (self.relationship_id or None, self.source_entity_id or None,
+             self.destination_entity_id or None, self.relationship_type or None),
+            refs,
+        )
         c_rel.created = self.created
         c_rel.updated = self.updated
         c_rel.mentions = self.mentions
-        return c_rel
+        return c_rel, refs
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GraphQueryResult:
     source_name: str = ""
     relationship_type: str = ""
@@ -2553,6 +3669,12 @@ class ContextGraph:
     _graph: CData
     _config: ContextGraphConfig
     _closed: bool
+    _result_bufs: threading.local
+    _emb_cache: OrderedDict[str, Sequence[float]]
+    _emb_cache_lock: threading.Lock
+
+    # Service embeddings kept across extract/add_entities calls, by name.
+    _EMB_CACHE_SIZE = 4096
 
     def __init__(self, config: Optional[ContextGraphConfig] = None) -> None:
         if config is None:
@@ -2564,6 +3686,9 @@ class ContextGraph:
             raise RuntimeError("Failed to create context graph")
         self._config = config
         self._closed = False
+        self._result_bufs = threading.local()
+        self._emb_cache = OrderedDict()
+        self._emb_cache_lock = threading.Lock()
 
     def __enter__(self) -> ContextGraph:
         return self
@@ -2610,9 +3735,10 @@ class ContextGraph:
         relationships_ptr = ffi.new("GV_GraphRelationship **")
         relationship_count_ptr = ffi.new("size_t *")
         
-        user_id_bytes = user_id.encode() if user_id else ffi.NULL
-        agent_id_bytes = agent_id.encode() if agent_id else ffi.NULL
-        run_id_bytes = run_id.encode() if run_id else ffi.NULL
+        # Scope ids repeat across calls; reuse their cached C strings.
+        user_id_bytes = _interned_cstr(user_id) if user_id else ffi.NULL
+        agent_id_bytes = _interned_cstr(agent_id) if agent_id else ffi.NULL
+        run_id_bytes = _interned_cstr(run_id) if run_id else ffi.NULL
         
         result = lib.gv_context_graph_extract(
             self._graph, text.encode(), 
@@ -2626,88 +3752,127 @@ class ContextGraph:
         
         entities = []
         if entities_ptr[0] != ffi.NULL:
+            # Only names whose entity came back without an embedding need one.
             entity_names = []
-            entity_indices = []
+            names = []
             for i in range(entity_count_ptr[0]):
                 c_entity = entities_ptr[0] + i
-                name = ffi.string(c_entity.name).decode("utf-8") if c_entity.name else ""
-                if name:
+                name = _decode_cstr(c_entity.name, "")
+                names.append(name)
+                if name and (c_entity.embedding == ffi.NULL or c_entity.embedding_dim == 0):
                     entity_names.append(name)
-                    entity_indices.append(i)
             
             embeddings_map: dict[str, Sequence[float]] = {}
             if use_batch_embeddings and self._config.embedding_service and entity_names:
-                try:
-                    batch_embeddings = self._config.embedding_service.generate_batch(entity_names)
-                    embeddings_map = {name: emb for name, emb in zip(entity_names, batch_embeddings) if emb is not None}
-                except Exception:
-                    pass
-
-            for i in range(entity_count_ptr[0]):
-                c_entity = entities_ptr[0] + i
-                name = ffi.string(c_entity.name).decode("utf-8") if c_entity.name else ""
+                embeddings_map = self._batch_embeddings(entity_names)
+
+            # Per-entity work stays in this loop, so bind everything it
+            # touches to locals once.
+            base = entities_ptr[0]
+            null = ffi.NULL
+            buffer = ffi.buffer
+            decode = _decode_cstr
+            entity_types = _ENTITY_TYPE_BY_VALUE
+            free_entity = lib.gv_graph_entity_free
+            service = self._config.embedding_service if not use_batch_embeddings else None
+            generated: dict[str, Optional[Sequence[float]]] = {}
+            append = entities.append
+            for i, name in enumerate(names):
+                c_entity = base + i
 
                 embedding: Optional[Sequence[float]] = None
-                embedding_dim = 0
-                if c_entity.embedding != ffi.NULL and c_entity.embedding_dim > 0:
-                    embedding = [c_entity.embedding[j] for j in range(c_entity.embedding_dim)]
-                    embedding_dim = c_entity.embedding_dim
+                c_embedding = c_entity.embedding
+                c_dim = c_entity.embedding_dim
+                if c_embedding != null and c_dim > 0:
+                    # One bulk copy straight into packed float32 storage.
+                    embedding = array("f")
+                    embedding.frombytes(buffer(c_embedding, c_dim * embedding.itemsize))
                 elif name in embeddings_map:
                     embedding = embeddings_map[name]
-                    embedding_dim = len(embedding)
-                elif generate_embeddings and name:
-                    try:
-                        emb_result = generate_embeddings(name)
-                        if emb_result:
-                            embedding = emb_result
-                            embedding_dim = len(embedding)
-                    except Exception:
-                        pass
-                elif self._config.embedding_service and name:
-                    try:
-                        service_emb = self._config.embedding_service.generate(name)
-                        if service_emb:
-                            embedding = service_emb
-                            embedding_dim = len(embedding)
-                    except Exception:
-                        pass
-                
-                entity = GraphEntity(
-                    entity_id=ffi.string(c_entity.entity_id).decode("utf-8") if c_entity.entity_id else None,
+                elif name and (generate_embeddings or service):
+                    # Repeated mentions of a name are embedded once.
+                    if name not in generated:
+                        try:
+                            generated[name] = (generate_embeddings(name) if generate_embeddings
+                                               else service.generate(name)) or None
+                        except Exception:
+                            generated[name] = None
+                    embedding = generated[name]
+
+                append(GraphEntity(
+                    entity_id=decode(c_entity.entity_id),
                     name=name,
-                    entity_type=EntityType(c_entity.entity_type),
+                    entity_type=_enum_from_value(entity_types, EntityType, c_entity.entity_type),
                     embedding=embedding,
-                    embedding_dim=embedding_dim,
                     created=c_entity.created,
                     updated=c_entity.updated,
                     mentions=c_entity.mentions,
-                    user_id=ffi.string(c_entity.user_id).decode("utf-8") if c_entity.user_id else None,
-                    agent_id=ffi.string(c_entity.agent_id).decode("utf-8") if c_entity.agent_id else None,
-                    run_id=ffi.string(c_entity.run_id).decode("utf-8") if c_entity.run_id else None,
-                )
-                entities.append(entity)
-                lib.gv_graph_entity_free(c_entity)
-            lib.gv_free(entities_ptr[0])
+                    user_id=decode(c_entity.user_id),
+                    agent_id=decode(c_entity.agent_id),
+                    run_id=decode(c_entity.run_id),
+                ))
+                free_entity(c_entity)
+            lib.gv_free(base)
         
         relationships = []
         if relationships_ptr[0] != ffi.NULL:
+            base = relationships_ptr[0]
+            decode = _decode_cstr
+            free_rel = lib.gv_graph_relationship_free
             for i in range(relationship_count_ptr[0]):
-                c_rel = relationships_ptr[0] + i
-                rel = GraphRelationship(
-                    relationship_id=ffi.string(c_rel.relationship_id).decode("utf-8") if c_rel.relationship_id else None,
-                    source_entity_id=ffi.string(c_rel.source_entity_id).decode("utf-8") if c_rel.source_entity_id else "",
-                    destination_entity_id=ffi.string(c_rel.destination_entity_id).decode("utf-8") if c_rel.destination_entity_id else "",
-                    relationship_type=ffi.string(c_rel.relationship_type).decode("utf-8") if c_rel.relationship_type else "",
+                c_rel = base + i
+                relationships.append(GraphRelationship(
+                    relationship_id=decode(c_rel.relationship_id),
+                    source_entity_id=decode(c_rel.source_entity_id, ""),
+                    destination_entity_id=decode(c_rel.destination_entity_id, ""),
+                    relationship_type=decode(c_rel.relationship_type, ""),
                     created=c_rel.created,
                     updated=c_rel.updated,
                     mentions=c_rel.mentions,
-                )
-                relationships.append(rel)
-                lib.gv_graph_relationship_free(c_rel)
-            lib.gv_free(relationships_ptr[0])
+                ))
+                free_rel(c_rel)
+            lib.gv_free(base)
         
         return entities, relationships
     
+    def _batch_embeddings(self, names: Sequence[str]) -> dict[str, Sequence[float]]:
+        """Embed *names* through the service's batch API.
+
+        Names the first batch misses (a None entry, or every name if the call
+        raised) are retried together in one second batch, so a partial
+        failure never degrades into one ``generate`` call per name. Names
+        embedded by earlier calls are served from a bounded LRU cache and
+        never reach the service.
+        """
+        service = self._config.embedding_service
+        cache = self._emb_cache
+        out: dict[str, Sequence[float]] = {}
+        pending = []
+        with self._emb_cache_lock:
+            for name in dict.fromkeys(names):
+                emb = cache.get(name)
+                if emb is None:
+                    pending.append(name)
+                else:
+                    cache.move_to_end(name)
+                    out[name] = emb
+        hits = len(out)
+        for _ in range(2):
+            if not pending:
+                break
+            try:
+                batch = service.generate_batch(pending)
+            except Exception:
+                batch = []
+            out.update((name, emb) for name, emb in zip(pending, batch) if emb is not None)
+            pending = [name for name in pending if name not in out]
+        if len(out) > hits:
+            with self._emb_cache_lock:
+                cache.update(out)
+                while len(cache) > self._EMB_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return out
+
     def add_entities(
         self,
         entities: Sequence[GraphEntity],
@@ -2730,33 +3895,37 @@ class ContextGraph:
         ]
         
         if use_batch_embeddings and self._config.embedding_service and entities_needing_embeddings:
-            try:
-                entity_names = [entity.name for _, entity in entities_needing_embeddings]
-                batch_embeddings = self._config.embedding_service.generate_batch(entity_names)
-                for (i, entity), embedding in zip(entities_needing_embeddings, batch_embeddings):
-                    if embedding is not None:
-                        entity.embedding = embedding
-                        entity.embedding_dim = len(embedding)
-            except Exception:
-                pass
+            embeddings_map = self._batch_embeddings([entity.name for _, entity in entities_needing_embeddings])
+            for _, entity in entities_needing_embeddings:
+                embedding = embeddings_map.get(entity.name)
+                if embedding is not None:
+                    # Pack like GraphEntity.__post_init__ does.
+                    entity.embedding = array("f", embedding)
+                    entity.embedding_dim = len(embedding)
         
         if generate_embeddings or (self._config.embedding_service and not use_batch_embeddings):
-            for i, entity in entities_needing_embeddings:
-                if entity.embedding is None and entity.name:
-                    try:
-                        if generate_embeddings:
-                            entity.embedding = generate_embeddings(entity.name)
-                        elif self._config.embedding_service:
-                            entity.embedding = self._config.embedding_service.generate(entity.name)
-                        if entity.embedding:
-                            entity.embedding_dim = len(entity.embedding)
-                    except Exception:
-                        pass
+            # One call per distinct name; duplicates reuse the first result.
+            generate = generate_embeddings or self._config.embedding_service.generate
+            generated: dict[str, Optional[Sequence[float]]] = {}
+            for _, entity in entities_needing_embeddings:
+                name = entity.name
+                if entity.embedding is None and name:
+                    if name not in generated:
+                        try:
+                            generated[name] = generate(name) or None
+                        except Exception:
+                            generated[name] = None
+                    embedding = generated[name]
+                    if embedding is not None:
+                        entity.embedding = array("f", embedding)
+                        entity.embedding_dim = len(embedding)
         
+        # Fill the batch array in place; refs keeps every string block and
+        # embedding buffer alive until C has copied them.
         c_entities = ffi.new("GV_GraphEntity[]", len(entities))
+        refs: list = []
         for i, entity in enumerate(entities):
-            c_entity = entity._to_c_entity()
-            c_entities[i] = c_entity[0]
+            refs.extend(entity._to_c_entity(c_entities + i)[1])
         
         result = lib.gv_context_graph_add_entities(self._graph, c_entities, len(entities))
         if result != 0:
@@ -2772,9 +3941,9 @@ class ContextGraph:
             return
         
         c_rels = ffi.new("GV_GraphRelationship[]", len(relationships))
+        refs: list = []
         for i, rel in enumerate(relationships):
-            c_rel = rel._to_c_relationship()
-            c_rels[i] = c_rel[0]
+            refs.extend(rel._to_c_relationship(c_rels + i)[1])
         
         result = lib.gv_context_graph_add_relationships(self._graph, c_rels, len(relationships))
         if result != 0:
@@ -2801,11 +3970,12 @@ class ContextGraph:
             List of graph query results ordered by similarity.
         """
         c_embedding = ffi.new("float[]", query_embedding)
-        c_results = ffi.new("GV_GraphQueryResult[]", max_results)
+        c_results = self._result_buffer(max_results)
         
-        user_id_bytes = user_id.encode() if user_id else ffi.NULL
-        agent_id_bytes = agent_id.encode() if agent_id else ffi.NULL
-        run_id_bytes = run_id.encode() if run_id else ffi.NULL
+        # Scope ids repeat across calls; reuse their cached C strings.
+        user_id_bytes = _interned_cstr(user_id) if user_id else ffi.NULL
+        agent_id_bytes = _interned_cstr(agent_id) if agent_id else ffi.NULL
+        run_id_bytes = _interned_cstr(run_id) if run_id else ffi.NULL
         
         count = lib.gv_context_graph_search(
             self._graph, c_embedding, len(query_embedding),
@@ -2818,18 +3988,32 @@ class ContextGraph:
         
         results = []
         for i in range(count):
+            c_result = c_results + i
             result = GraphQueryResult(
-                source_name=ffi.string(c_results[i].source_name).decode("utf-8") if c_results[i].source_name else "",
-                relationship_type=ffi.string(c_results[i].relationship_type).decode("utf-8") if c_results[i].relationship_type else "",
-                destination_name=ffi.string(c_results[i].destination_name).decode("utf-8") if c_results[i].destination_name else "",
-                similarity=c_results[i].similarity,
+                source_name=_decode_cstr(c_result.source_name, ""),
+                relationship_type=_decode_cstr(c_result.relationship_type, ""),
+                destination_name=_decode_cstr(c_result.destination_name, ""),
+                similarity=c_result.similarity,
             )
             results.append(result)
-            lib.gv_graph_query_result_free(c_results + i)
+            lib.gv_graph_query_result_free(c_result)
         
         return results
 
-    
+    def _result_buffer(self, max_results: int) -> CData:
+        """Return this thread's cached ``GV_GraphQueryResult[]`` with room for *max_results*.
+
+        The buffer grows by at least doubling and is never shrunk. Search and
+        get_related overwrite every slot they return, and each slot is freed
+        (and zeroed) in C right after it is copied.
+        """
+        bufs = self._result_bufs
+        results = getattr(bufs, "results", None)
+        if results is None or len(results) < max_results:
+            size = max(max_results, 2 * len(results)) if results is not None else max_results
+            results = bufs.results = ffi.new("GV_GraphQueryResult[]", size)
+        return results
+
     def get_related(self, entity_id: str, max_depth: int = 3, max_results: int = 10) -> list[GraphQueryResult]:
         """Get related entities for a given entity.
 
@@ -2841,7 +4025,7 @@ class ContextGraph:
         Returns:
             List of graph query results representing related entities.
         """
-        c_results = ffi.new("GV_GraphQueryResult[]", max_results)
+        c_results = self._result_buffer(max_results)
 
         count = lib.gv_context_graph_get_related(
             self._graph, entity_id.encode(), max_depth, c_results, max_results
@@ -2852,14 +4036,15 @@ class ContextGraph:
 
         results = []
         for i in range(count):
+            c_result = c_results + i
             result = GraphQueryResult(
-                source_name=ffi.string(c_results[i].source_name).decode("utf-8") if c_results[i].source_name else "",
-                relationship_type=ffi.string(c_results[i].relationship_type).decode("utf-8") if c_results[i].relationship_type else "",
-                destination_name=ffi.string(c_results[i].destination_name).decode("utf-8") if c_results[i].destination_name else "",
-                similarity=c_results[i].similarity,
+                source_name=_decode_cstr(c_result.source_name, ""),
+                relationship_type=_decode_cstr(c_result.relationship_type, ""),
+                destination_name=_decode_cstr(c_result.destination_name, ""),
+                similarity=c_result.similarity,
             )
             results.append(result)
-            lib.gv_graph_query_result_free(c_results + i)
+            lib.gv_graph_query_result_free(c_result)
 
         return results
 
@@ -2871,7 +4056,7 @@ class GPUDistanceMetric(IntEnum):
     MANHATTAN = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class GPUDeviceInfo:
     device_id: int
     name: str
@@ -2884,7 +4069,7 @@ class GPUDeviceInfo:
     warp_size: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class GPUStats:
     total_searches: int
     total_vectors_processed: int
@@ -2909,7 +4094,7 @@ class GPUConfig:
     memory_allow_growth: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GPUSearchParams:
     metric: GPUDistanceMetric = GPUDistanceMetric.EUCLIDEAN
     k: int = 10
@@ -3011,11 +4196,16 @@ class GPUContext:
         return ffi.string(err).decode("utf-8")
 
 
+# Index value C uses for an unfilled k-NN slot.
+_SIZE_MAX = int(ffi.cast("size_t", -1))
+
+
 class GPUIndex:
     """GPU index for accelerated k-NN search."""
 
     _index: CData
     _closed: bool
+    _search_bufs: threading.local
 
     def __init__(self, ctx: GPUContext, vectors: Sequence[Sequence[float]] | None = None,
                  db: Database | None = None) -> None:
@@ -3024,8 +4214,8 @@ class GPUIndex:
             if count == 0:
                 raise ValueError("vectors cannot be empty")
             dimension = len(vectors[0])
-            flat = [v for vec in vectors for v in vec]
-            vec_buf = ffi.new("float[]", flat)
+            vec_buf = self._rows_cdata(vectors, dimension)
+            count = len(vec_buf) // dimension
             self._index = lib.gv_gpu_index_create(ctx._ctx, vec_buf, count, dimension)
         elif db is not None:
             self._index = lib.gv_gpu_index_from_db(ctx._ctx, db._db)
@@ -3034,6 +4224,7 @@ class GPUIndex:
         if self._index == ffi.NULL:
             raise RuntimeError("Failed to create GPU index")
         self._closed = False
+        self._search_bufs = threading.local()
 
     def __enter__(self) -> "GPUIndex":
         return self
@@ -3047,27 +4238,90 @@ class GPUIndex:
             self._index = ffi.NULL
             self._closed = True
 
+    @staticmethod
+    def _rows_cdata(vectors: Sequence[Sequence[float]], dimension: int) -> CData:
+        """Marshal rows of *dimension* floats into one C ``float[]``.
+
+        float32 buffers are passed through without copying; anything else is
+        packed by :func:`_flatten_float32`, which also rejects ragged rows.
+        """
+        buf = _float32_view(vectors, dimension)
+        if buf is None:
+            buf = ffi.from_buffer("float[]", _flatten_float32(vectors, dimension))
+        if dimension <= 0 or len(buf) % dimension:
+            raise ValueError(f"expected vectors of dim {dimension}")
+        return buf
+
     def add(self, vectors: Sequence[Sequence[float]]) -> None:
-        count = len(vectors)
-        flat = [v for vec in vectors for v in vec]
-        vec_buf = ffi.new("float[]", flat)
-        if lib.gv_gpu_index_add(self._index, vec_buf, count) != 0:
+        dimension = self.info()[1]
+        vec_buf = self._rows_cdata(vectors, dimension)
+        if lib.gv_gpu_index_add(self._index, vec_buf, len(vec_buf) // dimension) != 0:
             raise RuntimeError("Failed to add vectors to GPU index")
 
-    def search(self, query: Sequence[float], params: GPUSearchParams) -> tuple[list[int], list[float]]:
-        c_params = ffi.new("GV_GPUSearchParams *", {
+    @staticmethod
+    def _c_search_params(params: GPUSearchParams) -> CData:
+        return ffi.new("GV_GPUSearchParams *", {
             "metric": int(params.metric),
             "k": params.k,
             "radius": params.radius,
             "use_precomputed_norms": 1 if params.use_precomputed_norms else 0,
         })
-        indices = ffi.new("size_t[]", params.k)
-        distances = ffi.new("float[]", params.k)
-        query_buf = ffi.new("float[]", list(query))
+
+    def search(self, query: Sequence[float], params: GPUSearchParams) -> tuple[list[int], list[float]]:
+        c_params = self._c_search_params(params)
+        indices, distances = self._search_buffers(params.k)
+        query_buf = _as_float_cdata(query)
         n = lib.gv_gpu_index_search(self._index, query_buf, c_params, indices, distances)
         if n < 0:
             raise RuntimeError("GPU index search failed")
-        return ([int(indices[i]) for i in range(n)], [float(distances[i]) for i in range(n)])
+        return (ffi.unpack(indices, n), ffi.unpack(distances, n))
+
+    def search_batch(
+        self, queries: Sequence[Sequence[float]], params: GPUSearchParams
+    ) -> list[tuple[list[int], list[float]]]:
+        """Search several queries with a single k-NN call.
+
+        All queries are marshalled into one buffer and sent to the device in
+        one transfer, rather than one round trip per :meth:`search`.
+
+        Returns:
+            One ``(indices, distances)`` pair per query, as from :meth:`search`.
+        """
+        dimension = self.info()[1]
+        qbuf = self._rows_cdata(queries, dimension)
+        nq = len(qbuf) // dimension
+        if nq == 0:
+            return []
+        k = params.k
+        indices = _new_uncleared("size_t[]", nq * k)
+        distances = _new_uncleared("float[]", nq * k)
+        if lib.gv_gpu_index_knn_search(self._index, qbuf, nq, self._c_search_params(params),
+                                       indices, distances) != 0:
+            raise RuntimeError("GPU index batch search failed")
+        # Unfilled slots (fewer than k hits) hold SIZE_MAX and sort last.
+        missing = _SIZE_MAX
+        all_indices = ffi.unpack(indices, nq * k)
+        all_distances = ffi.unpack(distances, nq * k)
+        out: list[tuple[list[int], list[float]]] = []
+        for start in range(0, nq * k, k):
+            row = all_indices[start:start + k]
+            n = k - row.count(missing)
+            out.append((row[:n], all_distances[start:start + n]))
+        return out
+
+    def _search_buffers(self, k: int) -> tuple[CData, CData]:
+        """Return this thread's cached ``(size_t[], float[])`` output arrays for *k* hits.
+
+        Both grow by at least doubling; only the first ``n`` entries written
+        by the C search are ever read back.
+        """
+        bufs = self._search_bufs
+        indices = getattr(bufs, "indices", None)
+        if indices is None or len(indices) < k:
+            size = max(k, 2 * len(indices)) if indices is not None else k
+            bufs.indices = ffi.new("size_t[]", size)
+            bufs.distances = ffi.new("float[]", size)
+        return bufs.indices, bufs.distances
 
     def info(self) -> tuple[int, int, int]:
         count = ffi.new("size_t *")
@@ -3970,7 +5224,7 @@ class Namespace:
     def add_vector(self, data: Sequence[float], metadata: dict[str, str] | None = None) -> None:
         if len(data) != self._dimension:
             raise ValueError(f"Expected dimension {self._dimension}, got {len(data)}")
-        vec_buf = ffi.new("float[]", list(data))
+        vec_buf = _as_float_cdata(data)
         if metadata:
             _ka: list = []
             n = len(metadata)
@@ -3988,7 +5242,7 @@ class Namespace:
     def search(self, query: Sequence[float], k: int, distance: DistanceType = DistanceType.COSINE) -> list[SearchHit]:
         if len(query) != self._dimension:
             raise ValueError(f"Expected dimension {self._dimension}, got {len(query)}")
-        query_buf = ffi.new("float[]", list(query))
+        query_buf = _as_float_cdata(query)
         results = ffi.new("GV_SearchResult[]", k)
         n = lib.gv_namespace_search(self._ns, query_buf, k, results, int(distance))
         if n < 0:
@@ -4385,7 +5639,7 @@ class HybridSearcher:
             self._closed = True
 
     def search(self, query_vector: Sequence[float] | None, query_text: str | None, k: int) -> list[HybridResult]:
-        vec_buf = ffi.new("float[]", list(query_vector)) if query_vector else ffi.NULL
+        vec_buf = _as_float_cdata(query_vector) if query_vector else ffi.NULL
         text_buf = query_text.encode() if query_text else ffi.NULL
         results = ffi.new("GV_HybridResult[]", k)
         n = lib.gv_hybrid_search(self._searcher, vec_buf, text_buf, k, results)
@@ -4401,7 +5655,7 @@ class HybridSearcher:
         ) for i in range(n)]
 
     def search_with_stats(self, query_vector: Sequence[float] | None, query_text: str | None, k: int) -> tuple[list[HybridResult], HybridStats]:
-        vec_buf = ffi.new("float[]", list(query_vector)) if query_vector else ffi.NULL
+        vec_buf = _as_float_cdata(query_vector) if query_vector else ffi.NULL
         text_buf = query_text.encode() if query_text else ffi.NULL
         results = ffi.new("GV_HybridResult[]", k)
         stats = ffi.new("GV_HybridStats *")
@@ -4428,7 +5682,7 @@ class HybridSearcher:
         return (result_list, stats_obj)
 
     def search_vector_only(self, query_vector: Sequence[float], k: int) -> list[HybridResult]:
-        vec_buf = ffi.new("float[]", list(query_vector))
+        vec_buf = _as_float_cdata(query_vector)
         results = ffi.new("GV_HybridResult[]", k)
         n = lib.gv_hybrid_search_vector_only(self._searcher, vec_buf, k, results)
         if n < 0:
@@ -4810,7 +6064,7 @@ class Transaction:
         out = ffi.new("float[]", dimension)
         if lib.gv_txn_get_vector(self._txn, index, out) != 0:
             raise RuntimeError("Vector not visible in this transaction")
-        return [out[i] for i in range(dimension)]
+        return ffi.unpack(out, dimension)
 
     @property
     def count(self) -> int:
@@ -5390,16 +6644,8 @@ class Schema:
 
     def validate(self, metadata: dict[str, str]) -> bool:
         n = len(metadata)
-        c_keys = ffi.new("char *[]", n)
-        c_values = ffi.new("char *[]", n)
-        _keepalive = []
-        for i, (k, v) in enumerate(metadata.items()):
-            ck = ffi.new("char[]", k.encode())
-            cv = ffi.new("char[]", v.encode())
-            c_keys[i] = ck
-            c_values[i] = cv
-            _keepalive.extend([ck, cv])
-        return lib.gv_schema_validate(self._schema, c_keys, c_values, n) == 0
+        arena, ptrs = _metadata_cstrs(metadata)
+        return lib.gv_schema_validate(self._schema, ptrs, ptrs + n, n) == 0
 
     def to_json(self) -> str:
         s = lib.gv_schema_to_json(self._schema)
@@ -5702,7 +6948,7 @@ class RemoteShardClient:
             raise ValueError(
                 f"query dimension {len(query_embedding)} != shard dimension {self.dimension}",
             )
-        c_query = ffi.new("float[]", list(query_embedding))
+        c_query = _as_float_cdata(query_embedding)
         resp = ffi.new("GV_GrpcSearchResponse *")
         rc = lib.gv_grpc_client_search(
             self.host.encode(),
@@ -5891,7 +7137,7 @@ class AutoEmbedder:
         if result == ffi.NULL:
             raise RuntimeError("Failed to embed text")
         dim = out_dim[0]
-        vec = [result[i] for i in range(dim)]
+        vec = ffi.unpack(result, dim)
         lib.gv_free(result)
         return vec
 
@@ -6619,13 +7865,13 @@ def mmr_rerank(
 ) -> list[MMRResult]:
     dim = len(query)
     n = len(candidate_indices)
-    q = ffi.new("float[]", list(query))
+    q = _as_float_cdata(query)
     flat = []
     for c in candidates:
         flat.extend(c)
     cands = ffi.new("float[]", flat)
     c_idx = ffi.new("size_t[]", list(candidate_indices))
-    c_dist = ffi.new("float[]", list(candidate_distances))
+    c_dist = _as_float_cdata(candidate_distances)
     c_cfg = ffi.new("GV_MMRConfig *")
     lib.gv_mmr_config_init(c_cfg)
     if config:
@@ -6736,7 +7982,7 @@ class QuantCodebook:
 
     def encode(self, vector: Sequence[float]) -> bytes:
         dim = len(vector)
-        c_vec = ffi.new("float[]", list(vector))
+        c_vec = _as_float_cdata(vector)
         code_sz = lib.gv_quant_code_size(self._cb, dim)
         codes = ffi.new("uint8_t[]", code_sz)
         if lib.gv_quant_encode(self._cb, c_vec, dim, codes) != 0:
@@ -6745,7 +7991,7 @@ class QuantCodebook:
 
     def distance(self, query: Sequence[float], codes: bytes) -> float:
         dim = len(query)
-        c_q = ffi.new("float[]", list(query))
+        c_q = _as_float_cdata(query)
         c_codes = ffi.new("uint8_t[]", codes)
         return lib.gv_quant_distance(self._cb, c_q, dim, c_codes)
 
@@ -6914,12 +8160,12 @@ class HNSWInlineIndex:
         self.close()
 
     def insert(self, vector: Sequence[float], label: int) -> None:
-        c_vec = ffi.new("float[]", list(vector))
+        c_vec = _as_float_cdata(vector)
         if lib.gv_hnsw_inline_insert(self._idx, c_vec, label) != 0:
             raise RuntimeError("HNSW inline insert failed")
 
     def search(self, query: Sequence[float], k: int, ef_search: int = 100) -> list[tuple[int, float]]:
-        c_q = ffi.new("float[]", list(query))
+        c_q = _as_float_cdata(query)
         labels = ffi.new("size_t[]", k)
         dists = ffi.new("float[]", k)
         rc = lib.gv_hnsw_inline_search(self._idx, c_q, k, ef_search, labels, dists)
@@ -7624,14 +8870,14 @@ class EmbeddedDB:
         self.close()
 
     def add(self, vector: Sequence[float]) -> int:
-        c_vec = ffi.new("float[]", list(vector))
+        c_vec = _as_float_cdata(vector)
         rc = lib.gv_embedded_add(self._db, c_vec)
         if rc < 0:
             raise RuntimeError("Failed to add vector")
         return rc
 
     def search(self, query: Sequence[float], k: int = 10, distance: DistanceType = DistanceType.EUCLIDEAN) -> list[EmbeddedResult]:
-        c_q = ffi.new("float[]", list(query))
+        c_q = _as_float_cdata(query)
         results = ffi.new("GV_EmbeddedResult[]", k)
         rc = lib.gv_embedded_search(self._db, c_q, k, distance.value, results)
         if rc < 0:
@@ -7705,7 +8951,7 @@ class CondManager:
         self.close()
 
     def update_vector(self, index: int, new_data: Sequence[float], conditions: Sequence[Condition]) -> ConditionalResult:
-        c_data = ffi.new("float[]", list(new_data))
+        c_data = _as_float_cdata(new_data)
         c_conds = ffi.new("GV_Condition[]", len(conditions))
         keepalive = []
         for i, cond in enumerate(conditions):
@@ -7748,7 +8994,7 @@ class CondManager:
         return lib.gv_cond_get_version(self._mgr, index)
 
     def migrate_embedding(self, index: int, new_embedding: Sequence[float], expected_version: int) -> ConditionalResult:
-        c_data = ffi.new("float[]", list(new_embedding))
+        c_data = _as_float_cdata(new_embedding)
         return ConditionalResult(lib.gv_cond_migrate_embedding(self._mgr, index, c_data, len(new_embedding), expected_version))
 
 
@@ -7790,16 +9036,16 @@ class TimeTravelManager:
         self.close()
 
     def record_insert(self, index: int, vector: Sequence[float]) -> int:
-        c_vec = ffi.new("float[]", list(vector))
+        c_vec = _as_float_cdata(vector)
         return lib.gv_tt_record_insert(self._mgr, index, c_vec, len(vector))
 
     def record_update(self, index: int, old_vector: Sequence[float], new_vector: Sequence[float]) -> int:
-        c_old = ffi.new("float[]", list(old_vector))
-        c_new = ffi.new("float[]", list(new_vector))
+        c_old = _as_float_cdata(old_vector)
+        c_new = _as_float_cdata(new_vector)
         return lib.gv_tt_record_update(self._mgr, index, c_old, c_new, len(old_vector))
 
     def record_delete(self, index: int, vector: Sequence[float]) -> int:
-        c_vec = ffi.new("float[]", list(vector))
+        c_vec = _as_float_cdata(vector)
         return lib.gv_tt_record_delete(self._mgr, index, c_vec, len(vector))
 
     def query_at_version(self, version_id: int, index: int, dimension: int) -> list[float]:
@@ -8064,7 +9310,7 @@ class Pipeline:
     def execute(self, query: Sequence[float], final_k: int = 10) -> list[PhasedResult]:
         if self.phase_count == 0:
             return []
-        c_q = ffi.new("float[]", list(query))
+        c_q = _as_float_cdata(query)
         results = ffi.new("GV_PhasedResult[]", final_k)
         rc = lib.gv_pipeline_execute(self._pipe, c_q, len(query), final_k, results)
         if rc < 0:
@@ -9102,7 +10348,7 @@ class DiscoveryAPI:
 
         qbuf = ffi.new("float[]", centroid)
         results = ffi.new("GV_SearchResult[]", k * cfg.oversample)
-        n = lib.gv_db_search(db._db, qbuf, k * cfg.oversample, results, cfg.distance_type)
+        n = _gv_db_search(db._db, qbuf, k * cfg.oversample, results, cfg.distance_type)
         if n < 0:
             raise RuntimeError("Discovery vector search failed")
         out: list[DiscoveryResult] = []
@@ -0,0 +1,340 @@
+"""Tables of the names re-exported from the ``gigavector`` package.
+
+``gigavector/__init__.py`` derives ``__all__`` from these and resolves each
+name lazily from its defining module on first access.
+"""
+
+# Public names re-exported from ._core.
+CORE_EXPORTS = (
+    "Database",
+    "DBStats",
+    "DistanceType",
+    "IndexType",
+    "suggest_index",
+    "SearchHit",
+    "Vector",
+    "HNSWConfig",
+    "IVFPQConfig",
+    "IVFFlatConfig",
+    "IVFDiskConfig",
+    "IVFSQ8Config",
+    "IVFTurboQuantConfig",
+    "TurboQuantConfig",
+    "TurboQuantRotation",
+    "PQConfig",
+    "LSHConfig",
+    "ScalarQuantConfig",
+    "SearchParams",
+    "ScrollEntry",
+    "LLM",
+    "LLMConfig",
+    "LLMError",
+    "LLMMessage",
+    "LLMProvider",
+    "LLMResponse",
+    "EmbeddingCache",
+    "EmbeddingConfig",
+    "EmbeddingProvider",
+    "EmbeddingService",
+    "ConsolidationStrategy",
+    "MemoryLink",
+    "MemoryLinkType",
+    "MemoryLayer",
+    "MemoryLayerConfig",
+    "MemoryMetadata",
+    "MemoryResult",
+    "MemoryType",
+    "ContextGraph",
+    "ContextGraphConfig",
+    "EntityType",
+    "GraphEntity",
+    "GraphQueryResult",
+    "GraphRelationship",
+    "GPUConfig",
+    "GPUContext",
+    "GPUDeviceInfo",
+    "GPUDistanceMetric",
+    "GPUIndex",
+    "GPUSearchParams",
+    "GPUStats",
+    "gpu_available",
+    "gpu_device_count",
+    "gpu_get_device_info",
+    "Server",
+    "ServerConfig",
+    "ServerError",
+    "ServerStats",
+    "serve_with_dashboard",
+    "BackupCompression",
+    "BackupHeader",
+    "BackupOptions",
+    "BackupResult",
+    "RestoreOptions",
+    "backup_create",
+    "backup_read_header",
+    "backup_restore",
+    "backup_restore_to_db",
+    "backup_verify",
+    "ShardConfig",
+    "ShardInfo",
+    "ShardManager",
+    "ShardState",
+    "ShardStrategy",
+    "ReplicaInfo",
+    "ReplicationConfig",
+    "ReplicationManager",
+    "ReplicationRole",
+    "ReplicationState",
+    "ReplicationStats",
+    "Cluster",
+    "ClusterConfig",
+    "ClusterStats",
+    "NodeInfo",
+    "NodeRole",
+    "NodeState",
+    "Namespace",
+    "NamespaceConfig",
+    "NamespaceInfo",
+    "NamespaceManager",
+    "NSIndexType",
+    "TTLConfig",
+    "TTLManager",
+    "TTLStats",
+    "BM25Config",
+    "BM25Index",
+    "BM25Result",
+    "BM25Stats",
+    "FusionType",
+    "HybridConfig",
+    "HybridResult",
+    "HybridSearcher",
+    "HybridStats",
+    "APIKey",
+    "AuthConfig",
+    "AuthManager",
+    "AuthResult",
+    "AuthType",
+    "Identity",
+    "JWTConfig",
+    "DocAggregation",
+    "DocSearchResult",
+    "MultiVecConfig",
+    "MultiVecIndex",
+    "SnapshotInfo",
+    "SnapshotManager",
+    "MVCCManager",
+    "Transaction",
+    "TxnStatus",
+    "CollectionStats",
+    "PlanStrategy",
+    "QueryOptimizer",
+    "QueryPlan",
+    "FieldType",
+    "PayloadIndex",
+    "PayloadOp",
+    "DedupConfig",
+    "DedupIndex",
+    "DedupResult",
+    "Migration",
+    "MigrationInfo",
+    "MigrationStatus",
+    "VersionInfo",
+    "VersionManager",
+    "ReadPolicy",
+    "BloomFilter",
+    "QueryTrace",
+    "TraceSpan",
+    "Cache",
+    "CacheConfig",
+    "CachePolicy",
+    "CacheStats",
+    "Schema",
+    "SchemaDiff",
+    "SchemaField",
+    "SchemaFieldType",
+    "Codebook",
+    "PointIDMap",
+    "TLSConfig",
+    "TLSContext",
+    "TLSVersion",
+    "ThresholdResult",
+    "search_with_threshold",
+    "NamedVectorStore",
+    "VectorFieldConfig",
+    "delete_by_filter",
+    "update_metadata_by_filter",
+    "count_by_filter",
+    "GrpcConfig",
+    "GrpcServer",
+    "GrpcStats",
+    "RemoteShardClient",
+    "AutoEmbedConfig",
+    "AutoEmbedder",
+    "AutoEmbedProvider",
+    "AutoEmbedStats",
+    "DiskANNConfig",
+    "DiskANNIndex",
+    "DiskANNStats",
+    "GroupedSearch",
+    "GroupHit",
+    "GroupSearchConfig",
+    "SearchGroup",
+    "GeoIndex",
+    "GeoPoint",
+    "GeoResult",
+    "LateInteractionConfig",
+    "LateInteractionIndex",
+    "LateInteractionResult",
+    "RecommendConfig",
+    "RecommendResult",
+    "Recommender",
+    "AliasInfo",
+    "AliasManager",
+    "VacuumConfig",
+    "VacuumManager",
+    "VacuumState",
+    "VacuumStats",
+    "ConsistencyLevel",
+    "ConsistencyManager",
+    "QuotaConfig",
+    "QuotaManager",
+    "QuotaResult",
+    "QuotaUsage",
+    "CompressionConfig",
+    "CompressionStats",
+    "CompressionType",
+    "Compressor",
+    "EventType",
+    "WebhookConfig",
+    "WebhookManager",
+    "WebhookStats",
+    "Permission",
+    "RBACManager",
+    "MMRConfig",
+    "MMRResult",
+    "mmr_rerank",
+    "RankExpr",
+    "RankSignal",
+    "RankedResult",
+    "QuantCodebook",
+    "QuantConfig",
+    "QuantMode",
+    "QuantType",
+    "FTConfig",
+    "FTIndex",
+    "FTLanguage",
+    "FTResult",
+    "ft_stem",
+    "HNSWInlineConfig",
+    "HNSWInlineIndex",
+    "HNSWRebuildConfig",
+    "HNSWRebuildStats",
+    "ONNXConfig",
+    "ONNXModel",
+    "Agent",
+    "AgentConfig",
+    "AgentResult",
+    "AgentType",
+    "MuveraConfig",
+    "MuveraEncoder",
+    "SSOConfig",
+    "SSOManager",
+    "SSOProvider",
+    "SSOToken",
+    "TenantInfo",
+    "TenantTier",
+    "TierThresholds",
+    "TieredManager",
+    "TieredTenantConfig",
+    "InferenceConfig",
+    "InferenceEngine",
+    "InferenceResult",
+    "JSONPathConfig",
+    "JSONPathIndex",
+    "JSONPathType",
+    "CDCConfig",
+    "CDCCursor",
+    "CDCEvent",
+    "CDCEventType",
+    "CDCStream",
+    "EmbeddedConfig",
+    "EmbeddedDB",
+    "EmbeddedIndexType",
+    "EmbeddedResult",
+    "ConditionType",
+    "ConditionalResult",
+    "Condition",
+    "CondManager",
+    "TimeTravelConfig",
+    "TimeTravelManager",
+    "TTVersionEntry",
+    "MediaConfig",
+    "MediaEntry",
+    "MediaStore",
+    "MediaType",
+    "SQLEngine",
+    "SQLResult",
+    "PhaseType",
+    "PhasedResult",
+    "Pipeline",
+    "PipelineStats",
+    "LearnedSparseConfig",
+    "LearnedSparseEntry",
+    "LearnedSparseIndex",
+    "LearnedSparseResult",
+    "LearnedSparseStats",
+    "GraphDBConfig",
+    "GraphPath",
+    "GraphDB",
+    "KGConfig",
+    "KGSearchResult",
+    "KGTriple",
+    "KGLinkPrediction",
+    "KGSubgraph",
+    "KGStats",
+    "KnowledgeGraph",
+    "FilterExpr",
+    "Field",
+    "ScrollIterator",
+    "DiscoveryAPI",
+    "DiscoveryConfig",
+    "DiscoveryResult",
+    "CollectionConfig",
+    "CollectionInfo",
+    "CollectionManager",
+    "TemporalEdge",
+    "TemporalKnowledgeGraph",
+    "GraphAugmentedHit",
+    "GraphSearchConfig",
+    "search_with_graph_expansion",
+    "RetentionConfig",
+    "RetentionRecord",
+    "RetentionScorer",
+    "MemoryStoreConfig",
+    "MemoryRecord",
+    "MemorySearchHit",
+    "MemoryStore",
+    "MultiQueryHit",
+    "search_multi_query",
+    "LinkedChunk",
+    "ExpandedSearchHit",
+    "PostingCatalog",
+    "PostingCacheStats",
+    "PostingPayloadType",
+    "PostingVector",
+    "EntityLinker",
+)
+
+# Public names re-exported from other submodules, mapped to their module.
+SUBMODULE_EXPORTS = {
+    "AsyncDatabase": ".async_api",
+    "DatabasePool": ".pool",
+    "Benchmark": ".benchmark",
+    "BenchmarkResult": ".benchmark",
+}
+
+# Reachable as ``gigavector.<name>`` but left out of ``__all__``, so star imports
+# do not pull in the dashboard's HTTP server. Prefer ``gigavector.dashboard``.
+UNLISTED_EXPORTS = {
+    "DashboardServer": ".dashboard.backend.server",
+}
@@ -228,8 +228,14 @@ int gv_db_search(const GV_Database *db, const float *query_data, size_t k,
 int gv_db_search_filtered(const GV_Database *db, const float *query_data, size_t k,
                           GV_SearchResult *results, GV_DistanceType distance_type,
                           const char *filter_key, const char *filter_value);
+int gv_db_add_vectors_sq8(GV_Database *db, const uint8_t *codes, size_t count, size_t dimension,
+                          const float *vmin, const float *vdelta);
+int gv_sq8_encode(const float *data, size_t count, size_t dimension,
+                  uint8_t *codes, float *vmin, float *vdelta);
 int gv_db_search_batch(const GV_Database *db, const float *queries, size_t qcount, size_t k,
                        GV_SearchResult *results, GV_DistanceType distance_type);
+size_t gv_search_results_pack(const GV_SearchResult *results, size_t count, size_t dimension,
+                              uint64_t *out_ids, float *out_distances, float *out_vectors);
 int gv_db_search_with_filter_expr(const GV_Database *db, const float *query_data, size_t k,
                                    GV_SearchResult *results, GV_DistanceType distance_type,
                                    const char *filter_expr);
@@ -243,6 +249,12 @@ int gv_db_add_sparse_vector(GV_Database *db, const uint32_t *indices, const floa
                             const char *metadata_key, const char *metadata_value);
 int gv_db_search_sparse(const GV_Database *db, const uint32_t *indices, const float *values,
                         size_t nnz, size_t k, GV_SearchResult *results, GV_DistanceType distance_type);
+int gv_db_add_sparse_vector_i8(GV_Database *db, const uint32_t *indices, const int8_t *codes,
+                               float scale, size_t nnz, size_t dimension,
+                               const char *metadata_key, const char *metadata_value);
+int gv_db_search_sparse_i8(const GV_Database *db, const uint32_t *indices, const int8_t *codes,
+                           float scale, size_t nnz, size_t k, GV_SearchResult *results,
+                           GV_DistanceType distance_type);
 int gv_db_range_search(const GV_Database *db, const float *query_data, float radius,
                        GV_SearchResult *results, size_t max_results, GV_DistanceType distance_type);
 int gv_db_range_search_filtered(const GV_Database *db, const float *query_data, float radius,
@@ -254,6 +266,8 @@ int gv_db_range_search_filtered(const GV_Database *db, const float *query_data,
 GV_Vector *gv_vector_create_from_data(size_t dimension, const float *data);
 int gv_vector_set_metadata(GV_Vector *vector, const char *key, const char *value);
 void gv_vector_destroy(GV_Vector *vector);
+int gv_metadata_flatten(const GV_Metadata *meta, char *out, size_t out_cap,
+                        size_t *written, size_t *count);
 
 // Index insertion functions
 int gv_kdtree_insert(GV_KDNode **root, GV_Vector *point, size_t depth);
@@ -358,6 +372,25 @@ void gv_db_set_compaction_interval(GV_Database *db, size_t interval_sec);
 void gv_db_set_wal_compaction_threshold(GV_Database *db, size_t threshold_bytes);
 void gv_db_set_deleted_ratio_threshold(GV_Database *db, double ratio);
 
+#define GV_DB_TUNE_EXACT_SEARCH_THRESHOLD 0x01u
+#define GV_DB_TUNE_FORCE_EXACT_SEARCH 0x02u
+#define GV_DB_TUNE_COSINE_NORMALIZED 0x04u
+#define GV_DB_TUNE_COMPACTION_INTERVAL 0x08u
+#define GV_DB_TUNE_WAL_COMPACTION_THRESHOLD 0x10u
+#define GV_DB_TUNE_DELETED_RATIO_THRESHOLD 0x20u
+
+typedef struct {
+    uint32_t fields;
+    size_t exact_search_threshold;
+    int force_exact_search;
+    int cosine_normalized;
+    size_t compaction_interval_sec;
+    size_t wal_compaction_threshold;
+    double deleted_ratio_threshold;
+} GV_DBTuning;
+
+int gv_db_configure(GV_Database *db, const GV_DBTuning *tuning);
+
 // Observability structures
 typedef struct {
     uint64_t *buckets;
@@ -432,6 +465,7 @@ typedef struct {
     int cache_write_5m_tokens;
     int cache_write_1h_tokens;
     int token_count;
+    size_t content_length;
 } GV_LLMResponse;
 
 typedef struct GV_LLM GV_LLM;
@@ -474,6 +508,7 @@ GV_EmbeddingCache *gv_embedding_cache_create(size_t max_size);
 void gv_embedding_cache_destroy(GV_EmbeddingCache *cache);
 int gv_embedding_cache_get(GV_EmbeddingCache *cache, const char *text, size_t *embedding_dim, const float **embedding);
 int gv_embedding_cache_put(GV_EmbeddingCache *cache, const char *text, size_t embedding_dim, const float *embedding);
+int gv_embedding_cache_put_batch(GV_EmbeddingCache *cache, const char *const *texts, size_t count, size_t embedding_dim, const float *embeddings);
 void gv_embedding_cache_clear(GV_EmbeddingCache *cache);
 void gv_embedding_cache_stats(GV_EmbeddingCache *cache, size_t *size, uint64_t *hits, uint64_t *misses);
 const char *gv_embedding_get_last_error(GV_EmbeddingService *service);
@@ -618,12 +653,17 @@ typedef struct GV_MemoryLayer {
 
 // Memory layer functions
 GV_MemoryLayerConfig gv_memory_layer_config_default(void);
+void gv_memory_layer_config_pack(GV_MemoryLayerConfig *config, double extraction_threshold, double consolidation_threshold, GV_ConsolidationStrategy default_strategy, int enable_temporal_weighting, int enable_relationship_retrieval, size_t max_related_memories, int use_llm_extraction, int use_llm_consolidation);
 GV_MemoryLayer *gv_memory_layer_create(GV_Database *db, const GV_MemoryLayerConfig *config);
 void gv_memory_layer_destroy(GV_MemoryLayer *layer);
 char *gv_memory_add(GV_MemoryLayer *layer, const char *content, const float *embedding, GV_MemoryMetadata *metadata);
 char *gv_memory_add_opts(GV_MemoryLayer *layer, const char *content, const float *embedding, GV_MemoryMetadata *metadata, int ingest_context);
+char **gv_memory_add_many(GV_MemoryLayer *layer, const char *const *contents, size_t count, const float *embeddings, GV_MemoryMetadata *const *metadatas, int ingest_context, size_t *added_count);
 char **gv_memory_extract_from_conversation(GV_MemoryLayer *layer, const char *conversation, const char *conversation_id, float **embeddings, size_t *memory_count);
 char **gv_memory_extract_from_text(GV_MemoryLayer *layer, const char *text, const char *source, float **embeddings, size_t *memory_count);
+void gv_memory_free_ids(char **memory_ids, size_t count);
+char *gv_memory_ids_pack(char **memory_ids, size_t count, size_t *out_size);
+char *gv_memory_results_pack_text(const GV_MemoryResult *results, size_t count, size_t *out_size);
 int gv_memory_extract_candidates_from_conversation_llm(GV_LLM *llm, const char *conversation, const char *conversation_id, int is_agent_memory, const char *custom_prompt, void *candidates, size_t max_candidates, size_t *actual_count);
 const char *gv_llm_get_last_error(GV_LLM *llm);
 const char *gv_llm_error_string(int error_code);
@@ -646,6 +686,7 @@ int gv_memory_search_advanced(GV_MemoryLayer *layer, const float *query_embeddin
 
 int gv_memory_consolidate(GV_MemoryLayer *layer, double threshold, int strategy);
 int gv_memory_search(GV_MemoryLayer *layer, const float *query_embedding, size_t k, GV_MemoryResult *results, GV_DistanceType distance_type);
+char **gv_memory_search_ids(GV_MemoryLayer *layer, const float *query_embedding, size_t k, float *out_distances, GV_DistanceType distance_type, size_t *out_count);
 int gv_memory_search_filtered(GV_MemoryLayer *layer, const float *query_embedding, size_t k, GV_MemoryResult *results, GV_DistanceType distance_type, int memory_type, const char *source, time_t min_timestamp, time_t max_timestamp);
 int gv_memory_get_related(GV_MemoryLayer *layer, const char *memory_id, size_t k, GV_MemoryResult *results);
 int gv_memory_get(GV_MemoryLayer *layer, const char *memory_id, GV_MemoryResult *result);
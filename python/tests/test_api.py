@@ -1,15 +1,35 @@
+from array import array
+import copy
+import dataclasses
+import json
 import os
+import pickle
+import sys
 import tempfile
 import unittest
 from unittest import mock
 
 from gigavector import (
+    ContextGraph,
+    ContextGraphConfig,
     Database,
     DistanceType,
+    EmbeddingCache,
+    EmbeddingConfig,
+    EntityType,
+    GPUContext,
+    GPUIndex,
+    GPUSearchParams,
+    GraphEntity,
+    GraphRelationship,
     IndexType,
+    MemoryLayer,
+    MemoryLayerConfig,
+    MemoryMetadata,
     ReplicationManager,
     ReplicationConfig,
 )
+from gigavector._ffi import ffi
 from gigavector.dashboard.backend.server import DashboardServer
 
 
@@ -114,6 +134,32 @@ class TestAPI(unittest.TestCase):
             )
             self.assertEqual(len(hits), 1)
 
+    def test_open_auto_picks_suggested_index(self):
+        with Database.open_auto(None, dimension=2, expected_count=10) as db:
+            db.add_vector([0.0, 1.0])
+            self.assertEqual(db.get_vector(0), [0.0, 1.0])
+
+    def test_unknown_suggested_index_raises_value_error(self):
+        from gigavector._core import _choose_index_type, suggest_index
+
+        with mock.patch("gigavector._core.lib") as fake_lib:
+            fake_lib.gv_index_suggest.return_value = -1
+            with self.assertRaises(ValueError):
+                suggest_index(2, 10)
+            with self.assertRaises(ValueError):
+                _choose_index_type(2, 10)
+            fake_lib.gv_index_suggest.return_value = int(IndexType.FLAT)
+            self.assertIs(suggest_index(2, 10), IndexType.FLAT)
+
+    def test_configure_applies_tunables(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.configure(cosine_normalized=True, exact_search_threshold=10)
+            db.add_vector([3.0, 4.0])
+            for got, want in zip(db.get_vector(0), [0.6, 0.8]):
+                self.assertAlmostEqual(got, want, places=5)
+            with self.assertRaises(ValueError):
+                db.configure(deleted_ratio_threshold=1.5)
+
     def test_batch_search(self):
         with Database.open(None, dimension=2, index=IndexType.KDTREE) as db:
             db.add_vector([0.0, 0.0])
@@ -125,6 +171,450 @@ class TestAPI(unittest.TestCase):
             self.assertAlmostEqual(results[0][0].distance, 0.1, places=3)
             self.assertAlmostEqual(results[1][0].distance, 0.1, places=3)
 
+    def test_batch_search_from_float32_buffer(self):
+        with Database.open(None, dimension=2, index=IndexType.KDTREE) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0]])
+            results = db.search_batch(array("f", [0.0, 0.1, 1.0, 1.1]), k=1)
+            self.assertEqual([len(hits) for hits in results], [1, 1])
+            self.assertEqual(results[1][0].vector.data, [1.0, 1.0])
+            with self.assertRaises(ValueError):
+                db.search_batch(array("f", [0.0, 0.1, 1.0]), k=1)
+            # Two rows of 3 floats hold 6 values, which 2-d queries would accept by total length.
+            rows = memoryview(array("f", [0.0] * 6)).cast("B").cast("f", (2, 3))
+            with self.assertRaises(ValueError):
+                db.search_batch(rows, k=1)
+            rows = memoryview(array("f", [0.0, 0.1, 1.0, 1.1])).cast("B").cast("f", (2, 2))
+            self.assertEqual(len(db.search_batch(rows, k=1)), 2)
+
+    def test_add_from_float32_buffer(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors(array("f", [0.0, 0.0, 1.0, 1.0]))
+            db.add_vector(array("f", [2.0, 2.0]), metadata={"tag": "buf"})
+            self.assertEqual(db.get_vector(2), [2.0, 2.0])
+            with self.assertRaises(ValueError):
+                db.add_vectors(array("f", [0.0, 0.0, 1.0]))
+
+    def test_add_vectors_rejects_ragged_rows(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            with self.assertRaises(ValueError):
+                db.add_vectors([[0.0], [1.0, 2.0, 3.0]])
+            self.assertIsNone(db.get_vector(0))
+
+    def test_add_vectors_from_buffer(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            raw = array("f", [0.0, 0.0, 1.0, 1.0]).tobytes()
+            db.add_vectors_from_buffer(memoryview(raw), 2)
+            self.assertEqual(db.get_vector(1), [1.0, 1.0])
+            with self.assertRaises(ValueError):
+                db.add_vectors_from_buffer(raw, 3)
+
+    def test_add_vectors_with_metadata(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+                           metadata=[{"tag": "a"}, None, {"tag": "c"}])
+            self.assertEqual(db.count, 3)
+            hits = db.search([2.0, 2.0], k=1, filter_metadata=("tag", "c"))
+            self.assertEqual(hits[0].vector.metadata, {"tag": "c"})
+            with self.assertRaises(ValueError):
+                db.add_vectors([[0.0, 0.0]], metadata=[])
+
+    def test_add_vectors_sq8_roundtrip(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            codes, vmin, vdelta = db.quantize_sq8([[0.0, 1.0], [2.0, 3.0]])
+            self.assertEqual(list(codes), [0, 0, 255, 255])
+            db.add_vectors_sq8(codes, vmin, vdelta)
+            for got, want in zip(db.get_vector(1), [2.0, 3.0]):
+                self.assertAlmostEqual(got, want, places=5)
+            with self.assertRaises(ValueError):
+                db.add_vectors_sq8(bytes(3), vmin, vdelta)
+
+    def test_search_arrays(self):
+        with Database.open(None, dimension=2, index=IndexType.KDTREE) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0]])
+            ids, distances, vectors = db.search_arrays([1.0, 1.1], k=2)
+            self.assertEqual(len(ids), 2)
+            self.assertEqual(len(vectors), 2 * len(ids))
+            self.assertAlmostEqual(distances[0], 0.1, places=3)
+            self.assertEqual(list(vectors[:2]), [1.0, 1.0])
+
+    def test_embedding_cache_put_batch(self):
+        with EmbeddingCache(max_size=8) as cache:
+            self.assertTrue(cache.put_batch(["a", "b"], [[1.0, 2.0], [3.0, 4.0]]))
+            self.assertEqual(cache.get("b"), [3.0, 4.0])
+            self.assertTrue(cache.put_batch(["c"], array("f", [5.0, 6.0])))
+            self.assertEqual(cache.get("c"), [5.0, 6.0])
+            with self.assertRaises(ValueError):
+                cache.put_batch(["d", "e"], [[1.0], [2.0, 3.0]])
+
+    def test_embedding_config_c_struct_is_memoized(self):
+        config = EmbeddingConfig(model="m")
+        c_config, refs = config._to_c_config()
+        self.assertIs(config._to_c_config()[0], c_config)
+        self.assertEqual(config, EmbeddingConfig(model="m"))
+        config.model = "other"
+        rebuilt, refs = config._to_c_config()
+        self.assertIsNot(rebuilt, c_config)
+        self.assertEqual(ffi.string(rebuilt.model), b"other")
+
+    def test_memoized_config_still_copies(self):
+        config = EmbeddingConfig(model="m")
+        c_config, _ = config._to_c_config()
+        self.assertNotIn("_c_cache", [f.name for f in dataclasses.fields(config)])
+        self.assertEqual(dataclasses.asdict(config)["model"], "m")
+        for clone in (copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+            self.assertEqual(clone, config)
+            self.assertIsNot(clone._to_c_config()[0], c_config)
+
+    def test_search_without_vectors(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vector([1.0, 1.0], metadata={"tag": "x"})
+            hit = db.search([1.0, 1.0], k=1, with_vectors=False)[0]
+            self.assertEqual(hit.vector.data, [])
+            self.assertEqual(hit.vector.metadata, {"tag": "x"})
+            batch = db.search_batch([[1.0, 1.0]], k=1, with_vectors=False)
+            self.assertEqual(batch[0][0].id, hit.id)
+            self.assertEqual(batch[0][0].vector.data, [])
+
+    def test_search_arrays_into(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0]])
+            ids = array("Q", bytes(8 * 4))
+            distances = array("f", bytes(4 * 4))
+            vectors = array("f", bytes(4 * 8))
+            n = db.search_arrays_into([1.0, 1.0], 4, ids, distances, vectors)
+            self.assertEqual(n, 2)
+            self.assertEqual(list(ids[:2]), [1, 0])
+            self.assertEqual(list(vectors[:2]), [1.0, 1.0])
+            with self.assertRaises(ValueError):
+                db.search_arrays_into([1.0, 1.0], 5, ids, distances, vectors)
+
+    def test_search_batch_stream(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0]])
+            batches = [[[0.0, 0.0]], [], array("f", [5.0, 5.0, 1.0, 1.0])]
+            out = list(db.search_batch_stream(batches, k=1))
+            self.assertEqual(len(out), 3)
+            self.assertEqual([[h.id for h in hits] for hits in out[2]], [[2], [1]])
+            self.assertEqual(out[1], [])
+            self.assertEqual(out[0][0][0].id, 0)
+
+    def test_range_search_accepts_float32_buffer(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0]])
+            hits = db.range_search(array("f", [0.0, 0.0]), radius=2.0)
+            self.assertEqual(sorted(h.id for h in hits), [0, 1])
+            self.assertEqual(len(db.range_search(iter([5.0, 5.0]), radius=0.5)), 1)
+            with self.assertRaises(ValueError):
+                db.range_search(array("f", [0.0]), radius=1.0)
+
+    def test_memory_layer_accepts_float32_buffers(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                memory_id = memory.add("hello", array("f", [1.0, 0.0, 0.0, 0.0]))
+                hits = memory.search(array("f", [1.0, 0.0, 0.0, 0.0]), k=1)
+                self.assertEqual([h.memory_id for h in hits], [memory_id])
+                self.assertEqual(memory.search_advanced([1.0, 0.0, 0.0, 0.0], k=1)[0].content, "hello")
+                memory.add("world", [0.0, 1.0, 0.0, 0.0])
+                self.assertEqual(len(memory.search([0.0, 1.0, 0.0, 0.0], k=4)), 2)
+                self.assertEqual([h.content for h in memory.search([0.0, 1.0, 0.0, 0.0], k=1)], ["world"])
+                with self.assertRaises(ValueError):
+                    memory.search(array("f", [1.0, 0.0]), k=1)
+
+    def test_memory_metadata_round_trip(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                meta = MemoryMetadata(source="chat", related_memory_ids=["a", "bb", "ccc"])
+                memory_id = memory.add("hello", [1.0, 0.0, 0.0, 0.0], meta)
+                stored = memory.get(memory_id).metadata
+                self.assertEqual(stored.source, "chat")
+                self.assertEqual(list(stored.related_memory_ids), ["a", "bb", "ccc"])
+                self.assertEqual(stored.related_memory_ids, ("a", "bb", "ccc"))
+                self.assertEqual(stored.related_memory_ids[-1], "ccc")
+                self.assertEqual(stored.related_memory_ids[1:], ("bb", "ccc"))
+                self.assertEqual(hash(stored.related_memory_ids), hash(("a", "bb", "ccc")))
+                self.assertIsInstance(stored.related_memory_ids, tuple)
+                self.assertNotEqual(stored.related_memory_ids, ["a", "bb", "ccc"])
+                self.assertEqual(stored.related_memory_ids + ("d",), ("a", "bb", "ccc", "d"))
+                as_dict = json.loads(json.dumps(dataclasses.asdict(stored)))
+                self.assertEqual(as_dict["related_memory_ids"], ["a", "bb", "ccc"])
+                self.assertTrue(memory.update(memory_id, metadata=dataclasses.replace(
+                    stored, related_memory_ids=dataclasses.asdict(stored)["related_memory_ids"])))
+                self.assertTrue(memory.update(memory_id, metadata=stored))
+                self.assertEqual(memory.get(memory_id).metadata.related_memory_ids, ("a", "bb", "ccc"))
+
+    def test_memory_layer_released_without_close(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            memory = MemoryLayer(db)
+            memory.add("hello", [1.0, 0.0, 0.0, 0.0])
+            borrowed = MemoryLayer.borrow(memory._layer, db)
+            del borrowed
+            self.assertEqual(len(memory.search([1.0, 0.0, 0.0, 0.0], k=1)), 1)
+            memory.__del__()
+            self.assertTrue(memory._closed)
+            del memory
+
+    def test_memory_add_accepts_utf8_bytes(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                memory_id = memory.add("caf\u00e9".encode(), [1.0, 0.0, 0.0, 0.0])
+                self.assertEqual(memory.get(memory_id).content, "caf\u00e9")
+                ids = memory.add_many([b"one", "two"], [[0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]])
+                self.assertEqual([memory.get(i).content for i in ids], ["one", "two"])
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_graph_and_gpu_records_are_slotted(self):
+        from gigavector._core import GPUStats, GraphQueryResult
+
+        records = [
+            GraphEntity(name="alice"),
+            GraphRelationship(source_entity_id="ent_1"),
+            GraphQueryResult(source_name="a", relationship_type="r", destination_name="b", similarity=1.0),
+            GPUSearchParams(k=3),
+            GPUStats(*([0] * len(GPUStats.__dataclass_fields__))),
+        ]
+        for record in records:
+            self.assertFalse(hasattr(record, "__dict__"), type(record).__name__)
+
+    def test_graph_entity_packs_embedding(self):
+        entity = GraphEntity(name="alice", embedding=[0.5, 0.25, 1.0], embedding_dim=7)
+        self.assertEqual((entity.embedding.typecode, list(entity.embedding)), ("f", [0.5, 0.25, 1.0]))
+        self.assertEqual(entity.embedding_dim, 3)
+        packed = array("f", [1.0, 2.0])
+        self.assertIs(GraphEntity(embedding=packed).embedding, packed)
+        self.assertEqual(GraphEntity().embedding_dim, 0)
+
+    def test_context_graph_extract_builds_entities(self):
+        keep = [ffi.new("char[]", b"alice"), ffi.new("char[]", b"acme"), ffi.new("char[]", b"u1"),
+                ffi.new("float[]", [1.0, 0.0])]
+        c_entities = ffi.new("GV_GraphEntity[]", 2)
+        c_entities[0].name, c_entities[0].user_id = keep[0], keep[2]
+        c_entities[0].embedding, c_entities[0].embedding_dim = keep[3], 2
+        c_entities[1].name = keep[1]
+        c_entities[1].entity_type = int(EntityType.ORGANIZATION)
+
+        def fake_extract(graph, text, user_id, agent_id, run_id, ents, n_ents, rels, n_rels):
+            ents[0], n_ents[0], rels[0], n_rels[0] = c_entities, 2, ffi.NULL, 0
+            return 0
+
+        with ContextGraph(ContextGraphConfig(embedding_dimension=2)) as graph:
+            with mock.patch("gigavector._core.lib") as lib:
+                lib.gv_context_graph_extract = fake_extract
+                entities, relationships = graph.extract(
+                    "Alice works at Acme.", generate_embeddings=lambda name: [0.0, 1.0])
+        self.assertEqual(relationships, [])
+        self.assertEqual([(e.name, e.entity_type, e.user_id) for e in entities],
+                         [("alice", EntityType.PERSON, "u1"), ("acme", EntityType.ORGANIZATION, None)])
+        self.assertEqual([(list(e.embedding), e.embedding_dim) for e in entities], [([1.0, 0.0], 2), ([0.0, 1.0], 2)])
+        self.assertEqual({e.embedding.typecode for e in entities}, {"f"})
+        self.assertEqual(lib.gv_graph_entity_free.call_count, 2)
+
+    def test_context_graph_retries_missing_embeddings_in_one_batch(self):
+        service = mock.Mock(spec=["generate", "generate_batch"])
+        service.generate_batch.side_effect = [
+            [[1.0, 0.0], None],
+            [[0.0, 1.0]],
+        ]
+        with ContextGraph(ContextGraphConfig(embedding_dimension=2, embedding_service=service)) as graph:
+            alice = GraphEntity(name="alice")
+            acme = GraphEntity(name="acme", entity_type=EntityType.ORGANIZATION)
+            graph.add_entities([alice, acme, GraphEntity(name="alice")])
+        self.assertEqual(service.generate_batch.call_args_list,
+                         [mock.call(["alice", "acme"]), mock.call(["acme"])])
+        service.generate.assert_not_called()
+        self.assertEqual((alice.embedding.typecode, list(alice.embedding)), ("f", [1.0, 0.0]))
+        self.assertEqual((acme.embedding.typecode, list(acme.embedding)), ("f", [0.0, 1.0]))
+
+    def test_context_graph_caches_service_embeddings(self):
+        service = mock.Mock(spec=["generate", "generate_batch"])
+        service.generate_batch.side_effect = lambda names: [[1.0, 0.0] for _ in names]
+        with ContextGraph(ContextGraphConfig(embedding_dimension=2, embedding_service=service)) as graph:
+            graph.add_entities([GraphEntity(name="alice"), GraphEntity(name="acme")])
+            again = GraphEntity(name="alice")
+            graph.add_entities([again, GraphEntity(name="bob")])
+        self.assertEqual(service.generate_batch.call_args_list,
+                         [mock.call(["alice", "acme"]), mock.call(["bob"])])
+        self.assertEqual((again.embedding.typecode, list(again.embedding)), ("f", [1.0, 0.0]))
+
+    def test_gpu_index_accepts_float32_rows(self):
+        try:
+            ctx = GPUContext()
+            index = GPUIndex(ctx, [[1.0, 0.0], [0.0, 1.0]])
+        except RuntimeError:
+            self.skipTest("GPU index unavailable")
+        with index:
+            index.add(array("f", [0.5, 0.5, 0.25, 0.75]))
+            self.assertEqual(index.info()[:2], (4, 2))
+            with self.assertRaises(ValueError):
+                index.add([[1.0, 0.0], [1.0]])
+            hits = index.search_batch([[1.0, 0.0], [0.0, 1.0]], GPUSearchParams(k=2))
+            self.assertEqual([ids[0] for ids, _ in hits], [0, 1])
+            self.assertEqual([len(d) for _, d in hits], [2, 2])
+            self.assertEqual(index.search_batch([], GPUSearchParams(k=2)), [])
+            ranged = index.search_batch([[1.0, 0.0]], GPUSearchParams(k=4, radius=0.1))
+            self.assertEqual(ranged, [([0], [0.0])])
+
+    def test_context_graph_add_entities_and_relationships(self):
+        with ContextGraph(ContextGraphConfig(embedding_dimension=2)) as graph:
+            graph.add_entities([
+                GraphEntity(name="alice", embedding=array("f", [1.0, 0.0]), user_id="u1"),
+                GraphEntity(name="acme", entity_type=EntityType.ORGANIZATION, embedding=[0.0, 1.0]),
+            ])
+            graph.add_relationships([
+                GraphRelationship(source_entity_id="ent_1", destination_entity_id="ent_2",
+                                  relationship_type="works_at"),
+            ])
+            hits = graph.search([1.0, 0.0])
+            self.assertEqual([(h.source_name, h.relationship_type, h.destination_name) for h in hits],
+                             [("alice", "works_at", "acme")])
+            for _ in range(2):
+                self.assertEqual(len(graph.search([1.0, 0.0], user_id="u1")), 1)
+                self.assertEqual(graph.search([1.0, 0.0], user_id="u2"), [])
+            for max_results in (1, 32, 4):
+                self.assertEqual(graph.search([1.0, 0.0], max_results=max_results), hits)
+            self.assertEqual(graph.get_related("ent_missing", max_results=64), [])
+
+    def test_context_graph_embeds_each_name_once(self):
+        calls = []
+
+        def embed(name):
+            calls.append(name)
+            return [1.0, 0.0]
+
+        with ContextGraph(ContextGraphConfig(embedding_dimension=2)) as graph:
+            entities = [GraphEntity(name=name) for name in ("alice", "acme", "alice")]
+            graph.add_entities(entities, generate_embeddings=embed)
+        self.assertEqual(calls, ["alice", "acme"])
+        self.assertEqual([(e.embedding.typecode, list(e.embedding)) for e in entities], [("f", [1.0, 0.0])] * 3)
+        self.assertIsNot(entities[0].embedding, entities[2].embedding)
+
+    def test_memory_search_decodes_page_text(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                ids = [memory.add(text, [1.0, float(i), 0.0, 0.0])
+                       for i, text in enumerate(["caf\u00e9", "na\u00efve", "plain"])]
+                hits = memory.search([1.0, 0.0, 0.0, 0.0], k=3)
+                self.assertEqual({(h.memory_id, h.content) for h in hits},
+                                 set(zip(ids, ["caf\u00e9", "na\u00efve", "plain"])))
+
+    def test_memory_search_without_metadata(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                memory_id = memory.add("hello", [1.0, 0.0, 0.0, 0.0], MemoryMetadata(source="chat"))
+                hit = memory.search([1.0, 0.0, 0.0, 0.0], k=1)[0]
+                self.assertEqual(hit.metadata.source, "chat")
+                bare = memory.search([1.0, 0.0, 0.0, 0.0], k=1, with_metadata=False, with_related=False)[0]
+                self.assertEqual((bare.memory_id, bare.content), (memory_id, "hello"))
+                self.assertIsNone(bare.metadata)
+                self.assertEqual(bare.related, ())
+                adv = memory.search_advanced([1.0, 0.0, 0.0, 0.0], k=1, with_metadata=False)[0]
+                self.assertIsNone(adv.metadata)
+                self.assertEqual(len(memory.search([1.0, 0.0, 0.0, 0.0], k=1, distance=DistanceType.EUCLIDEAN)), 1)
+                self.assertEqual(len(memory.search([1.0, 0.0, 0.0, 0.0], k=1, distance=0)), 1)
+
+    def test_copy_memory_result_related_metadata(self):
+        from gigavector._core import _copy_memory_result
+
+        keep = [ffi.new("char[]", b"mem_1"), ffi.new("char[]", b"mem_2")]
+        rel = ffi.new("GV_MemoryMetadata *")
+        rel.memory_id = keep[1]
+        rel_ptrs = ffi.new("GV_MemoryMetadata *[]", [rel])
+        c_result = ffi.new("GV_MemoryResult *")
+        c_result.memory_id = keep[0]
+        c_result.related = rel_ptrs
+        c_result.related_count = 1
+        result = _copy_memory_result(c_result)
+        self.assertEqual(result.memory_id, "mem_1")
+        self.assertEqual([r.memory_id for r in result.related], ["mem_2"])
+        self.assertEqual(result.related[0].metadata.memory_id, "mem_2")
+
+        keep.append(ffi.new("char[]", b"mem_\xff"))
+        rel.memory_id = keep[-1]
+        result = _copy_memory_result(c_result)
+        self.assertEqual(result.related[0].memory_id, "mem_\ufffd")
+        rel.memory_type = 99
+        self.assertEqual(_copy_memory_result(c_result).related, ())
+
+    def test_memory_extract_from_text_returns_ids(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db, MemoryLayerConfig(extraction_threshold=0.0)) as memory:
+                ids = memory.extract_from_text("I prefer tea over coffee. My name is Sam and I live in Paris.")
+                self.assertTrue(ids)
+                self.assertEqual(len(set(ids)), len(ids))
+                self.assertEqual(memory.get(ids[0]).memory_id, ids[0])
+
+    def test_memory_search_ids_only(self):
+        with Database.open(None, dimension=4, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                self.assertEqual(memory.search_ids_only([1.0, 0.0, 0.0, 0.0], k=3), [])
+                first = memory.add("hello", [1.0, 0.0, 0.0, 0.0])
+                second = memory.add("world", [0.0, 1.0, 0.0, 0.0])
+                pairs = memory.search_ids_only(array("f", [1.0, 0.0, 0.0, 0.0]), k=3)
+                full = memory.search([1.0, 0.0, 0.0, 0.0], k=3)
+                self.assertEqual([mid for mid, _ in pairs], [r.memory_id for r in full])
+                self.assertEqual(sorted(mid for mid, _ in pairs), sorted([first, second]))
+                for (_, dist), result in zip(pairs, full):
+                    self.assertAlmostEqual(dist, result.distance, places=5)
+
+    def test_memory_add_many(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            with MemoryLayer(db) as memory:
+                ids = memory.add_many(
+                    ["tea", "coffee"],
+                    array("f", [1.0, 0.0, 0.0, 1.0]),
+                    [MemoryMetadata(source="chat"), None],
+                )
+                self.assertEqual(len(ids), 2)
+                self.assertEqual(memory.get(ids[0]).metadata.source, "chat")
+                self.assertEqual(memory.get(ids[1]).content, "coffee")
+                self.assertEqual(memory.add_many([], []), [])
+                with self.assertRaises(ValueError):
+                    memory.add_many(["x", "y"], [[1.0, 0.0]])
+                with self.assertRaises(ValueError):
+                    memory.add_many(["x"], [[1.0, 0.0]], [None, None])
+
+    def test_search_concurrent(self):
+        queries = [[0.0, 0.0], [5.0, 5.0], [1.0, 1.0], [4.0, 4.0]]
+        for index in (IndexType.FLAT, IndexType.HNSW):
+            with Database.open(None, dimension=2, index=index) as db:
+                db.add_vectors([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0]])
+                out = db.search_concurrent(queries, k=1, max_workers=4)
+                self.assertEqual([hits[0].id for hits in out], [0, 2, 1, 2])
+                self.assertEqual(db.search_concurrent([], k=1), [])
+
+    def test_search_batch_arrays(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0]])
+            counts, ids, distances, vectors = db.search_batch_arrays([[0.0, 0.0], [5.0, 5.0]], k=2)
+            self.assertEqual(list(counts), [2, 2])
+            self.assertEqual(len(vectors), 2 * len(ids))
+            self.assertEqual(ids[0], 0)
+            self.assertEqual(ids[2], 2)
+            self.assertEqual(list(vectors[4:6]), [5.0, 5.0])
+
+    def test_sparse_accepts_typed_arrays(self):
+        with Database.open(None, dimension=8, index=IndexType.SPARSE) as db:
+            db.add_sparse_vector(array("I", [1, 3]), array("f", [0.5, 1.0]))
+            db.add_sparse_vector([2, 3], [1.0, 2.0])
+            hits = db.search_sparse(array("I", [3]), [1.0], k=2)
+            self.assertEqual(len(hits), 2)
+            self.assertEqual(hits[0].vector.data[3], 2.0)
+
+    def test_delete_vectors_accepts_typed_array(self):
+        with Database.open(None, dimension=2, index=IndexType.FLAT) as db:
+            db.add_vectors([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]])
+            self.assertEqual(db.delete_vectors(array("Q", [0, 2])), 2)
+            self.assertEqual([h.id for h in db.search([0.0, 0.0], k=3)], [1])
+
+    def test_sparse_int8_values(self):
+        with Database.open(None, dimension=8, index=IndexType.SPARSE) as db:
+            codes, scale = Database.quantize_sparse_i8([0.5, -1.0])
+            self.assertEqual(list(codes), [64, -127])
+            db.add_sparse_vector([1, 3], codes, scale=scale)
+            hits = db.search_sparse([3], array("b", [-127]), k=1, scale=scale)
+            self.assertEqual(len(hits), 1)
+            self.assertAlmostEqual(hits[0].vector.data[3], -1.0, places=5)
+            self.assertAlmostEqual(hits[0].vector.data[1], 0.5, places=2)
+
     # def test_error_handling(self):
     #     with Database.open(None, dimension=2, index=IndexType.KDTREE) as db:
     #         # Wrong dimension for add_vector
@@ -179,6 +669,20 @@ class TestAPI(unittest.TestCase):
                 # Allow non-zero distance for approximate indexes (IVFPQ).
                 self.assertLess(hits[0].distance, 0.25)
 
+    def test_auto_tune_ivfpq(self):
+        dim = 8
+        data = [[((i * 7 + j * 3) % 17) / 17.0 for j in range(dim)] for i in range(256)]
+        with Database.open(None, dimension=dim, index=IndexType.IVFPQ) as db:
+            db.train_ivfpq(data)
+            db.add_vectors(data)
+            nprobe, rerank = db.auto_tune_ivfpq(data[:8], [[i] for i in range(8)], k=4)
+            self.assertGreaterEqual(nprobe, 1)
+            self.assertGreaterEqual(rerank, 4)
+            hits = db.search_ivfpq_opts(data[0], k=1)
+            self.assertEqual(len(hits), 1)
+            with self.assertRaises(ValueError):
+                db.auto_tune_ivfpq(data[:2], [[0]])
+
     def test_replication_leader_append_wal(self):
         from gigavector import ReplicationManager, ReplicationConfig
 
@@ -95,6 +95,24 @@ int gv_db_search_batch(const GV_Database *db, const float *queries,
   return db_search_batch(db, queries, qcount, k, results, distance_type);
 }
 
+size_t gv_search_results_pack(const GV_SearchResult *results, size_t count,
+                              size_t dimension, uint64_t *out_ids,
+                              float *out_distances, float *out_vectors) {
+  return db_search_results_pack(results, count, dimension, out_ids,
+                                out_distances, out_vectors);
+}
+
+int gv_db_add_vectors_sq8(GV_Database *db, const uint8_t *codes, size_t count,
+                          size_t dimension, const float *vmin,
+                          const float *vdelta) {
+  return db_add_vectors_sq8(db, codes, count, dimension, vmin, vdelta);
+}
+
+int gv_sq8_encode(const float *data, size_t count, size_t dimension,
+                  uint8_t *codes, float *vmin, float *vdelta) {
+  return scalar_quant_sq8_encode(data, count, dimension, codes, vmin, vdelta);
+}
+
 int gv_db_ivfpq_train(GV_Database *db, const float *data, size_t count,
                       size_t dimension) {
   return db_ivfpq_train(db, data, count, dimension);
@@ -323,6 +341,22 @@ int gv_db_search_sparse(const GV_Database *db, const uint32_t *indices,
   return db_search_sparse(db, indices, values, nnz, k, results, distance_type);
 }
 
+int gv_db_add_sparse_vector_i8(GV_Database *db, const uint32_t *indices,
+                               const int8_t *codes, float scale, size_t nnz,
+                               size_t dimension, const char *metadata_key,
+                               const char *metadata_value) {
+  return db_add_sparse_vector_i8(db, indices, codes, scale, nnz, dimension,
+                                 metadata_key, metadata_value);
+}
+
+int gv_db_search_sparse_i8(const GV_Database *db, const uint32_t *indices,
+                           const int8_t *codes, float scale, size_t nnz, size_t k,
+                           GV_SearchResult *results,
+                           GV_DistanceType distance_type) {
+  return db_search_sparse_i8(db, indices, codes, scale, nnz, k, results,
+                             distance_type);
+}
+
 int gv_db_range_search(const GV_Database *db, const float *query_data,
                        float radius, GV_SearchResult *results,
                        size_t max_results, GV_DistanceType distance_type) {
@@ -395,6 +429,10 @@ void gv_db_stop_background_compaction(GV_Database *db) {
 
 int gv_db_compact(GV_Database *db) { return db_compact(db); }
 
+int gv_db_configure(GV_Database *db, const GV_DBTuning *tuning) {
+  return db_configure(db, tuning);
+}
+
 void gv_db_set_compaction_interval(GV_Database *db, size_t interval_sec) {
   db_set_compaction_interval(db, interval_sec);
 }
@@ -463,6 +501,11 @@ int gv_vector_set_metadata(GV_Vector *vector, const char *key,
 
 void gv_vector_destroy(GV_Vector *vector) { vector_destroy(vector); }
 
+int gv_metadata_flatten(const GV_Metadata *meta, char *out, size_t out_cap,
+                        size_t *written, size_t *count) {
+  return metadata_flatten(meta, out, out_cap, written, count);
+}
+
 /* ── KD-tree: gv_kdtree_insert has a different signature from the underlying
    kdtree_insert (which requires SoA storage context). Stub returns -1. ── */
 int gv_kdtree_insert(GV_KDNode **root, GV_Vector *point, size_t depth) {
@@ -567,6 +610,12 @@ int gv_embedding_cache_put(GV_EmbeddingCache *cache, const char *text,
   return embedding_cache_put(cache, text, embedding_dim, embedding);
 }
 
+int gv_embedding_cache_put_batch(GV_EmbeddingCache *cache, const char *const *texts,
+                                 size_t count, size_t embedding_dim,
+                                 const float *embeddings) {
+  return embedding_cache_put_batch(cache, texts, count, embedding_dim, embeddings);
+}
+
 void gv_embedding_cache_clear(GV_EmbeddingCache *cache) {
   embedding_cache_clear(cache);
 }
@@ -658,6 +707,22 @@ GV_MemoryLayerConfig gv_memory_layer_config_default(void) {
   return memory_layer_config_default();
 }
 
+void gv_memory_layer_config_pack(GV_MemoryLayerConfig *config,
+                                 double extraction_threshold,
+                                 double consolidation_threshold,
+                                 GV_ConsolidationStrategy default_strategy,
+                                 int enable_temporal_weighting,
+                                 int enable_relationship_retrieval,
+                                 size_t max_related_memories,
+                                 int use_llm_extraction,
+                                 int use_llm_consolidation) {
+  memory_layer_config_pack(config, extraction_threshold,
+                           consolidation_threshold, default_strategy,
+                           enable_temporal_weighting,
+                           enable_relationship_retrieval, max_related_memories,
+                           use_llm_extraction, use_llm_consolidation);
+}
+
 GV_MemoryLayer *gv_memory_layer_create(GV_Database *db,
                                        const GV_MemoryLayerConfig *config) {
   return memory_layer_create(db, config);
@@ -678,6 +743,14 @@ char *gv_memory_add_opts(GV_MemoryLayer *layer, const char *content,
   return memory_add_opts(layer, content, embedding, metadata, NULL, ingest_context);
 }
 
+char **gv_memory_add_many(GV_MemoryLayer *layer, const char *const *contents,
+                          size_t count, const float *embeddings,
+                          GV_MemoryMetadata *const *metadatas,
+                          int ingest_context, size_t *added_count) {
+  return memory_add_many(layer, contents, count, embeddings, metadatas,
+                         ingest_context, added_count);
+}
+
 char **gv_memory_extract_from_conversation(GV_MemoryLayer *layer,
                                            const char *conversation,
                                            const char *conversation_id,
@@ -694,6 +767,19 @@ char **gv_memory_extract_from_text(GV_MemoryLayer *layer, const char *text,
                                   memory_count);
 }
 
+void gv_memory_free_ids(char **memory_ids, size_t count) {
+  memory_free_ids(memory_ids, count);
+}
+
+char *gv_memory_ids_pack(char **memory_ids, size_t count, size_t *out_size) {
+  return memory_ids_pack(memory_ids, count, out_size);
+}
+
+char *gv_memory_results_pack_text(const GV_MemoryResult *results, size_t count,
+                                  size_t *out_size) {
+  return memory_results_pack_text(results, count, out_size);
+}
+
 int gv_memory_extract_candidates_from_conversation_llm(
     GV_LLM *llm, const char *conversation, const char *conversation_id,
     int is_agent_memory, const char *custom_prompt, void *candidates,
@@ -714,6 +800,13 @@ int gv_memory_search(GV_MemoryLayer *layer, const float *query_embedding,
   return memory_search(layer, query_embedding, k, results, distance_type);
 }
 
+char **gv_memory_search_ids(GV_MemoryLayer *layer, const float *query_embedding,
+                            size_t k, float *out_distances,
+                            GV_DistanceType distance_type, size_t *out_count) {
+  return memory_search_ids(layer, query_embedding, k, out_distances,
+                           distance_type, out_count);
+}
+
 int gv_memory_search_filtered(GV_MemoryLayer *layer,
                               const float *query_embedding, size_t k,
                               GV_MemoryResult *results,
@@ -5,14 +5,14 @@
 #include <stdlib.h>
 #include <string.h>
 #include <pthread.h>
-#if defined(__AVX512F__) || defined(__AVX2__)
-#include <immintrin.h>
-#endif
 #include "core/compat.h"
 
 #include "index/ivfpq.h"
 #include "search/distance.h"
 #include "core/config.h"
+#if defined(GV_HAVE_AVX512_KERNELS) || defined(GV_HAVE_AVX2_KERNELS)
+#include <immintrin.h>
+#endif
 #include "schema/vector.h"
 #include "schema/metadata.h"
 #include "core/heap.h"
@@ -40,7 +40,8 @@ typedef struct {
 
 GV_HEAP_DEFINE(ivfpq_heap, GV_IVFPQHeapItem)
 
-#if defined(__AVX512F__)
+#ifdef GV_HAVE_AVX512_KERNELS
+GV_SIMD_TARGET_AVX512
 static inline float ivfpq_l2_avx512(const float *a, const float *b, size_t dim) {
     __m512 acc = _mm512_setzero_ps();
     size_t i = 0;
@@ -61,6 +62,7 @@ static inline float ivfpq_l2_avx512(const float *a, const float *b, size_t dim)
     return sum;
 }
 
+GV_SIMD_TARGET_AVX512
 static inline float ivfpq_dot_avx512(const float *a, const float *b, size_t dim) {
     __m512 acc = _mm512_setzero_ps();
     size_t i = 0;
@@ -80,7 +82,8 @@ static inline float ivfpq_dot_avx512(const float *a, const float *b, size_t dim)
 }
 #endif
 
-#if defined(__AVX2__)
+#ifdef GV_HAVE_AVX2_KERNELS
+GV_SIMD_TARGET_AVX2
 static inline float ivfpq_l2_avx2(const float *a, const float *b, size_t dim) {
     __m256 acc = _mm256_setzero_ps();
     size_t i = 0;
@@ -100,6 +103,7 @@ static inline float ivfpq_l2_avx2(const float *a, const float *b, size_t dim) {
     return sum;
 }
 
+GV_SIMD_TARGET_AVX2
 static inline float ivfpq_dot_avx2(const float *a, const float *b, size_t dim) {
     __m256 acc = _mm256_setzero_ps();
     size_t i = 0;
@@ -143,39 +147,33 @@ static inline float ivfpq_dot_scalar(const float *a, const float *b, size_t dim)
 
 static inline float ivfpq_l2_runtime(const float *a, const float *b, size_t dim) {
     unsigned int feats = ivfpq_cpu_features();
+    (void)feats;
+#ifdef GV_HAVE_AVX512_KERNELS
     if (feats & GV_CPU_FEATURE_AVX512F) {
-#ifdef __AVX512F__
         return ivfpq_l2_avx512(a, b, dim);
-#else
-        return ivfpq_l2_scalar(a, b, dim);
-#endif
     }
-    if (feats & GV_CPU_FEATURE_AVX2) {
-#ifdef __AVX2__
-        return ivfpq_l2_avx2(a, b, dim);
-#else
-        return ivfpq_l2_scalar(a, b, dim);
 #endif
+#ifdef GV_HAVE_AVX2_KERNELS
+    if ((feats & GV_CPU_FEATURE_AVX2) && (feats & GV_CPU_FEATURE_FMA)) {
+        return ivfpq_l2_avx2(a, b, dim);
     }
+#endif
     return ivfpq_l2_scalar(a, b, dim);
 }
 
 static inline float ivfpq_dot_runtime(const float *a, const float *b, size_t dim) {
     unsigned int feats = ivfpq_cpu_features();
+    (void)feats;
+#ifdef GV_HAVE_AVX512_KERNELS
     if (feats & GV_CPU_FEATURE_AVX512F) {
-#ifdef __AVX512F__
         return ivfpq_dot_avx512(a, b, dim);
-#else
-        return ivfpq_dot_scalar(a, b, dim);
-#endif
     }
-    if (feats & GV_CPU_FEATURE_AVX2) {
-#ifdef __AVX2__
-        return ivfpq_dot_avx2(a, b, dim);
-#else
-        return ivfpq_dot_scalar(a, b, dim);
 #endif
+#ifdef GV_HAVE_AVX2_KERNELS
+    if ((feats & GV_CPU_FEATURE_AVX2) && (feats & GV_CPU_FEATURE_FMA)) {
+        return ivfpq_dot_avx2(a, b, dim);
     }
+#endif
     return ivfpq_dot_scalar(a, b, dim);
 }
 
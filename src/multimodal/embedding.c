@@ -238,6 +238,24 @@ int embedding_cache_put(GV_EmbeddingCache *cache,
     return 0;
 }
 
+int embedding_cache_put_batch(GV_EmbeddingCache *cache,
+                                 const char *const *texts,
+                                 size_t count,
+                                 size_t embedding_dim,
+                                 const float *embeddings) {
+    if (cache == NULL || texts == NULL || embeddings == NULL || embedding_dim == 0) {
+        return -1;
+    }
+
+    for (size_t i = 0; i < count; i++) {
+        if (embedding_cache_put(cache, texts[i], embedding_dim,
+                                embeddings + i * embedding_dim) != 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
 void embedding_cache_clear(GV_EmbeddingCache *cache) {
     if (cache == NULL) {
         return;
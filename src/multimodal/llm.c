@@ -517,6 +517,7 @@ static int parse_openai_response(const char *response_json, GV_LLMResponse *out)
         json_free(root);
         return -1;
     }
+    out->content_length = strlen(out->content);
 
     // Extract optional fields
     out->finish_reason = 0;
@@ -594,6 +595,7 @@ static int parse_gemini_response(const char *response_json, GV_LLMResponse *out)
         json_free(root);
         return -1;
     }
+    out->content_length = strlen(out->content);
 
     // Extract optional fields
     out->finish_reason = 0;
@@ -690,6 +692,7 @@ static int parse_anthropic_response(const char *response_json, GV_LLMResponse *o
         json_free(root);
         return -1;
     }
+    out->content_length = strlen(out->content);
 
     // Extract optional fields
     out->finish_reason = 0;
@@ -103,6 +103,33 @@ void vector_clear_metadata(GV_Vector *vector) {
     vector->metadata = NULL;
 }
 
+int metadata_flatten(const GV_Metadata *meta, char *out, size_t out_cap,
+                     size_t *written, size_t *count) {
+    if (written == NULL || (out == NULL && out_cap > 0)) {
+        return -1;
+    }
+
+    size_t needed = 0;
+    size_t entries = 0;
+    for (const GV_Metadata *cur = meta; cur != NULL; cur = cur->next) {
+        const char *parts[2] = {cur->key ? cur->key : "", cur->value ? cur->value : ""};
+        for (int i = 0; i < 2; i++) {
+            size_t len = strlen(parts[i]) + 1;
+            if (needed + len <= out_cap) {
+                memcpy(out + needed, parts[i], len);
+            }
+            needed += len;
+        }
+        entries++;
+    }
+
+    *written = needed;
+    if (count != NULL) {
+        *count = entries;
+    }
+    return needed <= out_cap ? 0 : 1;
+}
+
 void metadata_free(GV_Metadata *meta) {
     GV_Metadata *current = meta;
     while (current != NULL) {
@@ -4,16 +4,12 @@
 #include "search/distance.h"
 #include "core/config.h"
 
-#ifdef __SSE4_2__
-#include <nmmintrin.h>
-#include <emmintrin.h>
-#endif
-
-#if defined(__AVX2__) || defined(__AVX512F__)
+#if defined(GV_HAVE_SSE42_KERNELS) || defined(GV_HAVE_AVX2_KERNELS) || defined(GV_HAVE_AVX512_KERNELS)
 #include <immintrin.h>
 #endif
 
-#ifdef __AVX512F__
+#ifdef GV_HAVE_AVX512_KERNELS
+GV_SIMD_TARGET_AVX512
 static float vector_dot_avx512(const float *a, const float *b, size_t dimension) {
     __m512 sum_vec = _mm512_setzero_ps();
     size_t i = 0;
@@ -38,6 +34,7 @@ static float vector_dot_avx512(const float *a, const float *b, size_t dimension)
     return sum;
 }
 
+GV_SIMD_TARGET_AVX512
 static float vector_norm_avx512(const float *v, size_t dimension) {
     __m512 sum_vec = _mm512_setzero_ps();
     size_t i = 0;
@@ -63,7 +60,8 @@ static float vector_norm_avx512(const float *v, size_t dimension) {
 }
 #endif
 
-#ifdef __AVX2__
+#ifdef GV_HAVE_AVX2_KERNELS
+GV_SIMD_TARGET_AVX2
 static float vector_dot_avx2(const float *a, const float *b, size_t dimension) {
     __m256 sum_vec = _mm256_setzero_ps();
     size_t i = 0;
@@ -89,6 +87,7 @@ static float vector_dot_avx2(const float *a, const float *b, size_t dimension) {
     return sum;
 }
 
+GV_SIMD_TARGET_AVX2
 static float vector_norm_avx2(const float *v, size_t dimension) {
     __m256 sum_vec = _mm256_setzero_ps();
     size_t i = 0;
@@ -114,7 +113,8 @@ static float vector_norm_avx2(const float *v, size_t dimension) {
 }
 #endif
 
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
+GV_SIMD_TARGET_SSE42
 static float vector_dot_sse(const float *a, const float *b, size_t dimension) {
     __m128 sum_vec = _mm_setzero_ps();
     size_t i = 0;
@@ -137,6 +137,7 @@ static float vector_dot_sse(const float *a, const float *b, size_t dimension) {
     return sum;
 }
 
+GV_SIMD_TARGET_SSE42
 static float vector_norm_sse(const float *v, size_t dimension) {
     __m128 sum_vec = _mm_setzero_ps();
     size_t i = 0;
@@ -176,17 +177,17 @@ static float vector_norm_scalar(const float *v, size_t dimension) {
 }
 
 static float vector_dot(const GV_Vector *a, const GV_Vector *b) {
-#ifdef __AVX512F__
+#ifdef GV_HAVE_AVX512_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_AVX512F) && a->dimension >= 32 && (a->dimension % 16 == 0)) {
         return vector_dot_avx512(a->data, b->data, a->dimension);
     }
 #endif
-#ifdef __AVX2__
+#ifdef GV_HAVE_AVX2_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_AVX2) && cpu_has_feature(GV_CPU_FEATURE_FMA) && a->dimension >= 16 && (a->dimension % 8 == 0)) {
         return vector_dot_avx2(a->data, b->data, a->dimension);
     }
 #endif
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_SSE4_2) && a->dimension >= 8 && (a->dimension % 4 == 0)) {
         return vector_dot_sse(a->data, b->data, a->dimension);
     }
@@ -195,17 +196,17 @@ static float vector_dot(const GV_Vector *a, const GV_Vector *b) {
 }
 
 static float vector_norm(const GV_Vector *v) {
-#ifdef __AVX512F__
+#ifdef GV_HAVE_AVX512_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_AVX512F) && v->dimension >= 32 && (v->dimension % 16 == 0)) {
         return vector_norm_avx512(v->data, v->dimension);
     }
 #endif
-#ifdef __AVX2__
+#ifdef GV_HAVE_AVX2_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_AVX2) && cpu_has_feature(GV_CPU_FEATURE_FMA) && v->dimension >= 16 && (v->dimension % 8 == 0)) {
         return vector_norm_avx2(v->data, v->dimension);
     }
 #endif
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_SSE4_2) && v->dimension >= 8 && (v->dimension % 4 == 0)) {
         return vector_norm_sse(v->data, v->dimension);
     }
@@ -213,7 +214,8 @@ static float vector_norm(const GV_Vector *v) {
     return vector_norm_scalar(v->data, v->dimension);
 }
 
-#ifdef __AVX512F__
+#ifdef GV_HAVE_AVX512_KERNELS
+GV_SIMD_TARGET_AVX512
 static float distance_euclidean_avx512(const float *a, const float *b, size_t dimension) {
     __m512 sum_vec = _mm512_setzero_ps();
     size_t i = 0;
@@ -241,7 +243,8 @@ static float distance_euclidean_avx512(const float *a, const float *b, size_t di
 }
 #endif
 
-#ifdef __AVX2__
+#ifdef GV_HAVE_AVX2_KERNELS
+GV_SIMD_TARGET_AVX2
 static float distance_euclidean_avx2(const float *a, const float *b, size_t dimension) {
     __m256 sum_vec = _mm256_setzero_ps();
     size_t i = 0;
@@ -270,7 +273,8 @@ static float distance_euclidean_avx2(const float *a, const float *b, size_t dime
 }
 #endif
 
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
+GV_SIMD_TARGET_SSE42
 static float distance_euclidean_sse(const float *a, const float *b, size_t dimension) {
     __m128 sum_vec = _mm_setzero_ps();
     size_t i = 0;
@@ -313,17 +317,17 @@ float distance_euclidean(const GV_Vector *a, const GV_Vector *b) {
         return -1.0f;
     }
 
-#ifdef __AVX512F__
+#ifdef GV_HAVE_AVX512_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_AVX512F) && a->dimension >= 16 && (a->dimension % 16 == 0)) {
         return distance_euclidean_avx512(a->data, b->data, a->dimension);
     }
 #endif
-#ifdef __AVX2__
+#ifdef GV_HAVE_AVX2_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_AVX2) && cpu_has_feature(GV_CPU_FEATURE_FMA) && a->dimension >= 8 && (a->dimension % 8 == 0)) {
         return distance_euclidean_avx2(a->data, b->data, a->dimension);
     }
 #endif
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_SSE4_2) && a->dimension >= 4 && (a->dimension % 4 == 0)) {
         return distance_euclidean_sse(a->data, b->data, a->dimension);
     }
@@ -350,7 +354,8 @@ float distance_cosine(const GV_Vector *a, const GV_Vector *b) {
     return 1.0f - (dot_product / (norm_a * norm_b));
 }
 
-#ifdef __AVX2__
+#ifdef GV_HAVE_AVX2_KERNELS
+GV_SIMD_TARGET_AVX2
 static float distance_manhattan_avx2(const float *a, const float *b, size_t dimension) {
     __m256 sum_vec = _mm256_setzero_ps();
     __m256 sign_mask = _mm256_set1_ps(-0.0f);
@@ -381,7 +386,8 @@ static float distance_manhattan_avx2(const float *a, const float *b, size_t dime
 }
 #endif
 
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
+GV_SIMD_TARGET_SSE42
 static float distance_manhattan_sse(const float *a, const float *b, size_t dimension) {
     __m128 sum_vec = _mm_setzero_ps();
     __m128 sign_mask = _mm_set1_ps(-0.0f);
@@ -426,12 +432,12 @@ float distance_manhattan(const GV_Vector *a, const GV_Vector *b) {
         return -1.0f;
     }
 
-#ifdef __AVX2__
-    if (cpu_has_feature(GV_CPU_FEATURE_AVX2)) {
+#ifdef GV_HAVE_AVX2_KERNELS
+    if (cpu_has_feature(GV_CPU_FEATURE_AVX2) && cpu_has_feature(GV_CPU_FEATURE_FMA)) {
         return distance_manhattan_avx2(a->data, b->data, a->dimension);
     }
 #endif
-#ifdef __SSE4_2__
+#ifdef GV_HAVE_SSE42_KERNELS
     if (cpu_has_feature(GV_CPU_FEATURE_SSE4_2)) {
         return distance_manhattan_sse(a->data, b->data, a->dimension);
     }
@@ -77,6 +77,7 @@ static ssize_t getline(char **lineptr, size_t *n, FILE *stream) {
 #include "storage/wal.h"
 #include "storage/mmap.h"
 #include "storage/soa_storage.h"
+#include "storage/scalar_quant.h"
 #include "multimodal/metadata_index.h"
 #include "index/flat.h"
 #include "index/ivfflat.h"
@@ -3320,6 +3321,29 @@ int db_add_vectors(GV_Database *db, const float *data, size_t count, size_t dime
     return 0;
 }
 
+#define GV_DB_SQ8_DECODE_CHUNK 1024
+
+int db_add_vectors_sq8(GV_Database *db, const uint8_t *codes, size_t count, size_t dimension,
+                       const float *vmin, const float *vdelta) {
+    if (db == NULL || codes == NULL || vmin == NULL || vdelta == NULL ||
+        count == 0 || dimension != db->dimension) {
+        return -1;
+    }
+    size_t chunk = count < GV_DB_SQ8_DECODE_CHUNK ? count : GV_DB_SQ8_DECODE_CHUNK;
+    float *scratch = (float *)malloc(chunk * dimension * sizeof(float));
+    if (scratch == NULL) {
+        return -1;
+    }
+    int status = 0;
+    for (size_t start = 0; start < count && status == 0; start += chunk) {
+        size_t n = (count - start < chunk) ? count - start : chunk;
+        scalar_quant_sq8_decode(codes + start * dimension, n, dimension, vmin, vdelta, scratch);
+        status = db_add_vectors(db, scratch, n, dimension);
+    }
+    free(scratch);
+    return status;
+}
+
 int db_add_vectors_with_metadata(GV_Database *db, const float *data,
                                     const char *const *keys, const char *const *values,
                                     size_t count, size_t dimension) {
@@ -3330,7 +3354,9 @@ int db_add_vectors_with_metadata(GV_Database *db, const float *data,
         const float *vec = data + i * dimension;
         const char *k = (keys != NULL) ? keys[i] : NULL;
         const char *v = (values != NULL) ? values[i] : NULL;
-        if (db_add_vector_with_metadata(db, vec, dimension, k, v) != 0) {
+        int rc = (k != NULL && v != NULL) ? db_add_vector_with_metadata(db, vec, dimension, k, v)
+                                          : db_add_vector(db, vec, dimension);
+        if (rc != 0) {
             return -1;
         }
     }
@@ -3658,6 +3684,25 @@ void gv_search_results_free(GV_SearchResult *results, size_t count) {
     }
 }
 
+size_t db_search_results_pack(const GV_SearchResult *results, size_t count, size_t dimension,
+                              uint64_t *out_ids, float *out_distances, float *out_vectors) {
+    if (results == NULL || out_ids == NULL || out_distances == NULL || out_vectors == NULL) {
+        return 0;
+    }
+    size_t packed = 0;
+    for (size_t i = 0; i < count; i++) {
+        const GV_Vector *v = results[i].vector;
+        if (results[i].is_sparse || v == NULL || v->data == NULL || v->dimension != dimension) {
+            continue;
+        }
+        out_ids[packed] = (uint64_t)results[i].id;
+        out_distances[packed] = results[i].distance;
+        memcpy(out_vectors + packed * dimension, v->data, dimension * sizeof(float));
+        packed++;
+    }
+    return packed;
+}
+
 int db_search_filtered(const GV_Database *db, const float *query_data, size_t k,
                           GV_SearchResult *results, GV_DistanceType distance_type,
                           const char *filter_key, const char *filter_value) {
@@ -3984,6 +4029,48 @@ int db_search_sparse(const GV_Database *db, const uint32_t *indices, const float
     return r;
 }
 
+static float *db_sparse_i8_decode(const int8_t *codes, size_t nnz, float scale) {
+    float *values = (float *)malloc((nnz > 0 ? nnz : 1) * sizeof(float));
+    if (values == NULL) {
+        return NULL;
+    }
+    for (size_t i = 0; i < nnz; i++) {
+        values[i] = (float)codes[i] * scale;
+    }
+    return values;
+}
+
+int db_add_sparse_vector_i8(GV_Database *db, const uint32_t *indices, const int8_t *codes,
+                            float scale, size_t nnz, size_t dimension,
+                            const char *metadata_key, const char *metadata_value) {
+    if (codes == NULL && nnz > 0) {
+        return -1;
+    }
+    float *values = db_sparse_i8_decode(codes, nnz, scale);
+    if (values == NULL) {
+        return -1;
+    }
+    int status = db_add_sparse_vector(db, indices, values, nnz, dimension,
+                                      metadata_key, metadata_value);
+    free(values);
+    return status;
+}
+
+int db_search_sparse_i8(const GV_Database *db, const uint32_t *indices, const int8_t *codes,
+                        float scale, size_t nnz, size_t k, GV_SearchResult *results,
+                        GV_DistanceType distance_type) {
+    if (codes == NULL && nnz > 0) {
+        return -1;
+    }
+    float *values = db_sparse_i8_decode(codes, nnz, scale);
+    if (values == NULL) {
+        return -1;
+    }
+    int n = db_search_sparse(db, indices, values, nnz, k, results, distance_type);
+    free(values);
+    return n;
+}
+
 int db_range_search(const GV_Database *db, const float *query_data, float radius,
                        GV_SearchResult *results, size_t max_results, GV_DistanceType distance_type) {
     if (db == NULL || query_data == NULL || results == NULL || max_results == 0 || radius < 0.0f) {
@@ -4911,6 +4998,36 @@ void db_stop_background_compaction(GV_Database *db) {
     pthread_join(db->compaction_thread, NULL);
 }
 
+int db_configure(GV_Database *db, const GV_DBTuning *tuning) {
+    if (db == NULL || tuning == NULL) {
+        return -1;
+    }
+    uint32_t fields = tuning->fields;
+    pthread_mutex_lock(&db->compaction_mutex);
+    if (fields & GV_DB_TUNE_EXACT_SEARCH_THRESHOLD) {
+        db->exact_search_threshold = tuning->exact_search_threshold;
+    }
+    if (fields & GV_DB_TUNE_FORCE_EXACT_SEARCH) {
+        db->force_exact_search = tuning->force_exact_search ? 1 : 0;
+    }
+    if (fields & GV_DB_TUNE_COSINE_NORMALIZED) {
+        db->cosine_normalized = tuning->cosine_normalized ? 1 : 0;
+    }
+    if (fields & GV_DB_TUNE_WAL_COMPACTION_THRESHOLD) {
+        db->wal_compaction_threshold = tuning->wal_compaction_threshold;
+    }
+    if (fields & GV_DB_TUNE_DELETED_RATIO_THRESHOLD) {
+        double ratio = tuning->deleted_ratio_threshold;
+        db->deleted_ratio_threshold = ratio < 0.0 ? 0.0 : (ratio > 1.0 ? 1.0 : ratio);
+    }
+    if (fields & GV_DB_TUNE_COMPACTION_INTERVAL) {
+        db->compaction_interval_sec = tuning->compaction_interval_sec;
+        pthread_cond_signal(&db->compaction_cond); /* Wake up thread to check new interval */
+    }
+    pthread_mutex_unlock(&db->compaction_mutex);
+    return 0;
+}
+
 void db_set_compaction_interval(GV_Database *db, size_t interval_sec) {
     if (db == NULL) {
         return;
@@ -78,6 +78,86 @@ static void memory_layer_free_extracted_entities(GV_GraphEntity *entities, size_
     }
 }
 
+void memory_free_ids(char **memory_ids, size_t count) {
+    if (memory_ids == NULL) {
+        return;
+    }
+    for (size_t i = 0; i < count; i++) {
+        free(memory_ids[i]);
+    }
+    free(memory_ids);
+}
+
+char *memory_ids_pack(char **memory_ids, size_t count, size_t *out_size) {
+    if (out_size != NULL) {
+        *out_size = 0;
+    }
+    if (memory_ids == NULL || out_size == NULL) {
+        memory_free_ids(memory_ids, count);
+        return NULL;
+    }
+
+    size_t total = 0;
+    size_t present = 0;
+    for (size_t i = 0; i < count; i++) {
+        if (memory_ids[i] != NULL) {
+            total += strlen(memory_ids[i]);
+            present++;
+        }
+    }
+    size_t size = present > 0 ? total + present - 1 : 0;
+    char *packed = (char *)malloc(size + 1);
+    if (packed != NULL) {
+        char *cursor = packed;
+        for (size_t i = 0; i < count; i++) {
+            if (memory_ids[i] == NULL) {
+                continue;
+            }
+            size_t len = strlen(memory_ids[i]);
+            memcpy(cursor, memory_ids[i], len);
+            cursor += len;
+            *cursor++ = '\0';
+        }
+        packed[size] = '\0';
+        *out_size = size;
+    }
+    memory_free_ids(memory_ids, count);
+    return packed;
+}
+
+char *memory_results_pack_text(const GV_MemoryResult *results, size_t count, size_t *out_size) {
+    if (out_size != NULL) {
+        *out_size = 0;
+    }
+    if ((results == NULL && count > 0) || out_size == NULL) {
+        return NULL;
+    }
+
+    size_t total = 0;
+    for (size_t i = 0; i < count; i++) {
+        total += (results[i].memory_id ? strlen(results[i].memory_id) : 0) + 1;
+        total += (results[i].content ? strlen(results[i].content) : 0) + 1;
+    }
+    size_t size = total > 0 ? total - 1 : 0;
+    char *packed = (char *)malloc(size + 1);
+    if (packed == NULL) {
+        return NULL;
+    }
+    char *cursor = packed;
+    for (size_t i = 0; i < count; i++) {
+        const char *fields[2] = {results[i].memory_id, results[i].content};
+        for (int f = 0; f < 2; f++) {
+            size_t len = fields[f] ? strlen(fields[f]) : 0;
+            memcpy(cursor, fields[f] ? fields[f] : "", len);
+            cursor += len;
+            *cursor++ = '\0';
+        }
+    }
+    packed[size] = '\0';
+    *out_size = size;
+    return packed;
+}
+
 void memory_layer_free_context_entity_names(char **names, size_t count) {
     if (names == NULL) {
         return;
@@ -719,6 +799,31 @@ GV_MemoryLayerConfig memory_layer_config_default(void) {
     return config;
 }
 
+void memory_layer_config_pack(GV_MemoryLayerConfig *config,
+                              double extraction_threshold,
+                              double consolidation_threshold,
+                              GV_ConsolidationStrategy default_strategy,
+                              int enable_temporal_weighting,
+                              int enable_relationship_retrieval,
+                              size_t max_related_memories,
+                              int use_llm_extraction,
+                              int use_llm_consolidation) {
+    if (config == NULL) {
+        return;
+    }
+    config->extraction_threshold = extraction_threshold;
+    config->consolidation_threshold = consolidation_threshold;
+    config->default_strategy = default_strategy;
+    config->enable_temporal_weighting = enable_temporal_weighting;
+    config->enable_relationship_retrieval = enable_relationship_retrieval;
+    config->max_related_memories = max_related_memories;
+    config->llm_config = NULL;
+    config->use_llm_extraction = use_llm_extraction;
+    config->use_llm_consolidation = use_llm_consolidation;
+    config->context_graph_config = NULL;
+    config->enable_context_graph = 0;
+}
+
 GV_MemoryLayer *memory_layer_create(GV_Database *db, const GV_MemoryLayerConfig *config) {
     if (db == NULL) {
         return NULL;
@@ -893,9 +998,41 @@ char *memory_add_opts(GV_MemoryLayer *layer, const char *content,
     return memory_id;
 }
 
-int memory_search(GV_MemoryLayer *layer, const float *query_embedding,
-                      size_t k, GV_MemoryResult *results,
-                      GV_DistanceType distance_type) {
+char **memory_add_many(GV_MemoryLayer *layer, const char *const *contents, size_t count,
+                       const float *embeddings, GV_MemoryMetadata *const *metadatas,
+                       int ingest_context, size_t *added_count) {
+    if (added_count != NULL) {
+        *added_count = 0;
+    }
+    if (layer == NULL || contents == NULL || count == 0 || embeddings == NULL ||
+        added_count == NULL) {
+        return NULL;
+    }
+
+    char **memory_ids = (char **)malloc(count * sizeof(char *));
+    if (memory_ids == NULL) {
+        return NULL;
+    }
+
+    size_t dimension = layer->db->dimension;
+    size_t added = 0;
+    for (; added < count; added++) {
+        GV_MemoryMetadata *metadata = metadatas != NULL ? metadatas[added] : NULL;
+        memory_ids[added] = memory_add_opts(layer, contents[added], embeddings + added * dimension,
+                                            metadata, NULL, ingest_context);
+        if (memory_ids[added] == NULL) {
+            break;
+        }
+    }
+    *added_count = added;
+    return memory_ids;
+}
+
+/* Shared by memory_search() and memory_search_ids(); the latter skips
+ * parsing metadata it would immediately throw away. */
+static int memory_search_impl(GV_MemoryLayer *layer, const float *query_embedding,
+                              size_t k, GV_MemoryResult *results,
+                              GV_DistanceType distance_type, int with_metadata) {
     if (layer == NULL || query_embedding == NULL || results == NULL) {
         return -1;
     }
@@ -959,10 +1096,12 @@ int memory_search(GV_MemoryLayer *layer, const float *query_embedding,
             }
             contexts[i].semantic_similarity = similarity;
 
-            GV_MemoryMetadata *meta = (GV_MemoryMetadata *)malloc(sizeof(GV_MemoryMetadata));
-            if (meta != NULL) {
-                parse_memory_metadata(vec->metadata, meta);
-                temp_results[i].metadata = meta;
+            if (with_metadata) {
+                GV_MemoryMetadata *meta = (GV_MemoryMetadata *)malloc(sizeof(GV_MemoryMetadata));
+                if (meta != NULL) {
+                    parse_memory_metadata(vec->metadata, meta);
+                    temp_results[i].metadata = meta;
+                }
             }
         }
 
@@ -1026,6 +1165,60 @@ int memory_search(GV_MemoryLayer *layer, const float *query_embedding,
     return count;
 }
 
+int memory_search(GV_MemoryLayer *layer, const float *query_embedding,
+                      size_t k, GV_MemoryResult *results,
+                      GV_DistanceType distance_type) {
+    return memory_search_impl(layer, query_embedding, k, results, distance_type, 1);
+}
+
+char **memory_search_ids(GV_MemoryLayer *layer, const float *query_embedding,
+                         size_t k, float *out_distances,
+                         GV_DistanceType distance_type, size_t *out_count) {
+    if (out_count != NULL) {
+        *out_count = 0;
+    }
+    if (layer == NULL || query_embedding == NULL || out_count == NULL ||
+        (k > 0 && out_distances == NULL)) {
+        return NULL;
+    }
+
+    size_t slots = k > 0 ? k : 1;
+    GV_MemoryResult *results = (GV_MemoryResult *)calloc(slots, sizeof(GV_MemoryResult));
+    char **ids = (char **)calloc(slots, sizeof(char *));
+    if (results == NULL || ids == NULL) {
+        free(results);
+        free(ids);
+        return NULL;
+    }
+
+    int count = memory_search_impl(layer, query_embedding, k, results, distance_type, 0);
+    if (count < 0) {
+        free(results);
+        free(ids);
+        return NULL;
+    }
+
+    int failed = 0;
+    for (int i = 0; i < count; i++) {
+        /* Keep ids aligned with distances even for vectors without an id. */
+        ids[i] = results[i].memory_id != NULL ? results[i].memory_id : gv_dup_cstr("");
+        results[i].memory_id = NULL;
+        out_distances[i] = results[i].distance;
+        memory_result_free(&results[i]);
+        if (ids[i] == NULL) {
+            failed = 1;
+        }
+    }
+    free(results);
+    if (failed) {
+        memory_free_ids(ids, (size_t)count);
+        return NULL;
+    }
+
+    *out_count = (size_t)count;
+    return ids;
+}
+
 int memory_get(GV_MemoryLayer *layer, const char *memory_id,
                    GV_MemoryResult *result) {
     if (layer == NULL || memory_id == NULL || result == NULL) {
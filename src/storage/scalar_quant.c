@@ -262,3 +262,45 @@ void scalar_quant_vector_destroy(GV_ScalarQuantVector *sqv) {
     free(sqv);
 }
 
+int scalar_quant_sq8_encode(const float *data, size_t count, size_t dimension,
+                            uint8_t *codes, float *vmin, float *vdelta) {
+    if (data == NULL || codes == NULL || vmin == NULL || vdelta == NULL ||
+        count == 0 || dimension == 0) {
+        return -1;
+    }
+
+    /* vdelta holds the per-dimension maximum until the steps are computed. */
+    find_min_max_per_dimension(data, count, dimension, vmin, vdelta);
+    for (size_t j = 0; j < dimension; ++j) {
+        vdelta[j] = (vdelta[j] - vmin[j]) / 255.0f;
+    }
+
+    for (size_t i = 0; i < count; ++i) {
+        const float *row = data + i * dimension;
+        uint8_t *out = codes + i * dimension;
+        for (size_t j = 0; j < dimension; ++j) {
+            if (vdelta[j] <= 0.0f) {
+                out[j] = 0;
+                continue;
+            }
+            float q = (row[j] - vmin[j]) / vdelta[j] + 0.5f;
+            out[j] = q >= 255.0f ? 255 : (q <= 0.0f ? 0 : (uint8_t)q);
+        }
+    }
+    return 0;
+}
+
+int scalar_quant_sq8_decode(const uint8_t *codes, size_t count, size_t dimension,
+                            const float *vmin, const float *vdelta, float *out) {
+    if (codes == NULL || vmin == NULL || vdelta == NULL || out == NULL || dimension == 0) {
+        return -1;
+    }
+    for (size_t i = 0; i < count; ++i) {
+        const uint8_t *row = codes + i * dimension;
+        float *dst = out + i * dimension;
+        for (size_t j = 0; j < dimension; ++j) {
+            dst[j] = vmin[j] + (float)row[j] * vdelta[j];
+        }
+    }
+    return 0;
+}
@@ -140,6 +140,7 @@ void test_llm_api_call_openai(void) {
     int result = llm_generate_response(llm, messages, 1, NULL, &response);
 
     if (result == GV_LLM_SUCCESS && response.content != NULL) {
+        assert(response.content_length == strlen(response.content));
         llm_response_free(&response);
     } else {
         const char *error = llm_get_last_error(llm);
@@ -295,6 +296,7 @@ void test_llm_api_call_anthropic(void) {
     int result = llm_generate_response(llm, messages, 1, NULL, &response);
 
     if (result == GV_LLM_SUCCESS && response.content != NULL) {
+        assert(response.content_length == strlen(response.content));
         llm_response_free(&response);
     } else {
         const char *error = llm_get_last_error(llm);
@@ -338,6 +340,7 @@ void test_llm_api_call_gemini(void) {
     int result = llm_generate_response(llm, messages, 1, NULL, &response);
     
     if (result == GV_LLM_SUCCESS && response.content != NULL) {
+        assert(response.content_length == strlen(response.content));
         llm_response_free(&response);
     } else {
         const char *error = llm_get_last_error(llm);
@@ -116,6 +116,35 @@ static int test_metadata_null_handling(void) {
     return 0;
 }
 
+static int test_metadata_flatten(void) {
+    float v_data[3] = {1.0f, 2.0f, 3.0f};
+    GV_Vector *v = vector_create_from_data(3, v_data);
+    ASSERT(v != NULL, "vector creation");
+    ASSERT(vector_set_metadata(v, "a", "1") == 0, "set metadata a");
+    ASSERT(vector_set_metadata(v, "bb", "22") == 0, "set metadata bb");
+
+    size_t written = 0;
+    size_t count = 0;
+    char small[4];
+    ASSERT(metadata_flatten(v->metadata, small, sizeof(small), &written, &count) == 1,
+           "flatten reports short buffer");
+    ASSERT(written == 10, "flatten reports required size");
+    ASSERT(count == 2, "flatten counts entries");
+
+    char buf[16];
+    ASSERT(metadata_flatten(v->metadata, buf, sizeof(buf), &written, NULL) == 0, "flatten");
+    ASSERT(written == 10, "flatten size");
+    ASSERT(memcmp(buf, "a\0" "1\0" "bb\0" "22\0", 10) == 0 ||
+           memcmp(buf, "bb\0" "22\0" "a\0" "1\0", 10) == 0, "flatten contents");
+
+    ASSERT(metadata_flatten(NULL, NULL, 0, &written, &count) == 0, "flatten empty list");
+    ASSERT(written == 0 && count == 0, "empty list size");
+    ASSERT(metadata_flatten(v->metadata, NULL, 4, &written, NULL) < 0, "NULL buffer with capacity");
+
+    vector_destroy(v);
+    return 0;
+}
+
 static int test_metadata_in_database(void) {
     GV_Database *db = db_open(NULL, 2, GV_INDEX_TYPE_KDTREE);
     ASSERT(db != NULL, "db open");
@@ -147,6 +176,7 @@ int main(void) {
     rc |= test_metadata_clear();
     rc |= test_metadata_nonexistent_key();
     rc |= test_metadata_null_handling();
+    rc |= test_metadata_flatten();
     rc |= test_metadata_in_database();
     return rc;
 }
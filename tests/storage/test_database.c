@@ -91,6 +91,56 @@ static int test_db_get_stats(void) {
     return 0;
 }
 
+static int test_db_configure(void) {
+    GV_Database *db = db_open(NULL, 4, GV_INDEX_TYPE_FLAT);
+    ASSERT(db != NULL, "create db for configure test");
+
+    GV_DBTuning tuning;
+    memset(&tuning, 0, sizeof(tuning));
+    tuning.fields = GV_DB_TUNE_EXACT_SEARCH_THRESHOLD | GV_DB_TUNE_COSINE_NORMALIZED |
+                    GV_DB_TUNE_DELETED_RATIO_THRESHOLD;
+    tuning.exact_search_threshold = 42;
+    tuning.cosine_normalized = 1;
+    tuning.deleted_ratio_threshold = 2.0;
+    tuning.compaction_interval_sec = 1;
+    ASSERT(db_configure(db, &tuning) == 0, "configure succeeds");
+    ASSERT(db->exact_search_threshold == 42, "exact search threshold applied");
+    ASSERT(db->cosine_normalized == 1, "cosine normalization applied");
+    ASSERT(db->deleted_ratio_threshold == 1.0, "deleted ratio clamped to 1.0");
+    ASSERT(db->compaction_interval_sec == 300, "unflagged field left unchanged");
+    ASSERT(db_configure(db, NULL) == -1, "NULL tuning rejected");
+
+    db_close(db);
+    return 0;
+}
+
+static int test_db_search_results_pack(void) {
+    float a[2] = {1.0f, 2.0f};
+    float b[3] = {3.0f, 4.0f, 5.0f};
+    float c[2] = {6.0f, 7.0f};
+    GV_Vector va = {2, a, NULL};
+    GV_Vector vb = {3, b, NULL};
+    GV_Vector vc = {2, c, NULL};
+    GV_SearchResult results[4];
+    memset(results, 0, sizeof(results));
+    results[0].vector = &va; results[0].distance = 0.5f; results[0].id = 7;
+    results[1].vector = &vb; results[1].distance = 1.0f; results[1].id = 8;
+    results[2].is_sparse = 1; results[2].id = 9;
+    results[3].vector = &vc; results[3].distance = 1.5f; results[3].id = 10;
+
+    uint64_t ids[4];
+    float dists[4];
+    float vecs[8];
+    size_t packed = db_search_results_pack(results, 4, 2, ids, dists, vecs);
+    ASSERT(packed == 2, "only dense hits of the right dimension are packed");
+    ASSERT(ids[0] == 7 && ids[1] == 10, "ids packed in order");
+    ASSERT(dists[0] == 0.5f && dists[1] == 1.5f, "distances packed in order");
+    ASSERT(vecs[0] == 1.0f && vecs[1] == 2.0f && vecs[2] == 6.0f && vecs[3] == 7.0f,
+           "vectors packed row by row");
+    ASSERT(db_search_results_pack(NULL, 0, 2, ids, dists, vecs) == 0, "NULL results packs nothing");
+    return 0;
+}
+
 typedef int (*test_fn)(void);
 typedef struct { const char *name; test_fn fn; } TestCase;
 
@@ -104,6 +154,8 @@ int main(void) {
         {"db_index_suggest", test_db_index_suggest},
         {"db_cosine_normalized", test_db_cosine_normalized},
         {"db_get_stats", test_db_get_stats},
+        {"db_configure", test_db_configure},
+        {"db_search_results_pack", test_db_search_results_pack},
     };
     int n = sizeof(tests) / sizeof(tests[0]);
     int passed = 0;
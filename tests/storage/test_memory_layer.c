@@ -15,6 +15,22 @@ static int test_memory_layer_config_default(void) {
     return 0;
 }
 
+static int test_memory_layer_config_pack(void) {
+    GV_MemoryLayerConfig config;
+    memset(&config, 0xff, sizeof(config));
+    memory_layer_config_pack(&config, 0.25, 0.75, GV_CONSOLIDATION_LINK, 0, 1, 7, 0, 1);
+    ASSERT(config.extraction_threshold == 0.25, "extraction_threshold packed");
+    ASSERT(config.consolidation_threshold == 0.75, "consolidation_threshold packed");
+    ASSERT(config.default_strategy == GV_CONSOLIDATION_LINK, "default_strategy packed");
+    ASSERT(config.enable_temporal_weighting == 0, "enable_temporal_weighting packed");
+    ASSERT(config.enable_relationship_retrieval == 1, "enable_relationship_retrieval packed");
+    ASSERT(config.max_related_memories == 7, "max_related_memories packed");
+    ASSERT(config.use_llm_extraction == 0 && config.use_llm_consolidation == 1, "llm flags packed");
+    ASSERT(config.llm_config == NULL && config.context_graph_config == NULL, "pointers cleared");
+    ASSERT(config.enable_context_graph == 0, "context graph disabled");
+    return 0;
+}
+
 static int test_memory_layer_create_null_db(void) {
     GV_MemoryLayer *layer = memory_layer_create(NULL, NULL);
     ASSERT(layer == NULL, "create with null db fails");
@@ -31,6 +47,101 @@ static int test_memory_layer_create(void) {
     return 0;
 }
 
+static int test_memory_add_many(void) {
+    GV_Database *db = db_open(NULL, 2, GV_INDEX_TYPE_FLAT);
+    ASSERT(db != NULL, "create db");
+    GV_MemoryLayer *layer = memory_layer_create(db, NULL);
+    ASSERT(layer != NULL, "create memory layer");
+
+    const char *contents[] = {"tea", "coffee"};
+    const float embeddings[] = {1.0f, 0.0f, 0.0f, 1.0f};
+    size_t added = 99;
+    char **ids = memory_add_many(layer, contents, 2, embeddings, NULL, 0, &added);
+    ASSERT(ids != NULL, "add_many returns ids");
+    ASSERT(added == 2, "both memories added");
+    ASSERT(strcmp(ids[0], ids[1]) != 0, "ids are distinct");
+    memory_free_ids(ids, added);
+
+    ASSERT(memory_add_many(layer, contents, 0, embeddings, NULL, 0, &added) == NULL, "empty batch rejected");
+    ASSERT(added == 0, "empty batch adds nothing");
+
+    memory_layer_destroy(layer);
+    db_close(db);
+    return 0;
+}
+
+static int test_memory_search_ids(void) {
+    GV_Database *db = db_open(NULL, 2, GV_INDEX_TYPE_FLAT);
+    ASSERT(db != NULL, "create db");
+    GV_MemoryLayer *layer = memory_layer_create(db, NULL);
+    ASSERT(layer != NULL, "create memory layer");
+
+    const float tea[] = {1.0f, 0.0f};
+    const float coffee[] = {0.0f, 1.0f};
+    char *tea_id = memory_add(layer, "tea", tea, NULL, NULL);
+    char *coffee_id = memory_add(layer, "coffee", coffee, NULL, NULL);
+    ASSERT(tea_id != NULL && coffee_id != NULL, "add memories");
+
+    float dists[4];
+    size_t count = 99;
+    char **ids = memory_search_ids(layer, tea, 4, dists, GV_DISTANCE_COSINE, &count);
+    ASSERT(ids != NULL, "search_ids returns ids");
+    ASSERT(count == 2, "both memories found");
+    ASSERT(strcmp(ids[0], tea_id) == 0, "closest memory first");
+    ASSERT(dists[0] <= dists[1], "distances parallel to ids");
+    memory_free_ids(ids, count);
+
+    ASSERT(memory_search_ids(layer, NULL, 4, dists, GV_DISTANCE_COSINE, &count) == NULL, "NULL query rejected");
+    ASSERT(count == 0, "count cleared on error");
+
+    free(tea_id);
+    free(coffee_id);
+    memory_layer_destroy(layer);
+    db_close(db);
+    return 0;
+}
+
+static int test_memory_ids_pack(void) {
+    char **ids = (char **)malloc(3 * sizeof(char *));
+    ASSERT(ids != NULL, "allocate ids");
+    ids[0] = strdup("mem_1");
+    ids[1] = NULL;
+    ids[2] = strdup("mem_22");
+    size_t size = 0;
+    char *packed = memory_ids_pack(ids, 3, &size);
+    ASSERT(packed != NULL, "pack ids");
+    ASSERT(size == 12, "packed size excludes final NUL");
+    ASSERT(memcmp(packed, "mem_1\0mem_22\0", 13) == 0, "ids joined by NUL");
+    free(packed);
+
+    char **none = (char **)calloc(1, sizeof(char *));
+    ASSERT(none != NULL, "allocate empty ids");
+    packed = memory_ids_pack(none, 1, &size);
+    ASSERT(packed != NULL && size == 0 && packed[0] == '\0', "no ids packs to empty string");
+    free(packed);
+    return 0;
+}
+
+static int test_memory_results_pack_text(void) {
+    GV_MemoryResult results[2];
+    memset(results, 0, sizeof(results));
+    results[0].memory_id = "m1";
+    results[0].content = "tea";
+    results[1].content = "coffee";
+    size_t size = 99;
+    char *packed = memory_results_pack_text(results, 2, &size);
+    ASSERT(packed != NULL, "pack results");
+    ASSERT(size == 14, "packed size excludes final NUL");
+    ASSERT(memcmp(packed, "m1\0tea\0\0coffee\0", 15) == 0, "NULL id packed as empty field");
+    free(packed);
+
+    packed = memory_results_pack_text(NULL, 0, &size);
+    ASSERT(packed != NULL && size == 0, "no results packs to empty string");
+    free(packed);
+    ASSERT(memory_results_pack_text(NULL, 1, &size) == NULL, "NULL results rejected");
+    return 0;
+}
+
 static int test_memory_layer_destroy_null(void) {
     memory_layer_destroy(NULL);
     return 0;
@@ -42,8 +153,13 @@ typedef struct { const char *name; test_fn fn; } TestCase;
 int main(void) {
     TestCase tests[] = {
         {"memory_layer_config_default", test_memory_layer_config_default},
+        {"memory_layer_config_pack", test_memory_layer_config_pack},
         {"memory_layer_create_null_db", test_memory_layer_create_null_db},
         {"memory_layer_create", test_memory_layer_create},
+        {"memory_add_many", test_memory_add_many},
+        {"memory_search_ids", test_memory_search_ids},
+        {"memory_ids_pack", test_memory_ids_pack},
+        {"memory_results_pack_text", test_memory_results_pack_text},
         {"memory_layer_destroy_null", test_memory_layer_destroy_null},
     };
     int n = sizeof(tests) / sizeof(tests[0]);
@@ -151,6 +151,25 @@ static int test_scalar_quant_destroy_null(void) {
     return 0;
 }
 
+static int test_scalar_quant_sq8_batch_roundtrip(void) {
+    float data[2 * DIM];
+    fill_vector(data, DIM, 0.0f);
+    fill_vector(data + DIM, DIM, 1.0f);
+
+    uint8_t codes[2 * DIM];
+    float vmin[DIM];
+    float vdelta[DIM];
+    ASSERT(scalar_quant_sq8_encode(data, 2, DIM, codes, vmin, vdelta) == 0, "sq8 encode failed");
+
+    float decoded[2 * DIM];
+    ASSERT(scalar_quant_sq8_decode(codes, 2, DIM, vmin, vdelta, decoded) == 0, "sq8 decode failed");
+    for (size_t i = 0; i < 2 * DIM; i++) {
+        ASSERT(fabsf(decoded[i] - data[i]) <= vdelta[i % DIM], "sq8 roundtrip error exceeds one step");
+    }
+    ASSERT(scalar_quant_sq8_encode(NULL, 2, DIM, codes, vmin, vdelta) == -1, "sq8 encode rejects NULL");
+    return 0;
+}
+
 typedef int (*test_fn)(void);
 typedef struct { const char *name; test_fn fn; } TestCase;
 
@@ -164,6 +183,7 @@ int main(void) {
         {"Testing scalar quant train...",            test_scalar_quant_train},
         {"Testing scalar quant distance...",         test_scalar_quant_distance},
         {"Testing scalar quant destroy null...",     test_scalar_quant_destroy_null},
+        {"Testing scalar quant sq8 batch roundtrip...", test_scalar_quant_sq8_batch_roundtrip},
     };
     int n = sizeof(tests) / sizeof(tests[0]);
     int passed = 0;
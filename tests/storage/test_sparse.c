@@ -184,6 +184,29 @@ static int test_sparse_persistence(void) {
     return 0;
 }
 
+static int test_sparse_int8_values(void) {
+    GV_Database *db = db_open(NULL, 100, GV_INDEX_TYPE_SPARSE);
+    if (db == NULL) {
+        return 0;
+    }
+
+    uint32_t indices[3] = {0, 10, 50};
+    int8_t codes[3] = {10, 20, -30};
+    ASSERT(db_add_sparse_vector_i8(db, indices, codes, 0.5f, 3, 100, NULL, NULL) == 0,
+           "add int8 sparse vector");
+
+    uint32_t q_indices[1] = {10};
+    int8_t q_codes[1] = {2};
+    GV_SearchResult res[1];
+    int n = db_search_sparse_i8(db, q_indices, q_codes, 0.5f, 1, 1, res, GV_DISTANCE_DOT_PRODUCT);
+    ASSERT(n == 1, "int8 sparse search returned result");
+    ASSERT(res[0].sparse_vector != NULL && res[0].sparse_vector->nnz == 3, "decoded vector stored");
+    ASSERT(fabsf(res[0].sparse_vector->entries[2].value + 15.0f) < 1e-6f, "value decoded with scale");
+
+    db_close(db);
+    return 0;
+}
+
 int main(void) {
     int rc = 0;
     rc |= test_sparse_basic_insert_search();
@@ -192,6 +215,7 @@ int main(void) {
     rc |= test_sparse_large_dataset();
     rc |= test_sparse_empty_query();
     rc |= test_sparse_persistence();
+    rc |= test_sparse_int8_values();
     return rc;
 }
 